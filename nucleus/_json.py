@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:  # Optional accelerator (pip install "nucleus[speedups]"); stdlib json is the fallback.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes or str.
+
+    Accepting bytes lets callers read files with read_bytes()/binary mode and skip the decode-to-str step.
+    Raises ValueError (json.JSONDecodeError) on invalid input with either backend.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON bytes (non-ASCII kept as-is).
+
+    Values orjson refuses (e.g. non-str dict keys, out-of-range ints) fall back to stdlib json, so both backends
+    accept the same inputs.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
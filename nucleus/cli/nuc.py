@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import re
@@ -12,6 +13,7 @@ from typing import Any, Dict, List
 
 import yaml
 
+from nucleus import _json
 from nucleus.bootstrap_tools import build_tool_registry
 from nucleus.contract_store import ContractStore
 from nucleus.core.kernel import Kernel
@@ -19,14 +21,15 @@ from nucleus.core.runtime_context import RuntimeContext
 from nucleus.core.errors import NucleusError, ValidationError
 from nucleus.resources import core_contracts_examples_dir, core_contracts_schemas_dir, plugins_dir
 from nucleus.resources import plugin_contract_schema_path
-from nucleus.registry.plugin_registry import PluginRegistry
+from nucleus.registry.plugin_registry import PluginRegistry, default_plugin_index_path
 from plugins.builtin_desktop.planner import get_planner as get_builtin_desktop_planner
 from nucleus.trace.replay import Replay
+from nucleus.trace.trace_store_jsonl import SINK_PATH as TRACE_SINK_PATH
 from nucleus.cli.memory_stub import build_stub as build_memory_stub
 
 
 def _load_json(path: Path):
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _json.loads(path.read_bytes())
 
 
 _APP_ID_RE = re.compile(r"^[a-z][a-z0-9_-]{1,63}$")
@@ -229,9 +232,14 @@ def _load_dotenv_from_file(path: Path) -> None:
         os.environ[k] = v
 
 
+def _cwd_for_dotenv() -> Path:
+    # Single seam for cwd discovery, so tests can point dotenv loading elsewhere without os.chdir().
+    return Path.cwd()
+
+
 def _maybe_load_dotenv() -> None:
     # Default to current working directory.
-    cwd = Path.cwd()
+    cwd = _cwd_for_dotenv()
     # Common patterns:
     # - `.env` (most tools)
     # - `env` (repo-safe sample can be copied/renamed)
@@ -576,7 +584,7 @@ def _desktop_config_is_valid(config_path: Path) -> tuple[bool, str]:
         return (False, "top_level_not_object")
     try:
         schema_path = plugin_contract_schema_path("builtin.desktop", "desktop_rules.schema.json")
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        schema = _json.loads(schema_path.read_bytes())
         import jsonschema
 
         jsonschema.Draft202012Validator(schema).validate(raw)
@@ -660,6 +668,7 @@ def cmd_check_contracts(_args: argparse.Namespace) -> int:
     print("Contracts OK")
     return 0
 
+
 def cmd_list_tools(args: argparse.Namespace) -> int:
     tools = build_tool_registry()
     tool_defs = tools.list_tools()
@@ -676,8 +685,12 @@ def _default_plugins_dir() -> Path:
 
 
 def _load_plugins(plugins_dir: Path) -> PluginRegistry:
+    # Opt-in: NUCLEUS_PLUGIN_CACHE=1 persists validated manifests across CLI invocations.
+    cache_path = None
+    if str(os.environ.get("NUCLEUS_PLUGIN_CACHE", "")).strip().lower() in ("1", "true", "yes"):
+        cache_path = default_plugin_index_path()
     reg = PluginRegistry()
-    reg.load_from_dir(plugins_dir)
+    reg.load_from_dir(plugins_dir, cache_path=cache_path)
     return reg
 
 
@@ -729,6 +742,13 @@ def _build_intent_from_args(args: argparse.Namespace) -> dict:
     return {"intent_id": intent_id, "params": params, "scope": scope, "context": context}
 
 
+def _preflight_trace_path(trace: str) -> Path:
+    # "-" (trace sink / stderr) stays "-" so the preflight scan does not create a "-.preflight.jsonl" file.
+    if trace == TRACE_SINK_PATH:
+        return Path(trace)
+    return Path(trace).with_suffix(".preflight.jsonl")
+
+
 def _preflight_scan_entries(*, kernel: Kernel, plugins_intent: dict, run_id: str, trace_path: Path) -> List[Dict[str, Any]]:
     """
     Scan target_dir via deterministic tools (fs.list + fs.stat) and return an entries snapshot
@@ -1259,7 +1279,7 @@ def cmd_desktop_configure_ai(args: argparse.Namespace) -> int:
 
         # Validate against plugin schema.
         schema_path = plugin_contract_schema_path("builtin.desktop", "desktop_rules.schema.json")
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        schema = _json.loads(schema_path.read_bytes())
         try:
             import jsonschema
 
@@ -1375,7 +1395,7 @@ def _run_desktop_intent_with_scan(*, intent_id: str, config_path: str, run_id: s
     tools = build_tool_registry()
     kernel = Kernel(tools)
 
-    scan_trace = Path(trace).with_suffix(".preflight.jsonl")
+    scan_trace = _preflight_trace_path(trace)
     # tidy.run / tidy.preview
     intent["params"]["entries"] = _preflight_scan_entries(kernel=kernel, plugins_intent=intent, run_id=f"{run_id}_preflight", trace_path=scan_trace)
 
@@ -1514,9 +1534,8 @@ def cmd_desktop_ai(args: argparse.Namespace) -> int:
 
     plugins_dir = Path(args.plugins_dir) if args.plugins_dir else _default_plugins_dir()
     reg = _load_plugins(plugins_dir)
-    intents = reg.list_intents()
     # Constrain to desktop intents for safety/clarity.
-    intents = [it for it in intents if isinstance(it, dict) and str(it.get("intent_id", "")).startswith("desktop.")]
+    intents = reg.list_intents_under("desktop.")
 
     try:
         from nucleus.intake.provider_loading import load_triage_provider
@@ -1638,7 +1657,7 @@ def cmd_dry_run_intent(args: argparse.Namespace) -> int:
     tools = build_tool_registry()
     kernel = Kernel(tools)
     if args.scan:
-        scan_trace = Path(args.trace).with_suffix(".preflight.jsonl")
+        scan_trace = _preflight_trace_path(args.trace)
         if args.intent == "desktop.restore":
             target_dir = intent.get("params", {}).get("target_dir", "~/Desktop")
             sorted_root = f"{target_dir}/_Sorted"
@@ -1677,7 +1696,7 @@ def cmd_run_intent(args: argparse.Namespace) -> int:
     tools = build_tool_registry()
     kernel = Kernel(tools)
     if args.scan:
-        scan_trace = Path(args.trace).with_suffix(".preflight.jsonl")
+        scan_trace = _preflight_trace_path(args.trace)
         if args.intent == "desktop.restore":
             target_dir = intent.get("params", {}).get("target_dir", "~/Desktop")
             sorted_root = f"{target_dir}/_Sorted"
@@ -1909,9 +1928,14 @@ def cmd_alfred(args: argparse.Namespace) -> int:
     return 0
 
 
-def main(argv=None) -> int:
-    if str(os.environ.get("NUCLEUS_DISABLE_DOTENV", "")).strip().lower() not in ("1", "true", "yes"):
-        _maybe_load_dotenv()
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the `nuc` argument parser.
+
+    Cached: the parser only holds static definitions (defaults are constants; env is read by the commands at
+    dispatch time), so repeated main() calls in one process reuse it.
+    """
     parser = argparse.ArgumentParser(prog="nuc", description="Nucleus CLI (framework)")
     sub = parser.add_subparsers(dest="cmd", required=True)
 
@@ -2085,6 +2109,10 @@ def main(argv=None) -> int:
     p_dai.add_argument("--run-id", default="run_cli", help="Run ID for trace correlation")
     p_dai.set_defaults(func=cmd_desktop_ai)
 
+    return parser
+
+
+def dispatch(parser: argparse.ArgumentParser, argv=None) -> int:
     ns = parser.parse_args(argv)
     try:
         return int(ns.func(ns))
@@ -2093,6 +2121,12 @@ def main(argv=None) -> int:
         return 1
 
 
+def main(argv=None) -> int:
+    if str(os.environ.get("NUCLEUS_DISABLE_DOTENV", "")).strip().lower() not in ("1", "true", "yes"):
+        _maybe_load_dotenv()
+    return dispatch(build_parser(), argv)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -8,6 +8,13 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 import jsonschema
 import yaml
 
+from nucleus import _json
+
+try:  # Prefer the libyaml loader; the pure-Python SafeLoader accepts the same documents.
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
 
 @dataclass(frozen=True)
 class PluginExampleFailure:
@@ -19,12 +26,21 @@ class PluginExampleFailure:
 
 def _read_instance(path: Path) -> Any:
     if path.suffix.lower() in (".yml", ".yaml"):
-        return yaml.safe_load(path.read_text(encoding="utf-8"))
+        return yaml.load(path.read_bytes(), Loader=_YamlSafeLoader)
     if path.suffix.lower() == ".json":
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _json.loads(path.read_bytes())
     raise ValueError(f"Unsupported example extension: {path.name}")
 
 
+@functools.lru_cache(maxsize=32)
+def _schema_validator(schema_path: str, mtime_ns: int) -> jsonschema.Draft202012Validator:
+    # Checked and compiled once per schema file; mtime_ns is part of the key so an edited schema is re-read.
+    _ = mtime_ns
+    schema: Dict[str, Any] = _json.loads(Path(schema_path).read_bytes())
+    jsonschema.Draft202012Validator.check_schema(schema)
+    return jsonschema.Draft202012Validator(schema)
+
+
 def _candidate_example_paths(examples_dir: Path, base: str) -> List[Path]:
     return [
         examples_dir / f"{base}.example.yml",
@@ -78,10 +94,9 @@ def validate_plugin_contract_examples(contracts_plugins_dir: Path) -> List[Plugi
     failures: List[PluginExampleFailure] = []
     for plugin_id, schema_path, example_path in discover_plugin_contract_pairs(contracts_plugins_dir):
         try:
-            schema: Dict[str, Any] = json.loads(schema_path.read_text(encoding="utf-8"))
-            jsonschema.Draft202012Validator.check_schema(schema)
+            validator = _schema_validator(str(schema_path), schema_path.stat().st_mtime_ns)
             instance = _read_instance(example_path)
-            jsonschema.Draft202012Validator(schema).validate(instance)
+            validator.validate(instance)
         except Exception as e:  # noqa: BLE001
             failures.append(
                 PluginExampleFailure(
@@ -9,6 +9,8 @@ import jsonschema
 from referencing import Registry, Resource
 from referencing.jsonschema import DRAFT202012
 
+from nucleus import _json
+
 
 @dataclass(frozen=True)
 class SchemaRef:
@@ -32,6 +34,7 @@ class ContractStore:
         self._schemas: Dict[str, SchemaRef] = {}
         self._store: Dict[str, Dict[str, Any]] = {}
         self._registry: Registry = Registry()
+        self._validators: Dict[str, jsonschema.Draft202012Validator] = {}
 
     @property
     def schemas_dir(self) -> Path:
@@ -44,7 +47,7 @@ class ContractStore:
         registry: Registry = Registry()
 
         for p in sorted(self._schemas_dir.glob("*.json")):
-            schema = json.loads(p.read_text(encoding="utf-8"))
+            schema = _json.loads(p.read_bytes())
             file_uri = p.resolve().as_uri()
             ref = SchemaRef(name=p.name, path=p, file_uri=file_uri, schema=schema)
             self._schemas[p.name] = ref
@@ -66,6 +69,7 @@ class ContractStore:
             raise FileNotFoundError("defs.schema.json is required in contracts/core/schemas/")
 
         self._registry = registry
+        self._validators = {}
 
     def list_schema_names(self) -> List[str]:
         return sorted(self._schemas.keys())
@@ -89,19 +93,34 @@ class ContractStore:
                 errors.append((name, repr(e)))
         return errors
 
+    def get_validator(self, schema_name: str) -> jsonschema.Draft202012Validator:
+        """
+        Returns the compiled validator for a schema (built once per load()).
+        """
+        validator = self._validators.get(schema_name)
+        if validator is None:
+            ref = self._get(schema_name)
+            validator = jsonschema.Draft202012Validator(ref.schema, registry=self._registry)
+            self._validators[schema_name] = validator
+        return validator
+
     def validate(self, schema_name: str, instance: Any) -> List[str]:
         """
         Validates an instance and returns a list of error strings (empty means valid).
         """
-        ref = self._get(schema_name)
-        validator = jsonschema.Draft202012Validator(ref.schema, registry=self._registry)
+        validator = self.get_validator(schema_name)
         return [e.message for e in sorted(validator.iter_errors(instance), key=str)]
 
     def validate_json_file(self, schema_name: str, path: Path) -> List[str]:
         instance = json.loads(path.read_text(encoding="utf-8"))
         return self.validate(schema_name, instance)
 
-    def validate_jsonl_file(self, schema_name: str, path: Path) -> List[str]:
+    def validate_jsonl_file(self, schema_name: str, path: Path, *, early_exit: bool = False) -> List[str]:
+        """
+        Validates each non-blank line; error strings are prefixed with the 1-based line number.
+
+        With early_exit=True, reading stops at the first line that fails (only that line's errors are returned).
+        """
         errors: List[str] = []
         with path.open("r", encoding="utf-8") as f:
             for i, line in enumerate(f, start=1):
@@ -112,9 +131,10 @@ class ContractStore:
                     obj = json.loads(line)
                 except Exception as e:  # noqa: BLE001
                     errors.append("line {}: invalid json: {}".format(i, repr(e)))
-                    continue
-                line_errors = self.validate(schema_name, obj)
-                for msg in line_errors:
-                    errors.append("line {}: {}".format(i, msg))
+                else:
+                    for msg in self.validate(schema_name, obj):
+                        errors.append("line {}: {}".format(i, msg))
+                if early_exit and errors:
+                    break
         return errors
 
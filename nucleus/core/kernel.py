@@ -49,52 +49,55 @@ class Kernel:
         store = TraceStoreJSONL(ctx.trace_path)
         trace = TraceEmitter(store=store, run_id=ctx.run_id)
 
-        intent = plan.get("intent") if isinstance(plan.get("intent"), dict) else {}
-        intent_id = intent.get("intent_id") if isinstance(intent.get("intent_id"), str) else None  # type: Optional[str]
-        plan_id = plan.get("plan_id") if isinstance(plan.get("plan_id"), str) else None
-
-        trace.emit("intent_received", intent_id=intent_id, plan_id=plan_id, message="Intent received", data={"intent": intent})
-
-        # Contract validation (public API): plan must validate before any policy/execution.
-        plan_errors = _core_contracts().validate("plan.schema.json", plan)
-        if plan_errors:
-            trace.emit(
-                "error",
-                intent_id=intent_id,
-                plan_id=plan_id,
-                message="Plan schema validation failed",
-                data={"errors": plan_errors},
-            )
-            from .errors import ValidationError  # local import to avoid cycles
-
-            raise ValidationError(
-                code="plan.schema_invalid",
-                message="Plan does not validate against contracts/core plan.schema.json",
-                data={"errors": plan_errors},
-            )
-
-        policy_engine = PolicyEngine(self._tools)
-        result = policy_engine.evaluate(ctx, plan)
-        trace.emit(
-            "policy_decision",
-            intent_id=intent_id,
-            plan_id=plan_id,
-            policy={"decision": result.decision, "reason_codes": result.reason_codes, "summary": result.summary},
-        )
-        if result.decision != "allow":
+        # The store keeps its file descriptor open for the run; release it when run_plan returns or raises.
+        try:
+            intent = plan.get("intent") if isinstance(plan.get("intent"), dict) else {}
+            intent_id = intent.get("intent_id") if isinstance(intent.get("intent_id"), str) else None  # type: Optional[str]
+            plan_id = plan.get("plan_id") if isinstance(plan.get("plan_id"), str) else None
+
+            trace.emit("intent_received", intent_id=intent_id, plan_id=plan_id, message="Intent received", data={"intent": intent})
+
+            # Contract validation (public API): plan must validate before any policy/execution.
+            plan_errors = _core_contracts().validate("plan.schema.json", plan)
+            if plan_errors:
+                trace.emit(
+                    "error",
+                    intent_id=intent_id,
+                    plan_id=plan_id,
+                    message="Plan schema validation failed",
+                    data={"errors": plan_errors},
+                )
+                from .errors import ValidationError  # local import to avoid cycles
+
+                raise ValidationError(
+                    code="plan.schema_invalid",
+                    message="Plan does not validate against contracts/core plan.schema.json",
+                    data={"errors": plan_errors},
+                )
+
+            policy_engine = PolicyEngine(self._tools)
+            result = policy_engine.evaluate(ctx, plan)
             trace.emit(
-                "step_denied",
+                "policy_decision",
                 intent_id=intent_id,
                 plan_id=plan_id,
-                message=result.summary or "Denied by policy",
                 policy={"decision": result.decision, "reason_codes": result.reason_codes, "summary": result.summary},
             )
-            raise PolicyDenied(
-                code="policy.denied",
-                message=result.summary or "Denied by policy",
-                data={"reasons": result.reason_codes},
-            )
-
-        executor = Executor(self._tools, trace)
-        return executor.execute(ctx, plan)
-
+            if result.decision != "allow":
+                trace.emit(
+                    "step_denied",
+                    intent_id=intent_id,
+                    plan_id=plan_id,
+                    message=result.summary or "Denied by policy",
+                    policy={"decision": result.decision, "reason_codes": result.reason_codes, "summary": result.summary},
+                )
+                raise PolicyDenied(
+                    code="policy.denied",
+                    message=result.summary or "Denied by policy",
+                    data={"reasons": result.reason_codes},
+                )
+
+            executor = Executor(self._tools, trace)
+            return executor.execute(ctx, plan)
+        finally:
+            store.close()
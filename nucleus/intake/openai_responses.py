@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import urllib.error
 import urllib.request
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 from nucleus.core.errors import ValidationError
 
@@ -52,19 +53,21 @@ class OpenAIResponsesClient:
         *,
         config: Optional[OpenAIResponsesConfig] = None,
         http_post: Optional[Callable[..., Dict[str, Any]]] = None,
+        async_http_post: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = None,
     ) -> None:
         self._config = config or OpenAIResponsesConfig()
         self._http_post = http_post or _default_http_post
+        self._async_http_post = async_http_post
 
-    def create_response(
+    def _build_request(
         self,
         *,
         model: str,
         input_text: str,
         response_json_schema: Dict[str, Any],
         system_prompt: str,
-        api_key: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        api_key: Optional[str],
+    ) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
         if not isinstance(model, str) or not model:
             raise ValidationError(code="intake.invalid", message="model must be a non-empty string")
         if not isinstance(input_text, str) or not input_text.strip():
@@ -99,6 +102,48 @@ class OpenAIResponsesClient:
                 }
             },
         }
+        return (url, headers, body)
 
+    def create_response(
+        self,
+        *,
+        model: str,
+        input_text: str,
+        response_json_schema: Dict[str, Any],
+        system_prompt: str,
+        api_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        url, headers, body = self._build_request(
+            model=model,
+            input_text=input_text,
+            response_json_schema=response_json_schema,
+            system_prompt=system_prompt,
+            api_key=api_key,
+        )
         return self._http_post(url, headers=headers, body=body, timeout_s=self._config.timeout_s)
 
+    async def acreate_response(
+        self,
+        *,
+        model: str,
+        input_text: str,
+        response_json_schema: Dict[str, Any],
+        system_prompt: str,
+        api_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async twin of create_response().
+
+        Uses `async_http_post` when provided; otherwise the blocking `http_post` runs in a worker thread so
+        concurrent requests overlap their network waits.
+        """
+        url, headers, body = self._build_request(
+            model=model,
+            input_text=input_text,
+            response_json_schema=response_json_schema,
+            system_prompt=system_prompt,
+            api_key=api_key,
+        )
+        if self._async_http_post is not None:
+            return await self._async_http_post(url, headers=headers, body=body, timeout_s=self._config.timeout_s)
+        return await asyncio.to_thread(self._http_post, url, headers=headers, body=body, timeout_s=self._config.timeout_s)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import inspect
 from dataclasses import dataclass
@@ -17,9 +18,14 @@ class LoadedProvider:
     model: str
 
 
+# Named providers registered in-process (e.g. test doubles); looked up before "module:object" imports.
+_PROVIDER_REGISTRY: Dict[str, Any] = {}
+
+
+@functools.lru_cache(maxsize=32)
 def _import_object(spec: str) -> Any:
     """
-    Import by "module:attr" spec.
+    Import by "module:attr" spec (memoized per spec; failures are not cached).
     """
     if ":" not in spec:
         raise ValidationError(code="intake.provider_invalid", message="provider spec must be 'module:object'")
@@ -66,6 +72,7 @@ def load_triage_provider(
     """
     Thin infra layer:
     - built-in provider IDs (e.g. "openai.responses")
+    - providers registered by name in _PROVIDER_REGISTRY
     - external providers via "module:Class" or "module:factory"
 
     The returned object must satisfy the TriageProvider protocol (have .triage()).
@@ -121,8 +128,10 @@ def load_triage_provider(
         client = GoogleGeminiClient(config=cfg)
         return LoadedProvider(provider=GoogleGeminiTriageProvider(client=client, model=model), provider_id="google.gemini", model=model)
 
-    # Dynamic provider: "module:Class" or "module:factory"
-    obj = _import_object(provider)
+    # Registered provider, else dynamic provider: "module:Class" or "module:factory"
+    obj = _PROVIDER_REGISTRY.get(provider)
+    if obj is None:
+        obj = _import_object(provider)
     kwargs: Dict[str, Any] = {"model": model, "api_base": api_base, "api_key_env": api_key_env}
     try:
         if inspect.isclass(obj):
@@ -133,6 +142,12 @@ def load_triage_provider(
             inst = obj
     except TypeError as e:
         raise ValidationError(code="intake.provider_invalid", message="Provider could not be constructed with given arguments", data={"provider": provider}) from e
+    except ValidationError as e:
+        raise ValidationError(
+            code="intake.provider_invalid",
+            message="Provider rejected its construction arguments",
+            data={"provider": provider, "error": {"code": e.code, "message": e.message}},
+        ) from e
 
     if not hasattr(inst, "triage") or not callable(getattr(inst, "triage")):
         raise ValidationError(code="intake.provider_invalid", message="Provider must have a callable triage() method", data={"provider": provider})
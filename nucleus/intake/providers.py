@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 
 from nucleus.core.errors import ValidationError
 
@@ -34,7 +35,29 @@ class OpenAIResponsesTriageProvider:
             system_prompt=system_prompt,
             api_key=self._api_key,
         )
+        return self._extract_structured_output(resp)
+
+    def triage_batch(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Batched triage: `intent_schema` wraps the per-input schema in `items`; returns that array of raw items.
+        """
+        out = self.triage(input_text=input_text, system_prompt=system_prompt, intent_schema=intent_schema)
+        items = out.get("items")
+        if not isinstance(items, list):
+            raise ValidationError(code="intake.invalid_response", message="OpenAI batch response must contain an items array", data={"keys": list(out.keys())})
+        return items
+
+    async def atriage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]:
+        resp = await self._client.acreate_response(
+            model=self._model,
+            input_text=input_text,
+            response_json_schema=intent_schema,
+            system_prompt=system_prompt,
+            api_key=self._api_key,
+        )
+        return self._extract_structured_output(resp)
 
+    def _extract_structured_output(self, resp: Any) -> Dict[str, Any]:
         # Responses API returns content in `output`. For structured outputs, the JSON object is typically present
         # as a string in a content item; we accept a few common shapes.
         if not isinstance(resp, dict):
@@ -108,6 +131,10 @@ class AnthropicMessagesTriageProvider:
 
         raise ValidationError(code="intake.invalid_response", message="Could not extract intent JSON from Anthropic response", data={"keys": list(resp.keys())})
 
+    async def atriage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]:
+        # The REST client is blocking; run it in a worker thread so concurrent triage calls overlap.
+        return await asyncio.to_thread(self.triage, input_text=input_text, system_prompt=system_prompt, intent_schema=intent_schema)
+
 
 class GoogleGeminiTriageProvider:
     """
@@ -153,3 +180,7 @@ class GoogleGeminiTriageProvider:
 
         raise ValidationError(code="intake.invalid_response", message="Could not extract intent JSON from Gemini response", data={"keys": list(resp.keys())})
 
+    async def atriage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]:
+        # The REST client is blocking; run it in a worker thread so concurrent triage calls overlap.
+        return await asyncio.to_thread(self.triage, input_text=input_text, system_prompt=system_prompt, intent_schema=intent_schema)
+
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List
+import copy
+from typing import Any, Dict
 
+from nucleus import _json
 from nucleus.core.errors import ValidationError
 
 
@@ -23,21 +24,15 @@ class FirstAllowedIntentProvider:
 
     def triage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]:
         _ = (input_text, intent_schema)
-        intent_ids: List[str] = []
-        in_allowed = False
-        for line in system_prompt.splitlines():
-            if line.strip() == "Allowed intents:":
-                in_allowed = True
-                continue
-            if in_allowed:
-                s = line.strip()
-                if not s:
-                    break
-                if s.startswith("- "):
-                    intent_ids.append(s[2:].strip())
-        intent_id = intent_ids[0] if intent_ids else "unknown.intent"
+        # Only the first listed intent is needed: slice it out instead of scanning every prompt line.
+        _, found, rest = system_prompt.partition("Allowed intents:\n")
+        first_line = rest.partition("\n")[0].strip() if found else ""
+        intent_id = first_line[2:].strip() if first_line.startswith("- ") else "unknown.intent"
         return {"intent_id": intent_id, "params": {}, "scope": {"fs_roots": ["."], "allow_network": False}, "context": {}}
 
+    async def atriage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]:
+        return self.triage(input_text=input_text, system_prompt=system_prompt, intent_schema=intent_schema)
+
 
 class ModelAsIntentProvider:
     """
@@ -58,6 +53,9 @@ class ModelAsIntentProvider:
         _ = (input_text, system_prompt, intent_schema)
         return {"intent_id": self._model, "params": {}, "scope": {"fs_roots": ["."], "allow_network": False}, "context": {}}
 
+    async def atriage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]:
+        return self.triage(input_text=input_text, system_prompt=system_prompt, intent_schema=intent_schema)
+
 
 class RaiseValidationErrorProvider:
     """
@@ -79,6 +77,9 @@ class RaiseValidationErrorProvider:
             data={"status": 401, "body": "invalid_api_key"},
         )
 
+    async def atriage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]:
+        return self.triage(input_text=input_text, system_prompt=system_prompt, intent_schema=intent_schema)
+
 
 class ModelAsJsonProvider:
     """
@@ -86,10 +87,20 @@ class ModelAsJsonProvider:
 
     It returns a JSON object parsed from the provided model string.
     Useful for testing non-intent LLM flows (e.g. config generation) without network.
+
+    The model string is parsed once at construction; each triage() call returns a deep copy, since callers
+    may mutate the result.
     """
 
     def __init__(self, model: str = "{}", **_kwargs: Any) -> None:
         self._model = model
+        try:
+            obj = _json.loads(model)
+        except Exception as e:  # noqa: BLE001
+            raise ValidationError(code="intake.invalid_response", message="ModelAsJsonProvider model was not valid JSON", data={"error": str(e)}) from e
+        if not isinstance(obj, dict):
+            raise ValidationError(code="intake.invalid_response", message="ModelAsJsonProvider must decode to a JSON object")
+        self._parsed: Dict[str, Any] = obj
 
     @property
     def model(self) -> str:
@@ -97,11 +108,7 @@ class ModelAsJsonProvider:
 
     def triage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]:
         _ = (input_text, system_prompt, intent_schema)
-        try:
-            obj = json.loads(self._model)
-        except Exception as e:  # noqa: BLE001
-            raise ValidationError(code="intake.invalid_response", message="ModelAsJsonProvider model was not valid JSON", data={"error": repr(e)}) from e
-        if not isinstance(obj, dict):
-            raise ValidationError(code="intake.invalid_response", message="ModelAsJsonProvider must decode to a JSON object")
-        return obj
+        return copy.deepcopy(self._parsed)
 
+    async def atriage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]:
+        return self.triage(input_text=input_text, system_prompt=system_prompt, intent_schema=intent_schema)
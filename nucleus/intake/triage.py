@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
+import hashlib
 import json
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol, Sequence
+from typing import Any, Dict, FrozenSet, List, Optional, Protocol, Sequence, Set, Tuple, Union
 
 from nucleus.contract_store import ContractStore
 from nucleus.core.errors import ValidationError
@@ -21,10 +26,72 @@ class IntakeTriageResult:
     raw_response: Dict[str, Any]
 
 
+class TriageCache:
+    """
+    In-process exact-match cache for triage results.
+
+    Keys are digests of (provider_id, model, system prompt, input text, context); values are validated
+    IntakeTriageResult objects. Hits are returned as deep copies so callers may mutate the intent freely.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize < 1:
+            raise ValidationError(code="intake.invalid", message="cache maxsize must be >= 1")
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, IntakeTriageResult]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[IntakeTriageResult]:
+        res = self._entries.get(key)
+        if res is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(res)
+
+    def put(self, key: str, result: IntakeTriageResult) -> None:
+        self._entries[key] = copy.deepcopy(result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _triage_cache_key(*, provider_id: str, model: str, system_prompt: str, input_text: str, context: Optional[Dict[str, Any]]) -> str:
+    h = hashlib.blake2b(digest_size=32)
+    for part in (provider_id, model, system_prompt, input_text, json.dumps(context, sort_keys=True, ensure_ascii=False, default=str)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
 class TriageProvider(Protocol):
     def triage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]: ...
 
 
+class AsyncTriageProvider(TriageProvider, Protocol):
+    """
+    Optional async twin of TriageProvider.
+
+    Providers without `atriage` still work with atriage_text_to_intent(); their sync `triage` runs in a worker thread.
+    """
+
+    async def atriage(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> Dict[str, Any]: ...
+
+
+class BatchTriageProvider(TriageProvider, Protocol):
+    """
+    Optional batch twin of TriageProvider: returns the `items` array of a batched structured call.
+
+    Providers without `triage_batch` still work with triage_text_to_intent_batch(); `items` is read from `triage()`.
+    """
+
+    def triage_batch(self, *, input_text: str, system_prompt: str, intent_schema: Dict[str, Any]) -> List[Dict[str, Any]]: ...
+
+
 def _intent_json_schema_for_llm() -> Dict[str, Any]:
     # Self-contained JSON Schema (no $ref) suitable for OpenAI structured outputs.
     #
@@ -48,46 +115,25 @@ def _intent_json_schema_for_llm() -> Dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def _core_contracts() -> ContractStore:
     store = ContractStore(core_contracts_schemas_dir())
     store.load()
     return store
 
 
-def triage_text_to_intent(
-    *,
-    input_text: str,
-    intents_catalog: Sequence[Dict[str, str]],
-    scope: Dict[str, Any],
-    context: Optional[Dict[str, Any]] = None,
-    provider: TriageProvider,
-    provider_id: str,
-    model: str,
-    allow_network: bool = False,
-) -> IntakeTriageResult:
-    """
-    Framework-standard intake triage:
-    - accepts natural language input
-    - calls an LLM provider (only if allow_network=True)
-    - returns a contract-valid Intent (no execution; side-effect free)
-    """
-    if not allow_network:
-        raise ValidationError(code="intake.network_denied", message="Network is disabled for intake triage")
-
-    if not isinstance(input_text, str) or not input_text.strip():
-        raise ValidationError(code="intake.invalid", message="input_text must be a non-empty string")
-    if not isinstance(scope, dict):
-        raise ValidationError(code="intake.invalid", message="scope must be an object")
-
-    # Catalog is used to constrain intent selection.
-    intent_ids: List[str] = []
-    for it in intents_catalog:
-        if isinstance(it, dict) and isinstance(it.get("intent_id"), str) and it.get("intent_id"):
-            intent_ids.append(str(it["intent_id"]))
+def _allowed_intent_ids(intents_catalog: Sequence[Dict[str, str]]) -> Tuple[str, ...]:
+    # Catalog is used to constrain intent selection: the ordered ids go into the prompt, frozenset(ids) is the allowlist.
+    intent_ids = sorted(
+        {str(it["intent_id"]) for it in intents_catalog if isinstance(it, dict) and isinstance(it.get("intent_id"), str) and it.get("intent_id")}
+    )
     if not intent_ids:
         raise ValidationError(code="intake.invalid", message="intents_catalog must contain at least one intent_id")
+    return tuple(intent_ids)
 
-    system_prompt = "\n".join(
+
+def _build_system_prompt(*, intent_ids: Sequence[str], scope: Dict[str, Any]) -> str:
+    return "\n".join(
         [
             "You are Nucleus Intake.",
             "Your job is to triage user input into a single JSON object.",
@@ -102,7 +148,7 @@ def triage_text_to_intent(
             '- clarify: string[] (optional; clarifying questions if needed)',
             "",
             "Allowed intents:",
-            *[f"- {iid}" for iid in sorted(set(intent_ids))],
+            *[f"- {iid}" for iid in intent_ids],
             "",
             "Provided scope (must copy exactly):",
             f"{scope}",
@@ -112,9 +158,37 @@ def triage_text_to_intent(
         ]
     )
 
-    schema = _intent_json_schema_for_llm()
-    raw = provider.triage(input_text=input_text, system_prompt=system_prompt, intent_schema=schema)
 
+def _prepare_triage(
+    *,
+    input_text: str,
+    intents_catalog: Sequence[Dict[str, str]],
+    scope: Dict[str, Any],
+    allow_network: bool,
+) -> Tuple[FrozenSet[str], str]:
+    if not allow_network:
+        raise ValidationError(code="intake.network_denied", message="Network is disabled for intake triage")
+
+    if not isinstance(input_text, str) or not input_text.strip():
+        raise ValidationError(code="intake.invalid", message="input_text must be a non-empty string")
+    if not isinstance(scope, dict):
+        raise ValidationError(code="intake.invalid", message="scope must be an object")
+
+    intent_ids = _allowed_intent_ids(intents_catalog)
+    return (frozenset(intent_ids), _build_system_prompt(intent_ids=intent_ids, scope=scope))
+
+
+def _finalize_intent(
+    raw: Any,
+    *,
+    intent_ids: FrozenSet[str],
+    scope: Dict[str, Any],
+    context: Optional[Dict[str, Any]],
+    store: ContractStore,
+) -> Dict[str, Any]:
+    """
+    Normalize one provider output into a contract-valid Intent (allowlist, scope, params, validation).
+    """
     # Extract the JSON object from provider output. Provider may return the intent directly.
     intent = raw.get("intent") if isinstance(raw, dict) else None
     if intent is None and isinstance(raw, dict):
@@ -124,11 +198,11 @@ def triage_text_to_intent(
 
     # Enforce intent_id allowlist
     iid = intent.get("intent_id")
-    if iid not in set(intent_ids):
+    if iid not in intent_ids:
         raise ValidationError(
             code="intake.invalid_intent_id",
             message="Provider returned an unknown intent_id",
-            data={"intent_id": iid, "allowed": sorted(set(intent_ids))},
+            data={"intent_id": iid, "allowed": sorted(intent_ids)},
         )
 
     # Scope/context are adapter-owned; intake must not invent safety boundaries.
@@ -162,11 +236,333 @@ def triage_text_to_intent(
     if "clarify" in intent:
         intent.pop("clarify", None)
 
-    # Validate against core Intent contract.
-    store = _core_contracts()
-    errs = store.validate("intent.schema.json", intent)
+    # Validate against core Intent contract (compiled validator is reused across calls).
+    validator = store.get_validator("intent.schema.json")
+    errs = [e.message for e in sorted(validator.iter_errors(intent), key=str)]
     if errs:
         raise ValidationError(code="intake.intent_invalid", message="Triage intent failed contract validation", data={"errors": errs})
+    return intent
 
-    return IntakeTriageResult(intent=intent, provider=provider_id, model=model, raw_response=raw if isinstance(raw, dict) else {})
 
+def triage_text_to_intent(
+    *,
+    input_text: str,
+    intents_catalog: Sequence[Dict[str, str]],
+    scope: Dict[str, Any],
+    context: Optional[Dict[str, Any]] = None,
+    provider: TriageProvider,
+    provider_id: str,
+    model: str,
+    allow_network: bool = False,
+    cache: Optional[TriageCache] = None,
+) -> IntakeTriageResult:
+    """
+    Framework-standard intake triage:
+    - accepts natural language input
+    - calls an LLM provider (only if allow_network=True)
+    - returns a contract-valid Intent (no execution; side-effect free)
+
+    When `cache` is given, repeated identical requests return the stored validated result without a provider call.
+    """
+    intent_ids, system_prompt = _prepare_triage(input_text=input_text, intents_catalog=intents_catalog, scope=scope, allow_network=allow_network)
+
+    cache_key = None
+    if cache is not None:
+        cache_key = _triage_cache_key(provider_id=provider_id, model=model, system_prompt=system_prompt, input_text=input_text, context=context)
+        hit = cache.get(cache_key)
+        if hit is not None:
+            return hit
+
+    schema = _intent_json_schema_for_llm()
+    raw = provider.triage(input_text=input_text, system_prompt=system_prompt, intent_schema=schema)
+
+    intent = _finalize_intent(raw, intent_ids=intent_ids, scope=scope, context=context, store=_core_contracts())
+    res = IntakeTriageResult(intent=intent, provider=provider_id, model=model, raw_response=raw if isinstance(raw, dict) else {})
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, res)
+    return res
+
+
+async def atriage_text_to_intent(
+    *,
+    input_text: str,
+    intents_catalog: Sequence[Dict[str, str]],
+    scope: Dict[str, Any],
+    context: Optional[Dict[str, Any]] = None,
+    provider: TriageProvider,
+    provider_id: str,
+    model: str,
+    allow_network: bool = False,
+    cache: Optional[TriageCache] = None,
+) -> IntakeTriageResult:
+    """
+    Async variant of triage_text_to_intent().
+
+    Uses `provider.atriage` when available; otherwise the sync `provider.triage` runs in a worker thread.
+    """
+    intent_ids, system_prompt = _prepare_triage(input_text=input_text, intents_catalog=intents_catalog, scope=scope, allow_network=allow_network)
+
+    cache_key = None
+    if cache is not None:
+        cache_key = _triage_cache_key(provider_id=provider_id, model=model, system_prompt=system_prompt, input_text=input_text, context=context)
+        hit = cache.get(cache_key)
+        if hit is not None:
+            return hit
+
+    schema = _intent_json_schema_for_llm()
+    atriage = getattr(provider, "atriage", None)
+    if callable(atriage):
+        raw = await atriage(input_text=input_text, system_prompt=system_prompt, intent_schema=schema)
+    else:
+        raw = await asyncio.to_thread(provider.triage, input_text=input_text, system_prompt=system_prompt, intent_schema=schema)
+
+    intent = _finalize_intent(raw, intent_ids=intent_ids, scope=scope, context=context, store=_core_contracts())
+    res = IntakeTriageResult(intent=intent, provider=provider_id, model=model, raw_response=raw if isinstance(raw, dict) else {})
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, res)
+    return res
+
+
+async def atriage_texts_to_intents(
+    *,
+    inputs: Sequence[str],
+    intents_catalog: Sequence[Dict[str, str]],
+    scope: Dict[str, Any],
+    context: Optional[Dict[str, Any]] = None,
+    provider: TriageProvider,
+    provider_id: str,
+    model: str,
+    allow_network: bool = False,
+) -> List[IntakeTriageResult]:
+    """
+    Fan out one atriage_text_to_intent() call per input concurrently (results keep input order).
+    """
+    return list(
+        await asyncio.gather(
+            *[
+                atriage_text_to_intent(
+                    input_text=t,
+                    intents_catalog=intents_catalog,
+                    scope=scope,
+                    context=context,
+                    provider=provider,
+                    provider_id=provider_id,
+                    model=model,
+                    allow_network=allow_network,
+                )
+                for t in inputs
+            ]
+        )
+    )
+
+
+def _batch_json_schema_for_llm() -> Dict[str, Any]:
+    # Structured outputs require an object at the top level, so the per-input schema is wrapped in `items`.
+    return {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {"items": {"type": "array", "items": _intent_json_schema_for_llm()}},
+        "required": ["items"],
+    }
+
+
+def triage_text_to_intent_batch(
+    *,
+    inputs: Sequence[str],
+    intents_catalog: Sequence[Dict[str, str]],
+    scope: Dict[str, Any],
+    context: Optional[Dict[str, Any]] = None,
+    provider: TriageProvider,
+    provider_id: str,
+    model: str,
+    allow_network: bool = False,
+) -> List[IntakeTriageResult]:
+    """
+    Triage several inputs with a single provider call.
+
+    Inputs are numbered in one prompt and the provider must return `{"items": [...]}` with exactly one
+    intent-shaped object per input, in order. Each item goes through the same allowlist/scope/contract
+    checks as triage_text_to_intent(); the first item that fails raises.
+    """
+    out: List[IntakeTriageResult] = []
+    for res in _triage_batch_items(
+        list(inputs),
+        intents_catalog=intents_catalog,
+        scope=scope,
+        context=context,
+        provider=provider,
+        provider_id=provider_id,
+        model=model,
+        allow_network=allow_network,
+        reject_invalid_inputs=True,
+    ):
+        if isinstance(res, Exception):
+            raise res
+        out.append(res)
+    return out
+
+
+def _triage_batch_items(
+    texts: List[str],
+    *,
+    intents_catalog: Sequence[Dict[str, str]],
+    scope: Dict[str, Any],
+    context: Optional[Dict[str, Any]],
+    provider: TriageProvider,
+    provider_id: str,
+    model: str,
+    allow_network: bool,
+    reject_invalid_inputs: bool = False,
+) -> List[Union[IntakeTriageResult, Exception]]:
+    """
+    Batch triage with per-input outcomes: each slot holds the result or the exception for that input alone.
+
+    Invalid input texts are not sent to the provider (with `reject_invalid_inputs=True` they raise before any
+    call instead). Failures that concern the whole call (network disabled, bad scope, provider error, wrong
+    item count) still raise. Providers with a `triage_batch()` method return the items array themselves;
+    otherwise `items` is taken from the object returned by `triage()`.
+    """
+    if not allow_network:
+        raise ValidationError(code="intake.network_denied", message="Network is disabled for intake triage")
+    if not texts:
+        raise ValidationError(code="intake.invalid", message="inputs must contain at least one input text")
+    if not isinstance(scope, dict):
+        raise ValidationError(code="intake.invalid", message="scope must be an object")
+
+    # Slots for sent inputs are filled from the provider items below.
+    out: List[Any] = [None] * len(texts)
+    sent: List[int] = []
+    for i, t in enumerate(texts):
+        if isinstance(t, str) and t.strip():
+            sent.append(i)
+        elif reject_invalid_inputs:
+            raise ValidationError(code="intake.invalid", message="inputs must be non-empty strings")
+        else:
+            out[i] = ValidationError(code="intake.invalid", message="inputs must be non-empty strings")
+    if not sent:
+        return out
+
+    intent_ids = _allowed_intent_ids(intents_catalog)
+    system_prompt = "\n".join(
+        [
+            _build_system_prompt(intent_ids=intent_ids, scope=scope),
+            "",
+            f"Batch mode: triage each of the {len(sent)} numbered inputs independently.",
+            "Return a JSON object with `items`: an array containing exactly one object of the shape above per input, in input order.",
+        ]
+    )
+    input_text = "\n\n".join(f"[{n}] {texts[i]}" for n, i in enumerate(sent, start=1))
+
+    triage_batch = getattr(provider, "triage_batch", None)
+    if callable(triage_batch):
+        items = triage_batch(input_text=input_text, system_prompt=system_prompt, intent_schema=_batch_json_schema_for_llm())
+    else:
+        raw = provider.triage(input_text=input_text, system_prompt=system_prompt, intent_schema=_batch_json_schema_for_llm())
+        items = raw.get("items") if isinstance(raw, dict) else None
+    if not isinstance(items, list) or len(items) != len(sent):
+        raise ValidationError(
+            code="intake.invalid_response",
+            message="Provider did not return one item per batched input",
+            data={"expected": len(sent), "got": len(items) if isinstance(items, list) else None},
+        )
+
+    store = _core_contracts()
+    allowed = frozenset(intent_ids)
+    for i, item in zip(sent, items):
+        try:
+            intent = _finalize_intent(item, intent_ids=allowed, scope=scope, context=context, store=store)
+        except Exception as e:  # noqa: BLE001
+            out[i] = e
+            continue
+        out[i] = IntakeTriageResult(intent=intent, provider=provider_id, model=model, raw_response=item if isinstance(item, dict) else {})
+    return out
+
+
+class AsyncBatcher:
+    """
+    Micro-batching front for single-input callers.
+
+    `await batcher.triage(text)` buffers inputs for up to `max_wait_s` (or until `max_batch` inputs are queued)
+    and then resolves all of them with one batched provider call. Each caller gets its own result or error; only
+    a failure of the provider call itself is shared by the batch. The provider call runs in the default executor
+    so the event loop is not blocked.
+    """
+
+    def __init__(
+        self,
+        *,
+        intents_catalog: Sequence[Dict[str, str]],
+        scope: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        provider: TriageProvider,
+        provider_id: str,
+        model: str,
+        allow_network: bool = False,
+        max_batch: int = 8,
+        max_wait_s: float = 0.25,
+    ) -> None:
+        if max_batch < 1:
+            raise ValidationError(code="intake.invalid", message="max_batch must be >= 1")
+        self._kwargs: Dict[str, Any] = {
+            "intents_catalog": intents_catalog,
+            "scope": scope,
+            "context": context,
+            "provider": provider,
+            "provider_id": provider_id,
+            "model": model,
+            "allow_network": allow_network,
+        }
+        self._max_batch = max_batch
+        self._max_wait_s = max_wait_s
+        self._pending: List[Tuple[str, "asyncio.Future[IntakeTriageResult]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: Set["asyncio.Task[None]"] = set()
+
+    async def triage(self, input_text: str) -> IntakeTriageResult:
+        loop = asyncio.get_running_loop()
+        fut: "asyncio.Future[IntakeTriageResult]" = loop.create_future()
+        self._pending.append((input_text, fut))
+        if len(self._pending) >= self._max_batch:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait_s, self._flush_pending)
+        return await fut
+
+    async def flush(self) -> None:
+        """
+        Send any buffered inputs now and wait for all in-flight batches to finish.
+        """
+        self._flush_pending()
+        if self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
+
+    def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, "asyncio.Future[IntakeTriageResult]"]]) -> None:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(_triage_batch_items, [t for t, _ in batch], **self._kwargs)
+        try:
+            results = await loop.run_in_executor(None, call)
+        except Exception as e:  # noqa: BLE001
+            # The provider call itself failed: every input in the batch shares that outcome.
+            for _t, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        # Per-input outcomes: one caller's invalid input or rejected item never fails the others.
+        for (_t, fut), res in zip(batch, results):
+            if fut.done():
+                continue
+            if isinstance(res, Exception):
+                fut.set_exception(res)
+            else:
+                fut.set_result(res)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import functools
+import os
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
+import jsonschema
+
+from nucleus import _json
 from nucleus.contract_store import ContractStore
 from nucleus.core.errors import ValidationError
 from nucleus.resources import core_contracts_schemas_dir
@@ -13,27 +18,180 @@ from nucleus.resources import core_contracts_schemas_dir
 @dataclass(frozen=True)
 class PluginManifest:
     raw: Dict[str, Any]
+    # Derived from `raw` once at construction (the dataclass is frozen, so `raw` is not expected to change).
+    plugin_id: str = field(init=False, repr=False, compare=False)
+    intents: List[Dict[str, Any]] = field(init=False, repr=False, compare=False)
+    intent_ids: FrozenSet[str] = field(init=False, repr=False, compare=False)
 
-    @property
-    def plugin_id(self) -> str:
-        return str(self.raw.get("plugin_id"))
-
-    @property
-    def intents(self) -> List[Dict[str, Any]]:
+    def __post_init__(self) -> None:
         v = self.raw.get("intents")
-        return v if isinstance(v, list) else []
+        intents = v if isinstance(v, list) else []
+        object.__setattr__(self, "plugin_id", str(self.raw.get("plugin_id")))
+        object.__setattr__(self, "intents", intents)
+        object.__setattr__(
+            self,
+            "intent_ids",
+            frozenset(it["intent_id"] for it in intents if isinstance(it, dict) and isinstance(it.get("intent_id"), str)),
+        )
 
     def declares_intent(self, intent_id: str) -> bool:
-        for it in self.intents:
-            if isinstance(it, dict) and it.get("intent_id") == intent_id:
-                return True
-        return False
+        return intent_id in self.intent_ids
+
+
+_PLUGIN_MANIFEST_SCHEMA = "plugin_manifest.schema.json"
 
 
-def _core_contracts() -> ContractStore:
-    store = ContractStore(core_contracts_schemas_dir())
+@functools.lru_cache(maxsize=1)
+def _compiled_plugin_manifest_validator(schemas_dir: str, fingerprint: Tuple[Tuple[str, int], ...]) -> jsonschema.Draft202012Validator:
+    # Built through a ContractStore so $refs to sibling schemas (defs.schema.json, ...) resolve. The fingerprint
+    # (name, mtime_ns) of every schema file is part of the cache key so an edited contract is re-read.
+    _ = fingerprint
+    store = ContractStore(Path(schemas_dir))
     store.load()
-    return store
+    validator = store.get_validator(_PLUGIN_MANIFEST_SCHEMA)
+    jsonschema.Draft202012Validator.check_schema(validator.schema)
+    return validator
+
+
+def _schemas_fingerprint(schemas_dir: Path) -> Tuple[Tuple[str, int], ...]:
+    with os.scandir(schemas_dir) as it:
+        return tuple(sorted((e.name, e.stat().st_mtime_ns) for e in it if e.name.endswith(".json")))
+
+
+def _plugin_manifest_validator() -> jsonschema.Draft202012Validator:
+    schemas_dir = core_contracts_schemas_dir()
+    return _compiled_plugin_manifest_validator(str(schemas_dir), _schemas_fingerprint(schemas_dir))
+
+
+_DISCOVERY_CACHE_VERSION = 1
+# Most recently written plugins dirs kept in the discovery cache; older entries are evicted on write.
+_DISCOVERY_CACHE_MAX_ENTRIES = 16
+
+
+def default_plugin_index_path() -> Path:
+    """
+    Default location of the persisted plugin discovery cache.
+
+    - If XDG_CACHE_HOME is set, use it.
+    - Else use ~/.cache
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if isinstance(base, str) and base.strip():
+        return Path(base).expanduser() / "nucleus" / "plugin_index.json"
+    return Path("~/.cache").expanduser() / "nucleus" / "plugin_index.json"
+
+
+def _iter_manifest_paths(plugins_dir: Path) -> List[Path]:
+    """
+    `<plugins_dir>/*/manifest.json`, ordered by plugin directory name (same result as a sorted glob).
+    """
+    found: List[Tuple[str, str]] = []
+    with os.scandir(plugins_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            mp = os.path.join(entry.path, "manifest.json")
+            if os.path.isfile(mp):
+                found.append((entry.name, mp))
+    found.sort()
+    return [Path(mp) for _name, mp in found]
+
+
+def _discovery_fingerprint(plugins_dir: Path, manifest_paths: List[Path]) -> List[Any]:
+    # Manifests are validated against the core schema, so schema edits must invalidate cached results too.
+    schema_st = (core_contracts_schemas_dir() / _PLUGIN_MANIFEST_SCHEMA).stat()
+    out: List[Any] = [["<schema>", schema_st.st_mtime_ns, schema_st.st_size]]
+    for p in manifest_paths:
+        st = p.stat()
+        out.append([p.relative_to(plugins_dir).as_posix(), st.st_mtime_ns, st.st_size])
+    return out
+
+
+def _read_discovery_cache(cache_path: Path, plugins_dir: Path, fingerprint: List[Any]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Best-effort: returns cached manifests when the fingerprint matches, else None (missing/corrupt cache is a miss).
+    """
+    try:
+        doc = _json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(doc, dict) or doc.get("version") != _DISCOVERY_CACHE_VERSION:
+        return None
+    entries = doc.get("entries")
+    entry = entries.get(str(plugins_dir.resolve())) if isinstance(entries, dict) else None
+    if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+        return None
+    manifests = entry.get("manifests")
+    if not isinstance(manifests, list) or not all(isinstance(m, dict) for m in manifests):
+        return None
+    return manifests
+
+
+def _write_discovery_cache(cache_path: Path, plugins_dir: Path, fingerprint: List[Any], manifests: List[Dict[str, Any]]) -> None:
+    """
+    Best-effort atomic write (temp file + rename); failures never break plugin loading.
+
+    Entries for plugins dirs that no longer exist are dropped, and only the most recently written
+    _DISCOVERY_CACHE_MAX_ENTRIES are kept, so the file stays bounded.
+    """
+    try:
+        doc = _json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        doc = None
+    if not isinstance(doc, dict) or doc.get("version") != _DISCOVERY_CACHE_VERSION or not isinstance(doc.get("entries"), dict):
+        doc = {"version": _DISCOVERY_CACHE_VERSION, "entries": {}}
+    key = str(plugins_dir.resolve())
+    # Oldest first (insertion order); the current dir is re-added last.
+    kept = [(k, v) for k, v in doc["entries"].items() if k != key and os.path.isdir(k)]
+    doc["entries"] = dict(kept[max(0, len(kept) - (_DISCOVERY_CACHE_MAX_ENTRIES - 1)) :])
+    doc["entries"][key] = {"fingerprint": fingerprint, "manifests": manifests}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".plugin_index.", suffix=".tmp", dir=str(cache_path.parent))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json.dumps(doc))
+            os.replace(tmp, cache_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        return
+
+
+class _IntentTrie:
+    """
+    Dotted intent ids (`desktop.tidy.run`) stored one segment per level, for namespace queries.
+    """
+
+    def __init__(self) -> None:
+        self._children: Dict[str, _IntentTrie] = {}
+        self._entry: Optional[Tuple[str, str]] = None  # (intent_id, plugin_id) when an intent ends here
+
+    def insert(self, parts: List[str], intent_id: str, plugin_id: str) -> None:
+        node = self
+        for part in parts:
+            node = node._children.setdefault(part, _IntentTrie())
+        node._entry = (intent_id, plugin_id)
+
+    def find(self, parts: List[str]) -> Optional[_IntentTrie]:
+        node: Optional[_IntentTrie] = self
+        for part in parts:
+            node = node._children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def iter_prefix(self, parts: List[str]) -> Iterator[Tuple[str, str]]:
+        node = self.find(parts)
+        if node is None:
+            return
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if n._entry is not None:
+                yield n._entry
+            stack.extend(n._children.values())
 
 
 class PluginRegistry:
@@ -46,17 +204,52 @@ class PluginRegistry:
     def __init__(self) -> None:
         self._manifests_by_plugin_id: Dict[str, PluginManifest] = {}
         self._plugin_id_by_intent_id: Dict[str, str] = {}
+        self._intent_trie = _IntentTrie()
+        # Sorted key snapshots for the list_* methods; reset whenever _register() mutates the maps.
+        self._sorted_plugin_ids: Optional[Tuple[str, ...]] = None
+        self._sorted_intent_ids: Optional[Tuple[str, ...]] = None
 
-    def load_from_dir(self, plugins_dir: Path) -> None:
+    @staticmethod
+    def reset_schema_cache() -> None:
+        """
+        Drop the compiled manifest validator (e.g. between tests that edit schemas).
+        """
+        _compiled_plugin_manifest_validator.cache_clear()
+
+    def load_from_dir(self, plugins_dir: Path, *, cache_path: Optional[Path] = None, force: bool = False) -> None:
+        """
+        Discover, validate and register `<plugins_dir>/*/manifest.json`.
+
+        When `cache_path` is given, validated manifests are persisted there keyed by the plugins directory and a
+        fingerprint of (relative path, mtime_ns, size) for every manifest plus the manifest schema. A matching
+        fingerprint skips reading and validating manifests. `force=True` ignores the cache and re-discovers.
+        """
         if not plugins_dir.exists():
             raise FileNotFoundError(str(plugins_dir))
 
-        store = _core_contracts()
+        manifest_paths = _iter_manifest_paths(plugins_dir)
+        fingerprint: Optional[List[Any]] = None
+        if cache_path is not None:
+            fingerprint = _discovery_fingerprint(plugins_dir, manifest_paths)
+            if not force:
+                cached = _read_discovery_cache(cache_path, plugins_dir, fingerprint)
+                if cached is not None:
+                    self._register([PluginManifest(raw=raw) for raw in cached])
+                    return
+
+        validator = _plugin_manifest_validator()
 
         manifests: List[PluginManifest] = []
-        for manifest_path in sorted(plugins_dir.glob("*/manifest.json")):
-            raw = json.loads(manifest_path.read_text(encoding="utf-8"))
-            errors = store.validate("plugin_manifest.schema.json", raw)
+        for manifest_path in manifest_paths:
+            raw = _json.loads(manifest_path.read_bytes())
+            # Cheap shape guard (a subset of the schema) so obviously malformed files skip the full validator.
+            if not isinstance(raw, dict) or not isinstance(raw.get("plugin_id"), str) or not isinstance(raw.get("intents"), list):
+                raise ValidationError(
+                    code="plugin_manifest.invalid",
+                    message="Plugin manifest validation failed: {}".format(manifest_path),
+                    data={"errors": ["manifest must be an object with string plugin_id and array intents"]},
+                )
+            errors = [e.message for e in sorted(validator.iter_errors(raw), key=str)]
             if errors:
                 raise ValidationError(
                     code="plugin_manifest.invalid",
@@ -65,6 +258,14 @@ class PluginRegistry:
                 )
             manifests.append(PluginManifest(raw=raw))
 
+        self._register(manifests)
+
+        if cache_path is not None and fingerprint is not None:
+            _write_discovery_cache(cache_path, plugins_dir, fingerprint, [m.raw for m in manifests])
+
+    def _register(self, manifests: List[PluginManifest]) -> None:
+        self._sorted_plugin_ids = None
+        self._sorted_intent_ids = None
         for m in manifests:
             plugin_id = m.plugin_id
             if not plugin_id:
@@ -73,8 +274,7 @@ class PluginRegistry:
                 raise ValidationError(code="plugin_manifest.duplicate", message=f"Duplicate plugin_id: {plugin_id}")
             self._manifests_by_plugin_id[plugin_id] = m
 
-        # Build intent index (deny duplicates).
-        for m in manifests:
+            # Build intent index in the same pass (deny duplicates).
             for it in m.intents:
                 if not isinstance(it, dict):
                     continue
@@ -87,17 +287,42 @@ class PluginRegistry:
                         message="Duplicate intent_id across plugins: {}".format(intent_id),
                         data={"intent_id": intent_id},
                     )
-                self._plugin_id_by_intent_id[intent_id] = m.plugin_id
+                self._plugin_id_by_intent_id[intent_id] = plugin_id
+                self._intent_trie.insert(intent_id.split("."), intent_id, plugin_id)
 
     def list_manifests(self) -> List[Dict[str, Any]]:
-        return [self._manifests_by_plugin_id[k].raw for k in sorted(self._manifests_by_plugin_id.keys())]
+        if self._sorted_plugin_ids is None:
+            self._sorted_plugin_ids = tuple(sorted(self._manifests_by_plugin_id))
+        return [self._manifests_by_plugin_id[k].raw for k in self._sorted_plugin_ids]
 
     def list_intents(self) -> List[Dict[str, str]]:
+        if self._sorted_intent_ids is None:
+            self._sorted_intent_ids = tuple(sorted(self._plugin_id_by_intent_id))
         out: List[Dict[str, str]] = []
-        for intent_id in sorted(self._plugin_id_by_intent_id.keys()):
+        for intent_id in self._sorted_intent_ids:
             out.append({"intent_id": intent_id, "plugin_id": self._plugin_id_by_intent_id[intent_id]})
         return out
 
+    def list_intents_under(self, prefix: str) -> List[Dict[str, str]]:
+        """
+        Intents in a dotted namespace, matched by whole segments (sorted like list_intents()).
+
+        - "desktop" includes "desktop" itself and everything below it.
+        - "desktop." includes only intents below "desktop" (same as str.startswith("desktop.")).
+        - "" lists every intent.
+        """
+        parts = prefix.split(".") if prefix else []
+        strict = len(parts) > 1 and parts[-1] == ""
+        if strict:
+            parts = parts[:-1]
+        out = [
+            {"intent_id": intent_id, "plugin_id": plugin_id}
+            for intent_id, plugin_id in self._intent_trie.iter_prefix(parts)
+            if not (strict and intent_id == prefix[:-1])
+        ]
+        out.sort(key=lambda it: it["intent_id"])
+        return out
+
     def resolve_plugin_id_for_intent(self, intent_id: str) -> Optional[str]:
         return self._plugin_id_by_intent_id.get(intent_id)
 
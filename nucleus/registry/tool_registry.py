@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 ToolFunc = Callable[[Dict[str, Any], bool], Dict[str, Any]]
@@ -12,23 +12,27 @@ class ToolRegistry:
     """
 
     def __init__(self) -> None:
-        self._defs: Dict[str, Dict[str, Any]] = {}
-        self._impls: Dict[str, ToolFunc] = {}
+        # tool_id -> (tool_def, impl); one dict probe serves both get() and call().
+        self._tools: Dict[str, Tuple[Dict[str, Any], ToolFunc]] = {}
+        # Sorted tool ids for list_tools(); rebuilt lazily after registration.
+        self._sorted_ids: Optional[Tuple[str, ...]] = None
 
     def register(self, tool_def: Dict[str, Any], impl: ToolFunc) -> None:
         tool_id = tool_def["tool_id"]
-        self._defs[tool_id] = tool_def
-        self._impls[tool_id] = impl
+        self._tools[tool_id] = (tool_def, impl)
+        self._sorted_ids = None
 
     def get(self, tool_id: str) -> Optional[Dict[str, Any]]:
-        return self._defs.get(tool_id)
+        entry = self._tools.get(tool_id)
+        return entry[0] if entry is not None else None
 
     def call(self, tool_id: str, args: Dict[str, Any], *, dry_run: bool) -> Dict[str, Any]:
-        impl = self._impls.get(tool_id)
-        if impl is None:
+        entry = self._tools.get(tool_id)
+        if entry is None:
             raise KeyError(tool_id)
-        return impl(args, dry_run)
+        return entry[1](args, dry_run)
 
     def list_tools(self) -> List[Dict[str, Any]]:
-        return [self._defs[k] for k in sorted(self._defs.keys())]
-
+        if self._sorted_ids is None:
+            self._sorted_ids = tuple(sorted(self._tools))
+        return [self._tools[k][0] for k in self._sorted_ids]
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=None)
 def _package_dir(package_name: str) -> Path:
     """
     Return the on-disk directory for an imported package.
 
+    Cached: package locations do not change within a process (results are immutable Path objects).
+
     Note:
     This assumes the package is installed in a filesystem-backed environment
     (typical for pip/wheel installs and editable installs). If a zipimport-style
@@ -19,6 +23,7 @@ def _package_dir(package_name: str) -> Path:
     return Path(p).resolve().parent
 
 
+@functools.lru_cache(maxsize=None)
 def plugins_dir() -> Path:
     """
     Directory that contains built-in plugin packages (e.g. plugins/builtin_desktop).
@@ -26,6 +31,7 @@ def plugins_dir() -> Path:
     return _package_dir("plugins")
 
 
+@functools.lru_cache(maxsize=None)
 def contracts_dir() -> Path:
     """
     Directory that contains shipped contract artifacts (JSON Schemas, examples).
@@ -33,20 +39,26 @@ def contracts_dir() -> Path:
     return _package_dir("contracts")
 
 
+@functools.lru_cache(maxsize=None)
 def core_contracts_schemas_dir() -> Path:
     return contracts_dir() / "core" / "schemas"
 
 
+@functools.lru_cache(maxsize=None)
 def core_contracts_examples_dir() -> Path:
     return contracts_dir() / "core" / "examples"
 
 
+@functools.lru_cache(maxsize=256)
 def plugin_contract_schema_path(plugin_id: str, schema_filename: str) -> Path:
     """
     Resolve a plugin contract schema path under contracts/plugins/.
 
     Example:
       plugin_contract_schema_path("builtin.desktop", "desktop_rules.schema.json")
+
+    Memoized per (plugin_id, schema_filename), bounded since both are caller-supplied; use
+    plugin_contract_schema_path.cache_clear() to reset.
     """
     # On disk the directory is currently named like "builtin.desktop"
     return contracts_dir() / "plugins" / plugin_id / "schemas" / schema_filename
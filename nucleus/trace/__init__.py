@@ -1,6 +1,6 @@
 from .trace_emitter import TraceEmitter
-from .trace_store_jsonl import TraceStoreJSONL
+from .trace_store_jsonl import TraceStoreJSONL, set_sink
 from .replay import Replay
 
-__all__ = ["TraceEmitter", "TraceStoreJSONL", "Replay"]
+__all__ = ["TraceEmitter", "TraceStoreJSONL", "Replay", "set_sink"]
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterator
+
+from nucleus import _json
 
 
 class Replay:
@@ -13,13 +14,14 @@ class Replay:
     def __init__(self, path: Path):
         self._path = path
 
-    def iter_events(self) -> Iterable[Dict[str, Any]]:
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        # Always a generator: a missing file yields nothing.
         if not self._path.exists():
-            return []
-        with self._path.open("r", encoding="utf-8") as f:
+            return
+        # Binary mode: the JSON parser takes bytes directly (no per-line decode to str) and accepts the
+        # trailing newline, so lines are not stripped; blank lines are skipped without copying.
+        with self._path.open("rb") as f:
             for line in f:
-                line = line.strip()
-                if not line:
+                if line.isspace():
                     continue
-                yield json.loads(line)
-
+                yield _json.loads(line)
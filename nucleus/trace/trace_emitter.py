@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import functools
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from .trace_store_jsonl import TraceStoreJSONL
 
 
+@functools.lru_cache(maxsize=1)
+def _fmt_utc_seconds(sec: int) -> str:
+    # Events arrive in bursts within the same second, so a one-entry cache avoids most datetime formatting.
+    return datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _utc_now_rfc3339() -> str:
+    # Microsecond precision (matches the previous isoformat() output and datetime.fromisoformat() on 3.10).
+    us = time.time_ns() // 1_000
+    return f"{_fmt_utc_seconds(us // 1_000_000)}.{us % 1_000_000:06d}Z"
+
+
 class TraceEmitter:
     def __init__(self, store: TraceStoreJSONL, run_id: str):
         self._store = store
@@ -23,7 +37,7 @@ class TraceEmitter:
         data: Optional[Dict[str, Any]] = None,
     ) -> None:
         event: Dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "ts": _utc_now_rfc3339(),
             "run_id": self._run_id,
             "event_type": event_type,
         }
@@ -41,4 +55,3 @@ class TraceEmitter:
             event["data"] = data
 
         self._store.append(event)
-
@@ -1,20 +1,95 @@
 from __future__ import annotations
 
-import json
+import atexit
+import os
+import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
+
+from nucleus import _json
+
+# Appends up to this size are issued as one unlocked os.write(); larger ones serialize on a lock.
+_ATOMIC_APPEND_MAX = 4096
+
+# Trace path that writes no file: events go to the sink installed with set_sink(), else to stderr as JSONL.
+SINK_PATH = "-"
+
+_sink: Optional[Callable[[Dict[str, Any]], None]] = None
+
+
+def set_sink(sink: Optional[Callable[[Dict[str, Any]], None]]) -> None:
+    """
+    Route events of stores opened on SINK_PATH ("-") to `sink` (e.g. `events.append`); None restores stderr.
+    """
+    global _sink
+    _sink = sink
 
 
 class TraceStoreJSONL:
+    """
+    Append-only JSONL trace file.
+
+    The file is opened lazily on the first append as a raw O_APPEND descriptor and kept open. Each event is a
+    single os.write() of one complete line, so concurrent emitters (threads or processes sharing the file)
+    interleave at line granularity without a userspace buffer; lines larger than 4 KiB take a lock and are
+    written in full. Data is in the kernel once append() returns. Open stores are closed at interpreter exit.
+
+    A store on the path "-" never touches the filesystem: events go to the sink installed with set_sink(), or are
+    written to stderr as JSONL when none is set (stdout stays free for command output).
+    """
+
     def __init__(self, path: Path):
         self._path = path
+        self._fd: Optional[int] = None
+        self._lock = threading.Lock()
 
     @property
     def path(self) -> Path:
         return self._path
 
+    def _open(self) -> int:
+        with self._lock:
+            if self._fd is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+                self._fd = os.open(str(self._path), flags, 0o644)
+                atexit.register(self.close)
+            return self._fd
+
     def append(self, event: Dict[str, Any]) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with self._path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        if str(self._path) == SINK_PATH:
+            if _sink is not None:
+                _sink(event)
+            else:
+                sys.stderr.write(_json.dumps(event).decode("utf-8") + "\n")
+                sys.stderr.flush()
+            return
+        line = _json.dumps(event) + b"\n"
+        fd = self._fd if self._fd is not None else self._open()
+        if len(line) <= _ATOMIC_APPEND_MAX:
+            written = os.write(fd, line)
+            if written == len(line):
+                return
+            line = line[written:]
+        with self._lock:
+            view = memoryview(line)
+            while view:
+                view = view[os.write(fd, view) :]
+
+    def flush(self) -> None:
+        # Writes are unbuffered; kept so callers can treat the store like a file.
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            fd, self._fd = self._fd, None
+        if fd is not None:
+            atexit.unregister(self.close)
+            os.close(fd)
+
+    def __enter__(self) -> "TraceStoreJSONL":
+        return self
 
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
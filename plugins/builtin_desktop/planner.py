@@ -1,20 +1,210 @@
 from __future__ import annotations
 
+import copy
 import fnmatch
-import json
+import functools
 import os
 import re
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 import jsonschema
 import yaml
 
+from nucleus import _json
 from nucleus.core.errors import ValidationError
 from nucleus.core.planner import Planner
 from nucleus.resources import plugin_contract_schema_path
 
+try:  # libyaml-backed loader when PyYAML was built with it; same safe subset as yaml.safe_load.
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
+
+# Extension -> approximate MIME prefix for `mime_prefix` match atoms (one dict probe per entry).
+_MIME_PREFIX_BY_EXT: Dict[str, str] = {
+    ext: prefix
+    for prefix, exts in (
+        ("image/", ("png", "jpg", "jpeg", "gif", "webp", "heic", "svg")),
+        ("video/", ("mp4", "mov", "mkv", "webm")),
+        ("audio/", ("mp3", "wav", "flac", "m4a")),
+        ("application/", ("pdf", "txt", "md", "rtf", "doc", "docx", "ppt", "pptx", "xls", "xlsx", "csv")),
+    )
+    for ext in exts
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_globs(patterns: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """
+    Compile glob patterns into one case-sensitive regex (same semantics as fnmatch.fnmatchcase), or None if empty.
+
+    Memoized on the pattern tuple, so repeated plans with the same exclude/ignore lists reuse the compiled regex.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+def _file_ext(name: str) -> str:
+    # Lowercased text after the last "." ("" when there is none or the name ends with ".").
+    _head, sep, ext = name.rpartition(".")
+    return ext.lower() if sep else ""
+
+
+# Atom predicates take (entry, name, ext): name and lowercased extension are extracted once per entry.
+_AtomMatcher = Callable[[Dict[str, Any], str, str], bool]
+
+
+def _never(entry: Dict[str, Any], name: str, ext: str) -> bool:
+    return False
+
+
+def _match_regex(search: Callable[[str], Any]) -> _AtomMatcher:
+    return lambda entry, name, ext: search(name) is not None
+
+
+def _match_ext(wanted: FrozenSet[str]) -> _AtomMatcher:
+    return lambda entry, name, ext: ext in wanted
+
+
+def _match_mime(want: str) -> _AtomMatcher:
+    return lambda entry, name, ext: _MIME_PREFIX_BY_EXT.get(ext, "").startswith(want)
+
+
+def _match_age(max_age: int, now: int) -> _AtomMatcher:
+    def within(entry: Dict[str, Any], name: str, ext: str) -> bool:
+        mtime = entry.get("mtime")
+        return isinstance(mtime, int) and (now - mtime) <= max_age
+
+    return within
+
+
+def _compile_atom(atom: Dict[str, Any], now: int, *, rule_id: Any = None) -> _AtomMatcher:
+    """
+    Classify one match atom into a single matcher.
+
+    The first recognised key wins, in the order filename_regex, ext_in, mime_prefix, created_within_days.
+    An invalid filename_regex is a config error; other malformed atoms (wrong types) never match.
+    """
+    if "filename_regex" in atom:
+        pattern = str(atom["filename_regex"])
+        try:
+            compiled = re.compile(pattern)
+        except re.error as e:
+            raise ValidationError(
+                code="config.invalid",
+                message="match.filename_regex is not a valid regular expression",
+                data={"rule_id": rule_id, "filename_regex": pattern, "error": str(e)},
+            ) from e
+        return _match_regex(compiled.search)
+    if "ext_in" in atom:
+        exts = atom.get("ext_in")
+        if not isinstance(exts, list):
+            return _never
+        return _match_ext(frozenset(x.lower().lstrip(".") for x in exts if isinstance(x, str) and x))
+    if "mime_prefix" in atom:
+        want = atom.get("mime_prefix")
+        if not isinstance(want, str) or not want:
+            return _never
+        return _match_mime(want)
+    if "created_within_days" in atom:
+        days = atom.get("created_within_days")
+        if not isinstance(days, int) or days < 0:
+            return _never
+        return _match_age(int(days) * 86400, now)
+    return _never
+
+
+def _compile_rule_match(rule: Dict[str, Any], now: int) -> _AtomMatcher:
+    """
+    Compile `rule.match` ({any: [...], all: [...]}) into one predicate over (entry, name, ext).
+
+    An empty/missing list does not constrain; a non-empty list with no object atoms makes `any` fail and `all` pass.
+    """
+    m = rule.get("match", {})
+    if not isinstance(m, dict):
+        return _never
+    any_atoms = m.get("any", [])
+    all_atoms = m.get("all", [])
+    if not isinstance(any_atoms, list):
+        any_atoms = []
+    if not isinstance(all_atoms, list):
+        all_atoms = []
+
+    rule_id = rule.get("id")
+    any_preds = [_compile_atom(a, now, rule_id=rule_id) for a in any_atoms if isinstance(a, dict)]
+    all_preds = [_compile_atom(a, now, rule_id=rule_id) for a in all_atoms if isinstance(a, dict)]
+    if any_atoms and not any_preds:
+        return _never
+    # Single-atom rules (the common shape) are the atom matcher itself, without the any()/all() generator per entry.
+    if len(any_preds) == 1 and not all_preds:
+        return any_preds[0]
+    if not any_preds and len(all_preds) == 1:
+        return all_preds[0]
+
+    def matches(entry: Dict[str, Any], name: str, ext: str) -> bool:
+        if any_preds and not any(p(entry, name, ext) for p in any_preds):
+            return False
+        return all(p(entry, name, ext) for p in all_preds)
+
+    return matches
+
+
+def _ext_fastpath(rules: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Index the leading run of extension-only rules (`match.any` made solely of `ext_in` atoms, no `all`).
+
+    Returns ({ext: first rule listing it}, n) where n is the length of that run. Because only a prefix of the rule
+    list is indexed, a fast-path hit is exactly the first matching rule; misses continue from rules[n:].
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    for n, rule in enumerate(rules):
+        m = rule.get("match")
+        any_atoms = m.get("any") if isinstance(m, dict) else None
+        if not isinstance(any_atoms, list) or not any_atoms or m.get("all"):
+            return (index, n)
+        exts: List[str] = []
+        for atom in any_atoms:
+            if not isinstance(atom, dict) or "filename_regex" in atom or not isinstance(atom.get("ext_in"), list):
+                return (index, n)
+            exts.extend(x.lower().lstrip(".") for x in atom["ext_in"] if isinstance(x, str) and x)
+        for e in exts:
+            index.setdefault(e, rule)
+    return (index, len(rules))
+
+
+def _expand(path_str: str) -> str:
+    """
+    os.path.expanduser with memoization.
+
+    Only "~" paths are expanded; the home directory is part of the cache key so tests that patch $HOME still work.
+    """
+    if not path_str.startswith("~"):
+        return path_str
+    return _expand_home(path_str, os.environ.get("HOME"), os.environ.get("USERPROFILE"))
+
+
+@functools.lru_cache(maxsize=256)
+def _expand_home(path_str: str, home: Optional[str], userprofile: Optional[str]) -> str:
+    _ = (home, userprofile)
+    return os.path.expanduser(path_str)
+
+
+# Validated rules configs shared by all planner instances (see BuiltinDesktopPlanner._load_rules_config).
+_CONFIG_CACHE: Dict[Tuple[str, int, int, int], Dict[str, Any]] = {}
+_CONFIG_CACHE_MAX = 32
+
+
+@functools.lru_cache(maxsize=4)
+def _rules_validator(schema_path: str, mtime_ns: int) -> jsonschema.Draft202012Validator:
+    # mtime_ns is part of the cache key so an edited schema file is re-read.
+    _ = mtime_ns
+    schema = _json.loads(Path(schema_path).read_bytes())
+    return jsonschema.Draft202012Validator(schema)
+
 
 class BuiltinDesktopPlanner(Planner):
     """
@@ -39,10 +229,33 @@ class BuiltinDesktopPlanner(Planner):
         if not isinstance(intent_id, str) or not intent_id:
             raise ValidationError(code="intent.invalid", message="Missing or invalid intent_id")
 
-        params = intent.get("params") if isinstance(intent.get("params"), dict) else {}
-        scope = intent.get("scope") if isinstance(intent.get("scope"), dict) else {}
-        context = intent.get("context") if isinstance(intent.get("context"), dict) else {}
+        params = intent.get("params")
+        if not isinstance(params, dict):
+            params = {}
+        scope = intent.get("scope")
+        if not isinstance(scope, dict):
+            scope = {}
+        context = intent.get("context")
+        if not isinstance(context, dict):
+            context = {}
+        return self._plan_normalized(intent_id, params, scope, context)
+
+    def plan_validated(self, intent: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fast path for intents that already passed core contract validation (e.g. intake triage output).
 
+        Contract: `intent` is a dict with a non-empty string `intent_id` and object-typed `params`/`scope`
+        (`context` optional). Those shape checks are skipped; plugin-level param checks still apply.
+        """
+        try:
+            intent_id = intent["intent_id"]
+            params = intent["params"]
+            scope = intent["scope"]
+        except (KeyError, TypeError) as e:
+            raise ValidationError(code="intent.invalid", message="Missing or invalid intent_id/params/scope") from e
+        return self._plan_normalized(intent_id, params, scope, intent.get("context") or {})
+
+    def _plan_normalized(self, intent_id: str, params: Dict[str, Any], scope: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         fs_roots = scope.get("fs_roots")
         if not isinstance(fs_roots, list) or len(fs_roots) < 1:
             raise ValidationError(code="scope.missing", message="scope.fs_roots must be a non-empty array")
@@ -93,25 +306,27 @@ class BuiltinDesktopPlanner(Planner):
         This path does not require a config file; instead it uses a built-in rule set and a
         default staging directory `<target_dir>/_Sorted`.
         """
-        params = intent.get("params", {}) if isinstance(intent.get("params"), dict) else {}
+        params = intent.get("params")
+        if not isinstance(params, dict):
+            params = {}
         target_dir = params.get("target_dir")
         if target_dir is None:
             target_dir = "~/Desktop"
         if not isinstance(target_dir, str) or not target_dir:
             raise ValidationError(code="intent.invalid", message="params.target_dir must be a non-empty string when provided")
 
-        root_path = self._expand_user(target_dir)
+        root_path = _expand(target_dir)
         staging_dir = params.get("staging_dir")
         if staging_dir is None:
             staging_dir = f"{root_path}/_Sorted"
         if not isinstance(staging_dir, str) or not staging_dir:
             raise ValidationError(code="intent.invalid", message="params.staging_dir must be a non-empty string when provided")
-        staging_dir = self._expand_user(staging_dir)
+        staging_dir = _expand(staging_dir)
 
         fs_roots = intent.get("scope", {}).get("fs_roots", [])
         if not isinstance(fs_roots, list):
             fs_roots = []
-        fs_roots_expanded = [self._expand_user(x) for x in fs_roots if isinstance(x, str)]
+        fs_roots_expanded = frozenset(_expand(x) for x in fs_roots if isinstance(x, str))
         if root_path not in fs_roots_expanded or staging_dir not in fs_roots_expanded:
             raise ValidationError(
                 code="scope.invalid",
@@ -178,14 +393,14 @@ class BuiltinDesktopPlanner(Planner):
             },
         ]
 
-        entries = params.get("entries")
+        exclude = params.get("exclude")
         move_steps, created_dirs = self._build_moves_from_entries_config(
             root_path=root_path,
             staging_dir=staging_dir,
             cfg=cfg,
-            entries=entries,
+            entries=params.get("entries"),
             include_dirs=bool(params.get("include_dirs", False)),
-            exclude=list(params.get("exclude", [])) if isinstance(params.get("exclude"), list) else [],
+            exclude=list(exclude) if isinstance(exclude, list) else [],
         )
 
         for d in created_dirs:
@@ -221,24 +436,43 @@ class BuiltinDesktopPlanner(Planner):
         }
 
     def _load_rules_config(self, config_path: str) -> Dict[str, Any]:
+        """
+        Load and schema-validate a rules config.
+
+        Validated configs are memoized by (absolute path, mtime_ns, size, schema mtime_ns), so a preview -> run ->
+        restore sequence parses the YAML once. Each call returns a deep copy, so callers may mutate the result.
+        """
         p = Path(config_path).expanduser()
-        if not p.exists():
-            raise ValidationError(code="config.not_found", message=f"Config not found: {config_path}")
         try:
-            raw = yaml.safe_load(p.read_text(encoding="utf-8"))
+            st = p.stat()
+        except OSError:
+            raise ValidationError(code="config.not_found", message=f"Config not found: {config_path}") from None
+
+        schema_path = plugin_contract_schema_path("builtin.desktop", "desktop_rules.schema.json")
+        cache_key: Optional[Tuple[str, int, int, int]] = None
+        try:
+            cache_key = (os.path.abspath(p), st.st_mtime_ns, st.st_size, schema_path.stat().st_mtime_ns)
+        except OSError:
+            pass  # Unreadable schema: fall through so the error below is reported as before (uncached).
+        if cache_key is not None:
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        try:
+            raw = yaml.load(p.read_text(encoding="utf-8"), Loader=_YamlSafeLoader)
         except Exception as e:  # noqa: BLE001
             raise ValidationError(code="config.invalid_yaml", message="Failed to parse YAML config", data={"error": repr(e)}) from e
         if not isinstance(raw, dict):
             raise ValidationError(code="config.invalid", message="Config must be a YAML mapping/object at top-level")
 
-        schema_path = plugin_contract_schema_path("builtin.desktop", "desktop_rules.schema.json")
         try:
-            schema = json.loads(schema_path.read_text(encoding="utf-8"))
+            validator = _rules_validator(str(schema_path), schema_path.stat().st_mtime_ns)
         except Exception as e:  # noqa: BLE001
             raise ValidationError(code="config.schema_missing", message="Config schema missing or unreadable", data={"path": str(schema_path)}) from e
 
         try:
-            jsonschema.Draft202012Validator(schema).validate(raw)
+            validator.validate(raw)
         except jsonschema.ValidationError as e:
             raise ValidationError(
                 code="config.schema_invalid",
@@ -248,12 +482,12 @@ class BuiltinDesktopPlanner(Planner):
         except Exception as e:  # noqa: BLE001
             raise ValidationError(code="config.schema_invalid", message="Config does not match schema", data={"error": repr(e)}) from e
 
+        if cache_key is not None:
+            if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+                _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+            _CONFIG_CACHE[cache_key] = copy.deepcopy(raw)
         return raw
 
-    def _expand_user(self, path_str: str) -> str:
-        # Use os.path.expanduser so "~" expansion respects tests that patch $HOME.
-        return os.path.expanduser(path_str)
-
     def _plan_configure(self, intent: Dict[str, Any]) -> Dict[str, Any]:
         """
         Human-in-the-loop: returns a plan that only prints a scaffold config.
@@ -317,19 +551,20 @@ class BuiltinDesktopPlanner(Planner):
         }
 
     def _plan_tidy_from_config(self, intent: Dict[str, Any], *, preview: bool) -> Dict[str, Any]:
-        config_path = intent["params"].get("config_path")
+        params = intent["params"]
+        config_path = params.get("config_path")
         if not isinstance(config_path, str) or not config_path:
             raise ValidationError(code="intent.invalid", message="params.config_path is required for desktop.tidy.run/preview")
 
         cfg = self._load_rules_config(config_path)
-        root_path = self._expand_user(str(cfg["root"]["path"]))
-        staging_dir = self._expand_user(str(cfg["root"]["staging_dir"]))
+        root_path = _expand(str(cfg["root"]["path"]))
+        staging_dir = _expand(str(cfg["root"]["staging_dir"]))
         to_delete_dir = f"{staging_dir}/ToDelete"
 
         fs_roots = intent.get("scope", {}).get("fs_roots", [])
         if not isinstance(fs_roots, list):
             fs_roots = []
-        fs_roots_expanded = [self._expand_user(x) for x in fs_roots if isinstance(x, str)]
+        fs_roots_expanded = frozenset(_expand(x) for x in fs_roots if isinstance(x, str))
 
         def _within(root: str, p: str) -> bool:
             try:
@@ -345,7 +580,7 @@ class BuiltinDesktopPlanner(Planner):
         folders_map = cfg.get("folders", {}) if isinstance(cfg.get("folders"), dict) else {}
         for _k, v in folders_map.items():
             if isinstance(v, str) and v:
-                required_paths.append(self._expand_user(v))
+                required_paths.append(_expand(v))
 
         missing = [p for p in required_paths if not _scope_allows(p)]
         if missing:
@@ -374,15 +609,14 @@ class BuiltinDesktopPlanner(Planner):
             },
         ]
 
-        entries = intent.get("params", {}).get("entries")
         move_steps, created_dirs = self._build_moves_from_entries_config(
             root_path=root_path,
             staging_dir=staging_dir,
             to_delete_dir=to_delete_dir,
             cfg=cfg,
-            entries=entries,
-            include_dirs=bool(intent["params"].get("include_dirs", False)),
-            exclude=list(intent["params"].get("exclude", [])),
+            entries=params.get("entries"),
+            include_dirs=bool(params.get("include_dirs", False)),
+            exclude=list(params.get("exclude", [])),
             fs_roots=fs_roots_expanded,
         )
 
@@ -429,7 +663,7 @@ class BuiltinDesktopPlanner(Planner):
         entries: Any,
         include_dirs: bool,
         exclude: List[str],
-        fs_roots: List[str],
+        fs_roots: FrozenSet[str],
     ) -> Tuple[List[Dict[str, Any]], List[str]]:
         if entries is None:
             return ([], [])
@@ -456,88 +690,48 @@ class BuiltinDesktopPlanner(Planner):
         if not isinstance(rules, list):
             rules = []
 
-        now = int(time.time())
-
-        def _ext(name: str) -> str:
-            lower = name.lower()
-            if "." not in lower or lower.endswith("."):
-                return ""
-            return lower.rsplit(".", 1)[-1]
+        skip_re = _compile_globs(tuple(exclude + ignore_patterns))
 
         def should_skip(name: str) -> bool:
             if not name:
                 return True
             if name.startswith("."):
                 return True
-            for pat in (exclude + ignore_patterns):
-                if fnmatch.fnmatchcase(name, pat):
-                    return True
-            return False
+            return skip_re is not None and skip_re.match(name) is not None
 
-        def approx_mime_prefix(name: str) -> Optional[str]:
-            e = _ext(name)
-            if e in ("png", "jpg", "jpeg", "gif", "webp", "heic", "svg"):
-                return "image/"
-            if e in ("mp4", "mov", "mkv", "webm"):
-                return "video/"
-            if e in ("mp3", "wav", "flac", "m4a"):
-                return "audio/"
-            if e in ("pdf", "txt", "md", "rtf", "doc", "docx", "ppt", "pptx", "xls", "xlsx", "csv"):
-                return "application/"
-            return None
-
-        def match_atom(atom: Dict[str, Any], entry: Dict[str, Any]) -> bool:
-            name = str(entry.get("name") or "")
-            if "filename_regex" in atom:
-                try:
-                    return re.search(str(atom["filename_regex"]), name) is not None
-                except Exception:  # noqa: BLE001
-                    return False
-            if "ext_in" in atom:
-                exts = atom.get("ext_in")
-                if not isinstance(exts, list):
-                    return False
-                e = _ext(name)
-                normalized = []
-                for x in exts:
-                    if not isinstance(x, str) or not x:
-                        continue
-                    normalized.append(x.lower().lstrip("."))
-                return e in normalized
-            if "mime_prefix" in atom:
-                want = atom.get("mime_prefix")
-                if not isinstance(want, str) or not want:
-                    return False
-                got = approx_mime_prefix(name)
-                return bool(got and got.startswith(want))
-            if "created_within_days" in atom:
-                days = atom.get("created_within_days")
-                if not isinstance(days, int) or days < 0:
-                    return False
-                mtime = entry.get("mtime")
-                if not isinstance(mtime, int):
-                    return False
-                return (now - mtime) <= int(days) * 86400
-            return False
+        # Filter before compiling rules: empty or directory-only snapshots (include_dirs=False) need no matching.
+        # The 1-based index into entries is kept so step ids stay stable.
+        candidates: List[Tuple[int, Dict[str, Any], str, bool]] = []
+        for i, item in enumerate(entries, start=1):
+            if not isinstance(item, dict):
+                if isinstance(item, str):
+                    item = {"name": item, "is_file": True, "is_dir": False}
+                else:
+                    continue
 
-        def match_rule(rule: Dict[str, Any], entry: Dict[str, Any]) -> bool:
-            m = rule.get("match", {})
-            if not isinstance(m, dict):
-                return False
-            any_atoms = m.get("any", [])
-            all_atoms = m.get("all", [])
-            if not isinstance(any_atoms, list):
-                any_atoms = []
-            if not isinstance(all_atoms, list):
-                all_atoms = []
-
-            any_ok = True
-            if any_atoms:
-                any_ok = any(match_atom(a, entry) for a in any_atoms if isinstance(a, dict))
-            all_ok = True
-            if all_atoms:
-                all_ok = all(match_atom(a, entry) for a in all_atoms if isinstance(a, dict))
-            return any_ok and all_ok
+            name = item.get("name")
+            if not isinstance(name, str) or not name:
+                continue
+            is_file = bool(item.get("is_file", False))
+            is_dir = bool(item.get("is_dir", False))
+            if should_skip(name):
+                continue
+            if is_dir and not include_dirs:
+                continue
+            if (not is_file) and (not is_dir):
+                continue
+            candidates.append((i, item, name, is_dir))
+        if not candidates:
+            return ([], [])
+
+        now = int(time.time())
+
+        # Rules are compiled once per plan: regexes, extension sets and atom kinds are resolved up front.
+        rule_dicts = [r for r in rules if isinstance(r, dict)]
+        compiled_rules = [(r, _compile_rule_match(r, now)) for r in rule_dicts]
+        # Leading extension-only rules resolve with one dict probe; the rest use the general matchers.
+        ext_fastpath, fastpath_len = _ext_fastpath(rule_dicts)
+        fallback_rules = compiled_rules[fastpath_len:]
 
         def _within(root: str, p: str) -> bool:
             try:
@@ -568,79 +762,78 @@ class BuiltinDesktopPlanner(Planner):
                     message="folders[move_to] must be a non-empty string path",
                     data={"rule_id": rule_id, "move_to": folder_key, "value": raw},
                 )
-            dest = self._expand_user(str(raw))
+            dest = _expand(str(raw))
             if not os.path.isabs(dest):
                 raise ValidationError(
                     code="config.invalid",
                     message="folders values must be absolute paths (or ~-prefixed)",
                     data={"rule_id": rule_id, "move_to": folder_key, "value": raw},
                 )
+            # commonpath() below does not collapse "..", so an absolute path could otherwise climb out of fs_roots.
+            if ".." in dest.replace("\\", "/").split("/"):
+                raise ValidationError(
+                    code="config.invalid",
+                    message="folders values must not contain '..' segments",
+                    data={"rule_id": rule_id, "move_to": folder_key, "value": raw},
+                )
             if not _scope_allows(dest):
                 raise ValidationError(
                     code="scope.invalid",
                     message="Destination folder is outside scope.fs_roots",
-                    data={"rule_id": rule_id, "dest": dest, "fs_roots": fs_roots},
+                    data={"rule_id": rule_id, "dest": dest, "fs_roots": sorted(str(p) for p in fs_roots)},
                 )
             return dest
 
         move_steps: List[Dict[str, Any]] = []
         created_dirs_set = set()  # type: ignore[var-annotated]
+        # Loop-invariant pieces of each move step.
+        src_prefix = f"{root_path}/"
+        conflict_note = f" (on_conflict={collision_strategy})"
+        # Destination key (None = ToDelete) -> (dst prefix, title tail, summary tail); resolved/validated once per key.
+        dest_templates: Dict[Optional[str], Tuple[str, str, str]] = {}
 
-        for i, item in enumerate(entries, start=1):
-            if not isinstance(item, dict):
-                if isinstance(item, str):
-                    item = {"name": item, "is_file": True, "is_dir": False}
-                else:
-                    continue
-
-            name = item.get("name")
-            if not isinstance(name, str) or not name:
-                continue
-            is_file = bool(item.get("is_file", False))
-            is_dir = bool(item.get("is_dir", False))
-            if should_skip(name):
-                continue
-            if is_dir and not include_dirs:
-                continue
-            if (not is_file) and (not is_dir):
-                continue
-
+        for i, item, name, is_dir in candidates:
             delete = False
             dest_key = unmatched_move_to
-            for r in rules:
-                if isinstance(r, dict) and match_rule(r, item):
-                    a = r.get("action", {})
-                    if isinstance(a, dict) and bool(a.get("delete", False)):
-                        delete = True
-                    elif isinstance(a, dict) and isinstance(a.get("move_to"), str) and a.get("move_to"):
-                        dest_key = str(a["move_to"])
-                    break
-
             rule_id = None
-            if not is_dir:
-                # Best-effort: record the id of the first matching rule (if any) for clearer errors.
-                for r in rules:
-                    if isinstance(r, dict) and match_rule(r, item):
-                        rid = r.get("id")
-                        if isinstance(rid, str) and rid:
-                            rule_id = rid
+            ext = _file_ext(name)
+            matched = ext_fastpath.get(ext)
+            if matched is None:
+                for r, matches in fallback_rules:
+                    if matches(item, name, ext):
+                        matched = r
                         break
-            if delete:
-                dest_dir = to_delete_dir
-                dest_label = "ToDelete"
-            else:
-                dest_dir = resolve_folder_dest_path(dest_key, rule_id=rule_id)
-                dest_label = dest_key
-            created_dirs_set.add(dest_dir)
-
-            src = f"{root_path}/{name}"
-            dst = f"{dest_dir}/{name}"
-
-            move_step_id = f"commit_move_{i:04d}"
+            if matched is not None:
+                a = matched.get("action", {})
+                if isinstance(a, dict) and bool(a.get("delete", False)):
+                    delete = True
+                elif isinstance(a, dict) and isinstance(a.get("move_to"), str) and a.get("move_to"):
+                    dest_key = str(a["move_to"])
+                # Best-effort: record the id of the first matching rule (files only) for clearer errors.
+                rid = matched.get("id")
+                if not is_dir and isinstance(rid, str) and rid:
+                    rule_id = rid
+            template_key = None if delete else dest_key
+            template = dest_templates.get(template_key)
+            if template is None:
+                if delete:
+                    dest_dir = to_delete_dir
+                    dest_label = "ToDelete"
+                else:
+                    dest_dir = resolve_folder_dest_path(dest_key, rule_id=rule_id)
+                    dest_label = dest_key
+                created_dirs_set.add(dest_dir)
+                template = (f"{dest_dir}/", f" -> {dest_label}", f" -> {dest_label}{conflict_note}")
+                dest_templates[template_key] = template
+            dst_prefix, title_tail, summary_tail = template
+
+            src = src_prefix + name
+            dst = dst_prefix + name
+
             move_steps.append(
                 {
-                    "step_id": move_step_id,
-                    "title": f"Move: {name} -> {dest_label}",
+                    "step_id": f"commit_move_{i:04d}",
+                    "title": "Move: " + name + title_tail,
                     "phase": "commit",
                     "tool": {
                         "tool_id": "fs.move",
@@ -650,29 +843,31 @@ class BuiltinDesktopPlanner(Planner):
                     "expected_effects": [
                         {
                             "kind": "fs_move",
-                            "summary": f"Move {name} -> {dest_label} (on_conflict={collision_strategy})",
+                            "summary": "Move " + name + summary_tail,
                             "resources": [src, dst],
                         }
                     ],
                 }
             )
 
+        # Bounded by the configured folders (+ ToDelete); sorting keeps mkdir steps independent of entry order.
         created_dirs = sorted(created_dirs_set)
         return (move_steps, created_dirs)
 
     def _plan_restore_from_config(self, intent: Dict[str, Any]) -> Dict[str, Any]:
-        config_path = intent["params"].get("config_path")
+        params = intent["params"]
+        config_path = params.get("config_path")
         if not isinstance(config_path, str) or not config_path:
             raise ValidationError(code="intent.invalid", message="params.config_path is required for desktop.tidy.restore")
 
         cfg = self._load_rules_config(config_path)
-        root_path = self._expand_user(str(cfg["root"]["path"]))
-        staging_dir = self._expand_user(str(cfg["root"]["staging_dir"]))
+        root_path = _expand(str(cfg["root"]["path"]))
+        staging_dir = _expand(str(cfg["root"]["staging_dir"]))
 
         fs_roots = intent.get("scope", {}).get("fs_roots", [])
         if not isinstance(fs_roots, list):
             fs_roots = []
-        fs_roots_expanded = [self._expand_user(x) for x in fs_roots if isinstance(x, str)]
+        fs_roots_expanded = frozenset(_expand(x) for x in fs_roots if isinstance(x, str))
         if root_path not in fs_roots_expanded or staging_dir not in fs_roots_expanded:
             raise ValidationError(
                 code="scope.invalid",
@@ -685,13 +880,12 @@ class BuiltinDesktopPlanner(Planner):
         if not isinstance(collision_strategy, str):
             collision_strategy = "suffix_increment"
 
-        sorted_entries = intent.get("params", {}).get("sorted_entries")
         move_steps = self._build_restore_moves_config(
             root_path=root_path,
             staging_dir=staging_dir,
-            sorted_entries=sorted_entries,
+            sorted_entries=params.get("sorted_entries"),
             collision_strategy=collision_strategy,
-            exclude=list(intent["params"].get("exclude", [])),
+            exclude=list(params.get("exclude", [])),
         )
 
         return {
@@ -726,44 +920,45 @@ class BuiltinDesktopPlanner(Planner):
         if collision_strategy not in ("error", "overwrite", "skip", "suffix_increment"):
             collision_strategy = "suffix_increment"
 
-        def should_skip(rel_path: str) -> bool:
-            base = rel_path.split("/")[-1] if "/" in rel_path else rel_path
-            if not base:
-                return True
-            if base.startswith("."):
+        skip_re = _compile_globs(tuple(exclude))
+
+        def should_skip(base: str) -> bool:
+            if not base or base.startswith("."):
                 return True
-            for pat in exclude:
-                if fnmatch.fnmatchcase(base, pat):
-                    return True
-            return False
+            return skip_re is not None and skip_re.match(base) is not None
 
         move_steps: List[Dict[str, Any]] = []
-
-        file_entries = [
-            e for e in sorted_entries if isinstance(e, dict) and isinstance(e.get("path"), str) and bool(e.get("is_file", False))
-        ]
-        file_entries.sort(key=lambda x: str(x.get("path")))
+        # Loop-invariant pieces of each restore step.
+        src_prefix = f"{staging_dir}/"
+        dst_prefix = f"{root_path}/"
+        conflict_note = f" (on_conflict={collision_strategy})"
+
+        # The filter guarantees a str path, so the sort key is a plain item lookup.
+        file_entries = sorted(
+            (e for e in sorted_entries if isinstance(e, dict) and isinstance(e.get("path"), str) and bool(e.get("is_file", False))),
+            key=lambda e: e["path"],
+        )
 
         for i, e in enumerate(file_entries, start=1):
             rel_path = str(e["path"])
-            if should_skip(rel_path):
+            # Basename without building a list; the same value feeds the skip check and the destination.
+            base = rel_path.rpartition("/")[2]
+            if should_skip(base):
                 continue
 
-            base = rel_path.split("/")[-1] if "/" in rel_path else rel_path
-            src = f"{staging_dir}/{rel_path}"
-            dst = f"{root_path}/{base}"
+            src = src_prefix + rel_path
+            dst = dst_prefix + base
 
-            move_step_id = f"commit_restore_{i:04d}"
             move_steps.append(
                 {
-                    "step_id": move_step_id,
-                    "title": f"Restore: {base}",
+                    "step_id": f"commit_restore_{i:04d}",
+                    "title": "Restore: " + base,
                     "phase": "commit",
                     "tool": {"tool_id": "fs.move", "args": {"from": src, "to": dst, "on_conflict": collision_strategy}, "dry_run_ok": True},
                     "expected_effects": [
                         {
                             "kind": "fs_move",
-                            "summary": f"Restore {base} (on_conflict={collision_strategy})",
+                            "summary": "Restore " + base + conflict_note,
                             "resources": [src, dst],
                         }
                     ],
@@ -773,6 +968,8 @@ class BuiltinDesktopPlanner(Planner):
         return move_steps
 
 
+@functools.lru_cache(maxsize=1)
 def get_planner() -> Planner:
+    # BuiltinDesktopPlanner keeps no per-instance state (caches are module-level), so one shared instance is safe.
     return BuiltinDesktopPlanner()
 
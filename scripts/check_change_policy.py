@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import re
@@ -34,11 +35,10 @@ DOC_ONLY_FILES = (
 )
 
 
-PR_OVERRIDE_TAG = re.compile(r"(?im)^\s*Test-Impact\s*:\s*none\s*$")
-PR_OVERRIDE_REASON = re.compile(r"(?im)^\s*Test-Impact-Reason\s*:\s*\S.+$")
-
-WORK_TASK_OVERRIDE_TAG = re.compile(r"(?im)^\s*TestImpact\s*:\s*none\s*$")
-WORK_TASK_OVERRIDE_REASON = re.compile(r"(?im)^\s*TestImpactReason\s*:\s*\S.+$")
+# One pass per text: a line is either the override tag or its reason (named groups tell which). The lookahead keeps
+# matches zero-width, so a reason whose value starts on the next line still leaves that line to be scanned.
+PR_OVERRIDE = re.compile(r"(?im)^(?=\s*(?:(?P<tag>Test-Impact\s*:\s*none\s*$)|(?P<reason>Test-Impact-Reason\s*:\s*\S.+$)))")
+WORK_TASK_OVERRIDE = re.compile(r"(?im)^(?=\s*(?:(?P<tag>TestImpact\s*:\s*none\s*$)|(?P<reason>TestImpactReason\s*:\s*\S.+$)))")
 
 
 @dataclass(frozen=True)
@@ -47,33 +47,49 @@ class ChangePolicyResult:
     message: str
 
 
-def _is_docs_only(changed_files: Iterable[str]) -> bool:
-    files = [f for f in changed_files if f and f.strip()]
-    if not files:
-        return True
-    for f in files:
-        if f in DOC_ONLY_FILES:
-            continue
-        if any(f.startswith(p) for p in DOC_ONLY_PREFIXES):
-            continue
-        return False
-    return True
-
-
-def _has_target_changes(changed_files: Iterable[str], target_prefixes: Iterable[str]) -> bool:
-    return any(any(f.startswith(p) for p in target_prefixes) for f in changed_files)
-
+def _classify_changes(changed_files: Iterable[str], target_prefixes: tuple[str, ...]) -> tuple[bool, bool, bool]:
+    """
+    Returns (docs_only, has_target, has_tests) from a single pass over `changed_files`.
 
-def _has_tests_changes(changed_files: Iterable[str]) -> bool:
-    return any(f.startswith(TESTS_PREFIX) for f in changed_files)
+    Blank entries are ignored; an empty change set counts as docs-only.
+    """
+    docs_only, has_target, has_tests = True, False, False
+    for f in changed_files:
+        if not f or not f.strip():
+            continue
+        if docs_only and f not in DOC_ONLY_FILES and not f.startswith(DOC_ONLY_PREFIXES):
+            docs_only = False
+        if not has_target and f.startswith(target_prefixes):
+            has_target = True
+        if not has_tests and f.startswith(TESTS_PREFIX):
+            has_tests = True
+        if not docs_only and has_target and has_tests:
+            break
+    return docs_only, has_target, has_tests
+
+
+def _scan_override(pattern: re.Pattern[str], text: str) -> tuple[bool, bool]:
+    """
+    Returns (has_tag, has_reason) from a single scan of `text`, stopping as soon as both are seen.
+    """
+    has_tag = has_reason = False
+    for m in pattern.finditer(text):
+        if m.group("tag") is not None:
+            has_tag = True
+        else:
+            has_reason = True
+        if has_tag and has_reason:
+            break
+    return has_tag, has_reason
 
 
 def _has_pr_override(pr_body: str | None) -> tuple[bool, str]:
     if not pr_body:
         return False, ""
-    if not PR_OVERRIDE_TAG.search(pr_body):
+    has_tag, has_reason = _scan_override(PR_OVERRIDE, pr_body)
+    if not has_tag:
         return False, ""
-    if not PR_OVERRIDE_REASON.search(pr_body):
+    if not has_reason:
         return False, "`Test-Impact: none` in the PR body requires `Test-Impact-Reason:`."
     return True, ""
 
@@ -84,9 +100,10 @@ def _has_work_task_override(work_tasks_files: dict[str, str]) -> tuple[bool, str
     for _path, content in work_tasks_files.items():
         if not content:
             continue
-        if not WORK_TASK_OVERRIDE_TAG.search(content):
+        has_tag, has_reason = _scan_override(WORK_TASK_OVERRIDE, content)
+        if not has_tag:
             continue
-        if not WORK_TASK_OVERRIDE_REASON.search(content):
+        if not has_reason:
             return False, "`TestImpact: none` requires `TestImpactReason:` (work task)."
         return True, ""
     return False, ""
@@ -111,14 +128,15 @@ def evaluate_change_policy(
         - A changed work/tasks file includes TestImpact: none + TestImpactReason.
     """
     work_tasks_files = work_tasks_files or {}
+    docs_only, has_target, has_tests = _classify_changes(changed_files, tuple(target_prefixes))
 
-    if _is_docs_only(changed_files):
+    if docs_only:
         return 0, "Docs-only change: guard skipped."
 
-    if not _has_target_changes(changed_files, target_prefixes):
+    if not has_target:
         return 0, "No guarded code changes detected."
 
-    if _has_tests_changes(changed_files):
+    if has_tests:
         return 0, "Tests changed alongside code: OK."
 
     pr_ok, pr_err = _has_pr_override(pr_body)
@@ -156,15 +174,21 @@ def _run_git_diff_name_only(base: str, head: str) -> list[str]:
     )
     if cp.returncode != 0:
         raise RuntimeError("git diff failed: {}".format(cp.stderr.strip() or cp.stdout.strip()))
-    return [l.strip() for l in cp.stdout.splitlines() if l.strip()]
+    return list(filter(None, map(str.strip, cp.stdout.splitlines())))
+
+
+@functools.lru_cache(maxsize=8)
+def _changed_files_cached(base: str, head: str) -> tuple[str, ...]:
+    """
+    `git diff --name-only base...head`, computed once per process.
+    """
+    return tuple(_run_git_diff_name_only(base, head))
 
 
 def _read_pr_body_from_event(event_path: Path) -> str | None:
-    if not event_path.exists():
-        return None
     try:
-        data = json.loads(event_path.read_text(encoding="utf-8"))
-    except Exception:
+        data = json.loads(event_path.read_bytes())
+    except Exception:  # Missing/unreadable file or invalid JSON: no PR body.
         return None
     pr = data.get("pull_request") or {}
     body = pr.get("body")
@@ -176,10 +200,10 @@ def _read_changed_work_tasks_files(changed_files: list[str]) -> dict[str, str]:
     for f in changed_files:
         if not f.startswith("work/tasks/"):
             continue
-        p = ROOT / f
-        if not p.exists():
-            continue
-        out[f] = p.read_text(encoding="utf-8")
+        try:
+            out[f] = (ROOT / f).read_bytes().decode("utf-8")
+        except (FileNotFoundError, IsADirectoryError):
+            continue  # Deleted (or not a file) in this checkout.
     return out
 
 
@@ -196,7 +220,7 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--event-path", default=os.environ.get("GITHUB_EVENT_PATH"), help="GitHub event JSON path")
     ns = ap.parse_args(argv)
 
-    changed_files = _run_git_diff_name_only(ns.base, ns.head)
+    changed_files = list(_changed_files_cached(ns.base, ns.head))
     pr_body = _read_pr_body_from_event(Path(ns.event_path)) if ns.event_path else None
     work_tasks_files = _read_changed_work_tasks_files(changed_files)
 
@@ -40,7 +40,12 @@ def main() -> int:
         ]
     )
     failures.extend(
-        [("trace.sample.jsonl", store.validate_jsonl_file("trace_event.schema.json", examples_dir / "trace.sample.jsonl"))]
+        [
+            (
+                "trace.sample.jsonl",
+                store.validate_jsonl_file("trace_event.schema.json", examples_dir / "trace.sample.jsonl"),
+            )
+        ]
     )
 
     ok = True
@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 import warnings
 from pathlib import Path
@@ -26,6 +27,33 @@ class TestContractStoreRegistry(unittest.TestCase):
         # If RefResolver is used internally, jsonschema emits a DeprecationWarning.
         self.assertEqual(dep_warnings, [])
 
+    def test_get_validator_is_reused_until_reload(self) -> None:
+        root = Path(__file__).resolve().parents[2]
+        store = ContractStore(root / "contracts" / "core" / "schemas")
+        store.load()
+
+        v1 = store.get_validator("intent.schema.json")
+        self.assertIs(store.get_validator("intent.schema.json"), v1)
+        self.assertEqual(store.validate("intent.schema.json", {"intent_id": "x"}), [e.message for e in sorted(v1.iter_errors({"intent_id": "x"}), key=str)])
+
+        store.load()
+        self.assertIsNot(store.get_validator("intent.schema.json"), v1)
+
+    def test_validate_jsonl_file_early_exit_stops_at_first_bad_line(self) -> None:
+        root = Path(__file__).resolve().parents[2]
+        store = ContractStore(root / "contracts" / "core" / "schemas")
+        store.load()
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "trace.jsonl"
+            path.write_text("\n{not json\n[]\n", encoding="utf-8")
+
+            all_errors = store.validate_jsonl_file("trace_event.schema.json", path)
+            self.assertTrue(all_errors[0].startswith("line 2: invalid json"))
+            self.assertTrue(any(e.startswith("line 3: ") for e in all_errors))
+
+            first = store.validate_jsonl_file("trace_event.schema.json", path, early_exit=True)
+            self.assertEqual(first, all_errors[:1])
+
 
 if __name__ == "__main__":
     unittest.main()
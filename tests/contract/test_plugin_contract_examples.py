@@ -1,7 +1,7 @@
 import unittest
 from pathlib import Path
 
-from nucleus.contract_checks import validate_plugin_contract_examples
+from nucleus.contract_checks import _schema_validator, validate_plugin_contract_examples
 
 
 class TestPluginContractExamples(unittest.TestCase):
@@ -10,6 +10,13 @@ class TestPluginContractExamples(unittest.TestCase):
         failures = validate_plugin_contract_examples(root / "contracts" / "plugins")
         self.assertEqual(failures, [])
 
+    def test_schema_validators_are_reused_across_runs(self) -> None:
+        root = Path(__file__).resolve().parents[2]
+        validate_plugin_contract_examples(root / "contracts" / "plugins")
+        hits = _schema_validator.cache_info().hits
+        self.assertEqual(validate_plugin_contract_examples(root / "contracts" / "plugins"), [])
+        self.assertGreater(_schema_validator.cache_info().hits, hits)
+
 
 if __name__ == "__main__":
     unittest.main()
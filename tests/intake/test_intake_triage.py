@@ -1,7 +1,19 @@
+import asyncio
+import json
 import unittest
 
 from nucleus.core.errors import ValidationError
-from nucleus.intake.triage import triage_text_to_intent
+from nucleus.intake.openai_responses import OpenAIResponsesClient
+from nucleus.intake.providers import OpenAIResponsesTriageProvider
+from nucleus.intake.testing import ModelAsIntentProvider
+from nucleus.intake.triage import (
+    AsyncBatcher,
+    TriageCache,
+    atriage_text_to_intent,
+    atriage_texts_to_intents,
+    triage_text_to_intent,
+    triage_text_to_intent_batch,
+)
 
 
 class StubProvider:
@@ -12,6 +24,26 @@ class StubProvider:
         return self.payload
 
 
+class CountingProvider:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = 0
+
+    def triage(self, *, input_text: str, system_prompt: str, intent_schema: dict) -> dict:
+        self.calls += 1
+        return dict(self.payload)
+
+
+class RecordingBatchProvider:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def triage(self, *, input_text: str, system_prompt: str, intent_schema: dict) -> dict:
+        self.calls.append(input_text)
+        n = input_text.count("\n\n") + 1
+        return {"items": [{"intent_id": "desktop.tidy.preview", "params_json": "{}", "clarify": []} for _ in range(n)]}
+
+
 class TestIntakeTriage(unittest.TestCase):
     def test_network_denied_by_default(self) -> None:
         with self.assertRaises(ValidationError) as ctx:
@@ -69,6 +101,223 @@ class TestIntakeTriage(unittest.TestCase):
         self.assertEqual(res.intent["params"]["config_path"], "~/cfg.yml")
         self.assertEqual(res.intent["params"]["clarify"], ["どのフォルダ？"])
 
+    def test_system_prompt_lists_allowed_intents_once_in_sorted_order(self) -> None:
+        prompts = []
+
+        class PromptRecorder:
+            def triage(self, *, input_text: str, system_prompt: str, intent_schema: dict) -> dict:
+                prompts.append(system_prompt)
+                return {"intent_id": "desktop.tidy.run", "params_json": "{}", "clarify": []}
+
+        triage_text_to_intent(
+            input_text="整理して",
+            intents_catalog=[
+                {"intent_id": "desktop.tidy.run", "plugin_id": "builtin.desktop"},
+                {"intent_id": "desktop.tidy.preview", "plugin_id": "builtin.desktop"},
+                {"intent_id": "desktop.tidy.run", "plugin_id": "builtin.desktop"},
+            ],
+            scope={"fs_roots": ["~/Desktop"], "allow_network": False},
+            provider=PromptRecorder(),
+            provider_id="stub",
+            model="stub",
+            allow_network=True,
+        )
+        listed = prompts[0].split("Allowed intents:\n", 1)[1].split("\n\n", 1)[0]
+        self.assertEqual(listed, "- desktop.tidy.preview\n- desktop.tidy.run")
+
+    def test_batch_demuxes_items_in_order(self) -> None:
+        scope = {"fs_roots": ["~/Desktop"], "allow_network": False}
+        provider = StubProvider(
+            {
+                "items": [
+                    {"intent_id": "desktop.tidy.preview", "params_json": "{}", "clarify": []},
+                    {"intent_id": "desktop.tidy.run", "params_json": "{\"config_path\": \"~/cfg.yml\"}", "clarify": []},
+                ]
+            }
+        )
+        res = triage_text_to_intent_batch(
+            inputs=["プレビュー", "実行"],
+            intents_catalog=[{"intent_id": "desktop.tidy.preview"}, {"intent_id": "desktop.tidy.run"}],
+            scope=scope,
+            provider=provider,
+            provider_id="stub",
+            model="stub",
+            allow_network=True,
+        )
+        self.assertEqual([r.intent["intent_id"] for r in res], ["desktop.tidy.preview", "desktop.tidy.run"])
+        self.assertEqual(res[1].intent["params"], {"config_path": "~/cfg.yml"})
+        self.assertEqual(res[0].intent["scope"], scope)
+
+    def test_batch_item_count_mismatch_is_rejected(self) -> None:
+        with self.assertRaises(ValidationError) as ctx:
+            triage_text_to_intent_batch(
+                inputs=["a", "b"],
+                intents_catalog=[{"intent_id": "desktop.tidy.preview"}],
+                scope={"fs_roots": ["~/Desktop"], "allow_network": False},
+                provider=StubProvider({"items": [{"intent_id": "desktop.tidy.preview", "params_json": "{}", "clarify": []}]}),
+                provider_id="stub",
+                model="stub",
+                allow_network=True,
+            )
+        self.assertEqual(ctx.exception.code, "intake.invalid_response")
+
+    def test_batch_rejects_blank_input_before_calling_provider(self) -> None:
+        provider = RecordingBatchProvider()
+        with self.assertRaises(ValidationError) as ctx:
+            triage_text_to_intent_batch(
+                inputs=["a", "  "],
+                intents_catalog=[{"intent_id": "desktop.tidy.preview"}],
+                scope={"fs_roots": ["~/Desktop"], "allow_network": False},
+                provider=provider,
+                provider_id="stub",
+                model="stub",
+                allow_network=True,
+            )
+        self.assertEqual(ctx.exception.code, "intake.invalid")
+        self.assertEqual(provider.calls, [])
+
+    def test_batch_uses_openai_triage_batch_items(self) -> None:
+        bodies = []
+
+        def fake_post(url, *, headers, body, timeout_s):
+            bodies.append(body)
+            items = [{"intent_id": "desktop.tidy.preview", "params_json": "{}", "clarify": []}] * 2
+            return {"output": [{"content": [{"type": "output_text", "text": json.dumps({"items": items})}]}]}
+
+        provider = OpenAIResponsesTriageProvider(client=OpenAIResponsesClient(http_post=fake_post), model="m", api_key="k")
+        res = triage_text_to_intent_batch(
+            inputs=["a", "b"],
+            intents_catalog=[{"intent_id": "desktop.tidy.preview"}],
+            scope={"fs_roots": ["~/Desktop"], "allow_network": False},
+            provider=provider,
+            provider_id="openai.responses",
+            model="m",
+            allow_network=True,
+        )
+        self.assertEqual(len(bodies), 1)
+        self.assertEqual([r.intent["intent_id"] for r in res], ["desktop.tidy.preview"] * 2)
+
+        with self.assertRaises(ValidationError) as ctx:
+            OpenAIResponsesTriageProvider(
+                client=OpenAIResponsesClient(http_post=lambda url, **kw: {"output_parsed": {"intent_id": "x"}}), model="m", api_key="k"
+            ).triage_batch(input_text="[1] a", system_prompt="sys", intent_schema={})
+        self.assertEqual(ctx.exception.code, "intake.invalid_response")
+
+    def test_async_batcher_coalesces_into_one_provider_call(self) -> None:
+        provider = RecordingBatchProvider()
+
+        async def run():
+            batcher = AsyncBatcher(
+                intents_catalog=[{"intent_id": "desktop.tidy.preview"}],
+                scope={"fs_roots": ["~/Desktop"], "allow_network": False},
+                provider=provider,
+                provider_id="stub",
+                model="stub",
+                allow_network=True,
+                max_batch=3,
+                max_wait_s=5.0,
+            )
+            return await asyncio.gather(batcher.triage("a"), batcher.triage("b"), batcher.triage("c"))
+
+        res = asyncio.run(run())
+        self.assertEqual(len(provider.calls), 1)
+        self.assertEqual([r.intent["intent_id"] for r in res], ["desktop.tidy.preview"] * 3)
+
+    def test_async_batcher_isolates_failures_to_the_failing_input(self) -> None:
+        class EchoIntentBatchProvider:
+            # One item per numbered input; the input text is used as the intent_id.
+            def __init__(self) -> None:
+                self.calls = []
+
+            def triage(self, *, input_text: str, system_prompt: str, intent_schema: dict) -> dict:
+                self.calls.append(input_text)
+                ids = [chunk.split("] ", 1)[1] for chunk in input_text.split("\n\n")]
+                return {"items": [{"intent_id": iid, "params_json": "{}", "clarify": []} for iid in ids]}
+
+        provider = EchoIntentBatchProvider()
+
+        async def run():
+            batcher = AsyncBatcher(
+                intents_catalog=[{"intent_id": "desktop.tidy.preview"}],
+                scope={"fs_roots": ["~/Desktop"], "allow_network": False},
+                provider=provider,
+                provider_id="stub",
+                model="stub",
+                allow_network=True,
+                max_batch=3,
+                max_wait_s=5.0,
+            )
+            return await asyncio.gather(
+                batcher.triage("desktop.tidy.preview"), batcher.triage("not.allowed"), batcher.triage("  "), return_exceptions=True
+            )
+
+        good, bad_item, bad_input = asyncio.run(run())
+        self.assertEqual(len(provider.calls), 1)
+        self.assertNotIn("[3]", provider.calls[0])
+        self.assertEqual(good.intent["intent_id"], "desktop.tidy.preview")
+        self.assertIsInstance(bad_item, ValidationError)
+        self.assertEqual(bad_item.code, "intake.invalid_intent_id")
+        self.assertIsInstance(bad_input, ValidationError)
+        self.assertEqual(bad_input.code, "intake.invalid")
+
+    def test_async_fan_out_preserves_input_order(self) -> None:
+        scope = {"fs_roots": ["~/Desktop"], "allow_network": False}
+        res = asyncio.run(
+            atriage_texts_to_intents(
+                inputs=["a", "b"],
+                intents_catalog=[{"intent_id": "desktop.tidy.preview"}],
+                scope=scope,
+                provider=ModelAsIntentProvider(model="desktop.tidy.preview"),
+                provider_id="stub",
+                model="desktop.tidy.preview",
+                allow_network=True,
+            )
+        )
+        self.assertEqual([r.intent["intent_id"] for r in res], ["desktop.tidy.preview", "desktop.tidy.preview"])
+        self.assertEqual(res[0].intent["scope"], scope)
+
+    def test_async_triage_uses_openai_async_transport(self) -> None:
+        async def fake_post(url, *, headers, body, timeout_s):
+            return {"output": [{"content": [{"type": "output_text", "text": "{\"intent_id\": \"desktop.tidy.preview\", \"params_json\": \"{}\", \"clarify\": []}"}]}]}
+
+        client = OpenAIResponsesClient(async_http_post=fake_post)
+        provider = OpenAIResponsesTriageProvider(client=client, model="m", api_key="k")
+        res = asyncio.run(
+            atriage_text_to_intent(
+                input_text="整理して",
+                intents_catalog=[{"intent_id": "desktop.tidy.preview"}],
+                scope={"fs_roots": ["~/Desktop"], "allow_network": False},
+                provider=provider,
+                provider_id="openai.responses",
+                model="m",
+                allow_network=True,
+            )
+        )
+        self.assertEqual(res.intent["intent_id"], "desktop.tidy.preview")
+        self.assertEqual(res.intent["params"], {})
+
+    def test_cache_skips_provider_on_repeat_and_returns_copies(self) -> None:
+        provider = CountingProvider({"intent_id": "desktop.tidy.preview", "params": {}})
+        cache = TriageCache()
+        kwargs = dict(
+            intents_catalog=[{"intent_id": "desktop.tidy.preview"}],
+            scope={"fs_roots": ["~/Desktop"], "allow_network": False},
+            provider=provider,
+            provider_id="stub",
+            model="stub",
+            allow_network=True,
+            cache=cache,
+        )
+        first = triage_text_to_intent(input_text="整理して", **kwargs)
+        first.intent["params"]["config_path"] = "mutated"
+        second = triage_text_to_intent(input_text="整理して", **kwargs)
+        self.assertEqual(provider.calls, 1)
+        self.assertEqual(second.intent["params"], {})
+
+        triage_text_to_intent(input_text="別の依頼", **kwargs)
+        self.assertEqual(provider.calls, 2)
+        self.assertEqual(len(cache), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
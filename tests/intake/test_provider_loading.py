@@ -1,8 +1,10 @@
 import os
 import unittest
+from unittest.mock import patch
 
+from nucleus import _json
 from nucleus.core.errors import ValidationError
-from nucleus.intake.provider_loading import load_triage_provider
+from nucleus.intake.provider_loading import _PROVIDER_REGISTRY, _import_object, load_triage_provider
 
 
 class TestProviderLoading(unittest.TestCase):
@@ -40,6 +42,46 @@ class TestProviderLoading(unittest.TestCase):
             else:
                 os.environ["GEMINI_API_KEY"] = old
 
+    def test_model_as_json_provider_validates_model_at_construction(self) -> None:
+        with patch("nucleus.intake.testing._json.loads", wraps=_json.loads) as loads:
+            loaded = load_triage_provider(provider="nucleus.intake.testing:ModelAsJsonProvider", model='{"config_yaml": {"k": "x"}}')
+            first = loaded.provider.triage(input_text="hi", system_prompt="sys", intent_schema={})
+            first["config_yaml"]["k"] = "mutated"
+            self.assertEqual(loaded.provider.triage(input_text="hi", system_prompt="sys", intent_schema={}), {"config_yaml": {"k": "x"}})
+            self.assertEqual(loads.call_count, 1)
+
+        with self.assertRaises(ValidationError) as ctx:
+            load_triage_provider(provider="nucleus.intake.testing:ModelAsJsonProvider", model="{not json")
+        self.assertEqual(ctx.exception.code, "intake.provider_invalid")
+        self.assertEqual(ctx.exception.data["error"]["code"], "intake.invalid_response")
+
+    def test_module_object_spec_is_resolved_once(self) -> None:
+        spec = "nucleus.intake.testing:ModelAsJsonProvider"
+        load_triage_provider(provider=spec, model="{}")
+        hits = _import_object.cache_info().hits
+        load_triage_provider(provider=spec, model="{}")
+        self.assertEqual(_import_object.cache_info().hits, hits + 1)
+
+        with self.assertRaises(ValidationError) as ctx:
+            load_triage_provider(provider="nucleus.intake.testing:NoSuchProvider", model="{}")
+        self.assertEqual(ctx.exception.code, "intake.provider_not_found")
+
+    def test_registered_provider_resolves_without_import(self) -> None:
+        from nucleus.intake.testing import ModelAsJsonProvider
+
+        _PROVIDER_REGISTRY["stub.json"] = ModelAsJsonProvider
+        try:
+            loaded = load_triage_provider(provider="stub.json", model='{"k": 1}')
+        finally:
+            _PROVIDER_REGISTRY.pop("stub.json", None)
+        self.assertEqual(loaded.provider_id, "stub.json")
+        self.assertEqual(loaded.provider.triage(input_text="hi", system_prompt="sys", intent_schema={}), {"k": 1})
+
+        # Once unregistered, the name falls back to "module:object" parsing.
+        with self.assertRaises(ValidationError) as ctx:
+            load_triage_provider(provider="stub.json", model="{}")
+        self.assertEqual(ctx.exception.code, "intake.provider_invalid")
+
 
 if __name__ == "__main__":
     unittest.main()
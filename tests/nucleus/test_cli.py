@@ -5,12 +5,162 @@ import tempfile
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
+from typing import Any, Sequence, Tuple
 from unittest.mock import patch
 
-from nucleus.cli.nuc import main as nuc_main
+import yaml
+
+from nucleus import _json
+from nucleus.cli.nuc import _load_plugins, build_parser, main as nuc_main
+from nucleus.intake.provider_loading import _PROVIDER_REGISTRY
+from nucleus.intake.testing import ModelAsIntentProvider, ModelAsJsonProvider
+from nucleus.resources import plugins_dir
+from nucleus.trace import set_sink as set_trace_sink
+
+try:  # Prefer the libyaml loader, like the runtime config readers.
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
+
+# Stub configure-AI draft shared by the desktop ai bootstrap tests (paths filled per test).
+_DRAFT_YAML_TEMPLATE = """\
+version: "0.1"
+plugin: "builtin.desktop"
+
+root:
+  path: "{root}"
+  staging_dir: "{root}_Aux"
+
+folders:
+  images: "{pics}"
+  downloads: "{docs}"
+
+rules:
+  - id: "r_images"
+    match:
+      any:
+        - ext_in: ["jpg"]
+    action:
+      move_to: "images"
+
+defaults:
+  unmatched_action:
+    move_to: "downloads"
+
+safety:
+  collision_strategy: "suffix_increment"
+  ignore_patterns: []
+
+"""
+
+
+def _load_yaml(data: bytes) -> Any:
+    return yaml.load(data, Loader=_YamlSafeLoader)
+
+
+def _model_json(obj: Any) -> str:
+    # --configure-model payload for the stub json provider (orjson when installed, like the runtime).
+    return _json.dumps(obj).decode("utf-8")
+
+
+def _stub_config_draft_json(*, root: Path, pics: Path, docs: Path) -> str:
+    yaml_text = _DRAFT_YAML_TEMPLATE.format(root=root, pics=pics, docs=docs)
+    return _model_json({"config_yaml": yaml_text, "rationale": "stub", "clarify": []})
+
+
+def _desktop_rules_yaml(*, root: Path, folders: Sequence[Tuple[str, str]], move_to: str) -> str:
+    folder_lines = "".join(f'  {k}: "{v}"\n' for k, v in folders)
+    return f"""\
+version: "0.1"
+plugin: "builtin.desktop"
+
+root:
+  path: "{root}"
+  staging_dir: "{root}_Aux"
+
+folders:
+{folder_lines}
+rules: []
+
+defaults:
+  unmatched_action:
+    move_to: "{move_to}"
+
+"""
+
+
+def _configure_draft_yaml(source: Path, body: str, *, header: bool = True) -> str:
+    # Stub `desktop configure --ai` draft: root block for `source`, the test-specific `body`, default safety block.
+    head = 'version: "0.1"\nplugin: "builtin.desktop"\n\n' if header else ""
+    return f"""\
+{head}root:
+  path: "{source}"
+  staging_dir: "{source}_Aux"
+
+{body}safety:
+  collision_strategy: "suffix_increment"
+  ignore_patterns: []
+
+"""
+
+
+def _mk_tree(base: Path, dirs: Sequence[str], files: Sequence[Tuple[str, bytes]]) -> None:
+    for d in dirs:
+        os.makedirs(base / d, exist_ok=True)
+    for rel, data in files:
+        with open(base / rel, "wb") as f:
+            f.write(data)
+
+
+class _NullStdout(io.TextIOBase):
+    # stdout for CLI calls whose output is not asserted: writes are discarded instead of buffered.
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+
+_SINK = _NullStdout()
+
+
+def _parse_stdout_json(buf: io.StringIO) -> Any:
+    buf.seek(0)
+    return json.load(buf)
+
+
+def _iter_top_level_json(txt: str):
+    """
+    Yield each JSON value embedded in mixed CLI output (YAML, status lines, JSON), scanning forward once.
+    """
+    dec = json.JSONDecoder()
+    i, n = 0, len(txt)
+    while i < n:
+        if txt[i] in "{[":
+            try:
+                obj, end = dec.raw_decode(txt, i)
+            except ValueError:
+                pass
+            else:
+                yield obj
+                i = end
+                continue
+        i += 1
 
 
 class TestNucCli(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Register the stub providers once by name so the desktop ai tests skip the "module:object" import path.
+        _PROVIDER_REGISTRY["stub.intent"] = ModelAsIntentProvider
+        _PROVIDER_REGISTRY["stub.json"] = ModelAsJsonProvider
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        _PROVIDER_REGISTRY.pop("stub.intent", None)
+        _PROVIDER_REGISTRY.pop("stub.json", None)
+
     def setUp(self) -> None:
         self._old_disable_dotenv = os.environ.get("NUCLEUS_DISABLE_DOTENV")
         os.environ["NUCLEUS_DISABLE_DOTENV"] = "1"
@@ -21,12 +171,20 @@ class TestNucCli(unittest.TestCase):
         else:
             os.environ["NUCLEUS_DISABLE_DOTENV"] = self._old_disable_dotenv
 
+    def test_parser_is_built_once_and_reused_without_leaking_state(self) -> None:
+        parser = build_parser()
+        self.assertIs(build_parser(), parser)
+        first = parser.parse_args(["dry-run-intent", "--intent", "x", "--exclude", "*.tmp", "--scope-root", "/a"])
+        self.assertEqual((first.exclude, first.scope_root), (["*.tmp"], ["/a"]))
+        second = parser.parse_args(["dry-run-intent", "--intent", "x"])
+        self.assertEqual((second.exclude, second.scope_root), ([], []))
+
     def test_list_tools_outputs_json(self) -> None:
         buf = io.StringIO()
         with redirect_stdout(buf):
             rc = nuc_main(["list-tools", "--json"])
         self.assertEqual(rc, 0)
-        data = json.loads(buf.getvalue())
+        data = _parse_stdout_json(buf)
         tool_ids = [t["tool_id"] for t in data]
         self.assertIn("fs.list", tool_ids)
         self.assertIn("fs.move", tool_ids)
@@ -34,15 +192,14 @@ class TestNucCli(unittest.TestCase):
     def test_show_trace_outputs_events(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             p = Path(td) / "t.jsonl"
-            p.write_text(
-                "\n".join(
-                    [
-                        json.dumps({"ts": "2026-02-03T00:00:00Z", "run_id": "r1", "event_type": "intent_received"}),
-                        json.dumps({"ts": "2026-02-03T00:00:01Z", "run_id": "r1", "event_type": "run_finished"}),
-                    ]
+            p.write_bytes(
+                b"".join(
+                    _json.dumps(ev) + b"\n"
+                    for ev in (
+                        {"ts": "2026-02-03T00:00:00Z", "run_id": "r1", "event_type": "intent_received"},
+                        {"ts": "2026-02-03T00:00:01Z", "run_id": "r1", "event_type": "run_finished"},
+                    )
                 )
-                + "\n",
-                encoding="utf-8",
             )
 
             buf = io.StringIO()
@@ -59,17 +216,27 @@ class TestNucCli(unittest.TestCase):
         with redirect_stdout(buf):
             rc = nuc_main(["list-intents", "--json"])
         self.assertEqual(rc, 0)
-        data = json.loads(buf.getvalue())
+        data = _parse_stdout_json(buf)
         intent_ids = [it["intent_id"] for it in data]
         self.assertIn("desktop.tidy.run", intent_ids)
         self.assertIn("desktop.tidy.preview", intent_ids)
 
+    def test_plugin_discovery_cache_is_opt_in(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache_file = Path(td) / "nucleus" / "plugin_index.json"
+            with patch.dict("os.environ", {"XDG_CACHE_HOME": td}, clear=False):
+                os.environ.pop("NUCLEUS_PLUGIN_CACHE", None)
+                _load_plugins(plugins_dir())
+                self.assertFalse(cache_file.exists())
+                with patch.dict("os.environ", {"NUCLEUS_PLUGIN_CACHE": "1"}):
+                    _load_plugins(plugins_dir())
+                self.assertTrue(cache_file.exists())
+
     def test_cli_loads_env_file_from_cwd(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
-            (td_path / "env").write_text('OPENAI_API_KEY="test_key_from_env_file"\n', encoding="utf-8")
+            (td_path / "env").write_bytes(b'OPENAI_API_KEY="test_key_from_env_file"\n')
 
-            old_cwd = os.getcwd()
             old_key = os.environ.get("OPENAI_API_KEY")
             try:
                 if "OPENAI_API_KEY" in os.environ:
@@ -77,14 +244,11 @@ class TestNucCli(unittest.TestCase):
                 # Enable dotenv loading for this test only.
                 old_disable = os.environ.get("NUCLEUS_DISABLE_DOTENV")
                 os.environ.pop("NUCLEUS_DISABLE_DOTENV", None)
-                os.chdir(td)
-                buf = io.StringIO()
-                with redirect_stdout(buf):
+                with patch("nucleus.cli.nuc._cwd_for_dotenv", return_value=td_path), redirect_stdout(_SINK):
                     rc = nuc_main(["list-tools", "--json"])
                 self.assertEqual(rc, 0)
                 self.assertEqual(os.environ.get("OPENAI_API_KEY"), "test_key_from_env_file")
             finally:
-                os.chdir(old_cwd)
                 if old_disable is None:
                     os.environ["NUCLEUS_DISABLE_DOTENV"] = "1"
                 else:
@@ -99,67 +263,65 @@ class TestNucCli(unittest.TestCase):
             td_path = Path(td)
             root = td_path / "Desktop"
             staging = td_path / "Desktop_Aux"
-            docs = td_path / "Documents"
             pics = td_path / "Pictures"
             downloads = td_path / "Downloads"
-            root.mkdir(parents=True)
-            docs.mkdir(parents=True)
-            pics.mkdir(parents=True)
-            downloads.mkdir(parents=True)
-            (root / "pic.jpg").write_text("x", encoding="utf-8")
-            (root / "a.tmp").write_text("x", encoding="utf-8")
+            _mk_tree(
+                td_path,
+                ("Desktop", "Documents", "Pictures", "Downloads"),
+                (("Desktop/pic.jpg", b"x"), ("Desktop/a.tmp", b"x")),
+            )
 
             cfg_path = td_path / "desktop_rules.yml"
-            cfg_path.write_text(
-                "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{root}"',
-                        f'  staging_dir: "{staging}"',
-                        "",
-                        "folders:",
-                        f'  images: "{pics}"',
-                        f'  downloads: "{downloads}"',
-                        "",
-                        "rules:",
-                        '  - id: "r_images"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["jpg"]',
-                        "    action:",
-                        '      move_to: "images"',
-                        '  - id: "r_tmp_delete"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["tmp"]',
-                        "    action:",
-                        "      delete: true",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
-                encoding="utf-8",
+            cfg_path.write_bytes(
+                f"""\
+version: "0.1"
+plugin: "builtin.desktop"
+
+root:
+  path: "{root}"
+  staging_dir: "{staging}"
+
+folders:
+  images: "{pics}"
+  downloads: "{downloads}"
+
+rules:
+  - id: "r_images"
+    match:
+      any:
+        - ext_in: ["jpg"]
+    action:
+      move_to: "images"
+  - id: "r_tmp_delete"
+    match:
+      any:
+        - ext_in: ["tmp"]
+    action:
+      delete: true
+
+defaults:
+  unmatched_action:
+    move_to: "downloads"
+
+safety:
+  collision_strategy: "suffix_increment"
+  ignore_patterns: []
+
+""".encode("utf-8")
             )
 
-            trace_path = td_path / "trace.jsonl"
+            events: list = []
+            set_trace_sink(events.append)
+            self.addCleanup(set_trace_sink, None)
             buf = io.StringIO()
             with redirect_stdout(buf):
-                rc = nuc_main(["desktop", "preview", "--config-path", str(cfg_path), "--trace", str(trace_path), "--run-id", "run_test_preview_1"])
+                rc = nuc_main(["desktop", "preview", "--config-path", str(cfg_path), "--trace", "-", "--run-id", "run_test_preview_1"])
             self.assertEqual(rc, 0)
-            out = json.loads(buf.getvalue())
+            out = _parse_stdout_json(buf)
             self.assertEqual(out["plan_id"], "plan_desktop_tidy_preview_001")
-            self.assertTrue(trace_path.exists())
+            self.assertTrue(events)
+            self.assertIn("run_test_preview_1", {e.get("run_id") for e in events})
+            self.assertFalse(Path("-").exists() or Path("-.preflight.jsonl").exists())
             # dry-run: should not move files
             self.assertTrue((root / "pic.jpg").exists())
             self.assertTrue((root / "a.tmp").exists())
@@ -172,70 +334,66 @@ class TestNucCli(unittest.TestCase):
             docs = td_path / "Documents"
             pics = td_path / "Pictures"
             downloads = td_path / "Downloads"
-            root.mkdir(parents=True)
-            docs.mkdir(parents=True)
-            pics.mkdir(parents=True)
-            downloads.mkdir(parents=True)
-            (root / "pic.jpg").write_text("x", encoding="utf-8")
-            (root / "doc.pdf").write_text("x", encoding="utf-8")
-            (root / "a.tmp").write_text("x", encoding="utf-8")
+            _mk_tree(
+                td_path,
+                ("Desktop", "Documents", "Pictures", "Downloads"),
+                (("Desktop/pic.jpg", b"x"), ("Desktop/doc.pdf", b"x"), ("Desktop/a.tmp", b"x")),
+            )
 
             cfg_path = td_path / "desktop_rules.yml"
-            cfg_path.write_text(
-                "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{root}"',
-                        f'  staging_dir: "{staging}"',
-                        "",
-                        "folders:",
-                        f'  images: "{pics}"',
-                        f'  documents: "{docs}"',
-                        f'  downloads: "{downloads}"',
-                        "",
-                        "rules:",
-                        '  - id: "r_images"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["jpg"]',
-                        "    action:",
-                        '      move_to: "images"',
-                        '  - id: "r_docs"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["pdf"]',
-                        "    action:",
-                        '      move_to: "documents"',
-                        '  - id: "r_tmp_delete"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["tmp"]',
-                        "    action:",
-                        "      delete: true",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
-                encoding="utf-8",
+            cfg_path.write_bytes(
+                f"""\
+version: "0.1"
+plugin: "builtin.desktop"
+
+root:
+  path: "{root}"
+  staging_dir: "{staging}"
+
+folders:
+  images: "{pics}"
+  documents: "{docs}"
+  downloads: "{downloads}"
+
+rules:
+  - id: "r_images"
+    match:
+      any:
+        - ext_in: ["jpg"]
+    action:
+      move_to: "images"
+  - id: "r_docs"
+    match:
+      any:
+        - ext_in: ["pdf"]
+    action:
+      move_to: "documents"
+  - id: "r_tmp_delete"
+    match:
+      any:
+        - ext_in: ["tmp"]
+    action:
+      delete: true
+
+defaults:
+  unmatched_action:
+    move_to: "downloads"
+
+safety:
+  collision_strategy: "suffix_increment"
+  ignore_patterns: []
+
+""".encode("utf-8")
             )
 
-            trace_path = td_path / "trace.jsonl"
+            events: list = []
+            set_trace_sink(events.append)
+            self.addCleanup(set_trace_sink, None)
             buf = io.StringIO()
             with redirect_stdout(buf):
-                rc = nuc_main(["desktop", "run", "--config-path", str(cfg_path), "--trace", str(trace_path), "--run-id", "run_test_run_1"])
+                rc = nuc_main(["desktop", "run", "--config-path", str(cfg_path), "--trace", "-", "--run-id", "run_test_run_1"])
             self.assertEqual(rc, 0)
-            out = json.loads(buf.getvalue())
+            out = _parse_stdout_json(buf)
             self.assertEqual(out["plan_id"], "plan_desktop_tidy_run_001")
             self.assertTrue((pics / "pic.jpg").exists())
             self.assertTrue((docs / "doc.pdf").exists())
@@ -244,504 +402,95 @@ class TestNucCli(unittest.TestCase):
             self.assertTrue((staging / "ToDelete" / "a.tmp").exists())
             self.assertFalse((root / "a.tmp").exists())
 
-    def test_desktop_ai_first_run_creates_config_and_runs(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            td_path = Path(td)
-            root = td_path / "Desktop"
-            root.mkdir(parents=True)
-            (root / "pic.jpg").write_text("x", encoding="utf-8")
-
-            xdg = td_path / "xdg"
-            trace_path = td_path / "trace.jsonl"
-
-            docs = td_path / "Documents"
-            pics = td_path / "Pictures"
-            docs.mkdir(parents=True)
-            pics.mkdir(parents=True)
-
-            cfg_path = xdg / "nucleus" / "desktop_rules.yml"
-
-            draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{root}"',
-                        f'  staging_dir: "{root}_Aux"',
-                        "",
-                        "folders:",
-                        f'  images: "{pics}"',
-                        f'  downloads: "{docs}"',
-                        "",
-                        "rules:",
-                        '  - id: "r_images"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["jpg"]',
-                        "    action:",
-                        '      move_to: "images"',
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
-                "rationale": "stub",
-                "clarify": [],
-            }
-            model_json = json.dumps(draft, ensure_ascii=False)
-
-            buf = io.StringIO()
-            with (
-                patch.dict("os.environ", {"XDG_CONFIG_HOME": str(xdg)}, clear=False),
-                redirect_stdout(buf),
-            ):
-                rc = nuc_main(
-                    [
-                        "desktop",
-                        "ai",
-                        "--text",
-                        "デスクトップを実行で整理して",
-                        "--allow-network-intake",
-                        "--provider",
-                        "nucleus.intake.testing:ModelAsIntentProvider",
-                        "--model",
-                        "desktop.tidy.run",
-                        "--configure-provider",
-                        "nucleus.intake.testing:ModelAsJsonProvider",
-                        "--configure-model",
-                        model_json,
-                        "--source-root",
-                        str(root),
-                        "--dest-root",
-                        str(docs),
-                        "--dest-root",
-                        str(pics),
-                        "--config-path",
-                        str(cfg_path),
-                        "--trace",
-                        str(trace_path),
-                        "--run-id",
-                        "run_test_ai_1",
-                    ]
-                )
-            self.assertEqual(rc, 0)
-            # desktop ai bootstrap prints YAML + status text before the final pretty-printed JSON.
-            # Extract the JSON object containing "plan_id" from the full output.
-            txt = buf.getvalue()
-            dec = json.JSONDecoder()
-            out_obj = None
-            pid_idx = txt.rfind('"plan_id"')
-            self.assertGreaterEqual(pid_idx, 0)
-            start = txt.rfind("{", 0, pid_idx)
-            self.assertGreaterEqual(start, 0)
-            try:
-                obj, _end = dec.raw_decode(txt[start:])
-            except Exception as e:  # noqa: BLE001
-                raise AssertionError(f"Failed to parse JSON output: {e!r}") from e
-            if isinstance(obj, dict):
-                out_obj = obj
-            self.assertIsNotNone(out_obj)
-            self.assertEqual(out_obj["plan_id"], "plan_desktop_tidy_run_001")
-            self.assertTrue(cfg_path.exists())
-            self.assertTrue((pics / "pic.jpg").exists())
-            self.assertFalse((root / "pic.jpg").exists())
-
-    def test_desktop_ai_migrates_incompatible_existing_config(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            td_path = Path(td)
-            root = td_path / "Desktop"
-            root.mkdir(parents=True)
-            (root / "pic.jpg").write_text("x", encoding="utf-8")
-
-            docs = td_path / "Documents"
-            pics = td_path / "Pictures"
-            docs.mkdir(parents=True)
-            pics.mkdir(parents=True)
-
-            xdg = td_path / "xdg"
-            cfg_path = xdg / "nucleus" / "desktop_rules.yml"
-            cfg_path.parent.mkdir(parents=True, exist_ok=True)
-            # Old-style incompatible config (folders values are relative names)
-            cfg_path.write_text(
-                "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{root}"',
-                        f'  staging_dir: "{root}_Aux"',
-                        "",
-                        "folders:",
-                        '  screenshots: "Screenshots"',
-                        '  misc: "Misc"',
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "misc"',
-                        "",
-                    ]
-                )
-                + "\n",
-                encoding="utf-8",
-            )
-
-            draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: \"{root}\"',
-                        f'  staging_dir: \"{root}_Aux\"',
-                        "",
-                        "folders:",
-                        f'  images: \"{pics}\"',
-                        f'  downloads: \"{docs}\"',
-                        "",
-                        "rules:",
-                        '  - id: \"r_images\"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: [\"jpg\"]',
-                        "    action:",
-                        '      move_to: \"images\"',
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: \"downloads\"',
-                        "",
-                        "safety:",
-                        '  collision_strategy: \"suffix_increment\"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
-                "rationale": "stub",
-                "clarify": [],
-            }
-            model_json = json.dumps(draft, ensure_ascii=False)
-
-            trace_path = td_path / "trace.jsonl"
-            buf = io.StringIO()
-            with (
-                patch.dict("os.environ", {"XDG_CONFIG_HOME": str(xdg)}, clear=False),
-                redirect_stdout(buf),
-            ):
-                rc = nuc_main(
-                    [
-                        "desktop",
-                        "ai",
-                        "--text",
-                        "整理して",
-                        "--allow-network-intake",
-                        "--provider",
-                        "nucleus.intake.testing:ModelAsIntentProvider",
-                        "--model",
-                        "desktop.tidy.run",
-                        "--configure-provider",
-                        "nucleus.intake.testing:ModelAsJsonProvider",
-                        "--configure-model",
-                        model_json,
-                        "--source-root",
-                        str(root),
-                        "--dest-root",
-                        str(docs),
-                        "--dest-root",
-                        str(pics),
-                        "--trace",
-                        str(trace_path),
-                        "--run-id",
-                        "run_test_ai_migrate_1",
-                    ]
-                )
-            self.assertEqual(rc, 0)
-            # Old config kept; new generated config written next to it.
-            gen = xdg / "nucleus" / "desktop_rules.generated.yml"
-            self.assertTrue(cfg_path.exists())
-            self.assertTrue(gen.exists())
-            self.assertTrue((pics / "pic.jpg").exists())
-            self.assertFalse((root / "pic.jpg").exists())
-
-    def test_desktop_ai_prefers_source_root_over_existing_valid_config(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            td_path = Path(td)
-            xdg = td_path / "xdg"
-            cfg_path = xdg / "nucleus" / "desktop_rules.yml"
-            cfg_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Existing valid config points to Desktop_A.
-            desktop_a = td_path / "Desktop_A"
-            desktop_b = td_path / "Desktop_B"
-            docs = td_path / "Documents"
-            pics = td_path / "Pictures"
-            for p in (desktop_a, desktop_b, docs, pics):
-                p.mkdir(parents=True, exist_ok=True)
-            (desktop_b / "pic.jpg").write_text("x", encoding="utf-8")
-
-            cfg_path.write_text(
-                "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{desktop_a}"',
-                        f'  staging_dir: "{desktop_a}_Aux"',
-                        "",
-                        "folders:",
-                        f'  images: "{pics}"',
-                        f'  downloads: "{docs}"',
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                    ]
-                )
-                + "\n",
-                encoding="utf-8",
-            )
-
-            # Bootstrap config proposal for Desktop_B.
-            draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{desktop_b}"',
-                        f'  staging_dir: "{desktop_b}_Aux"',
-                        "",
-                        "folders:",
-                        f'  images: "{pics}"',
-                        f'  downloads: "{docs}"',
-                        "",
-                        "rules:",
-                        '  - id: "r_images"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["jpg"]',
-                        "    action:",
-                        '      move_to: "images"',
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
-                "rationale": "stub",
-                "clarify": [],
-            }
-            model_json = json.dumps(draft, ensure_ascii=False)
-
-            trace_path = td_path / "trace.jsonl"
-            buf = io.StringIO()
-            with (
-                patch.dict("os.environ", {"XDG_CONFIG_HOME": str(xdg)}, clear=False),
-                redirect_stdout(buf),
-            ):
-                rc = nuc_main(
-                    [
-                        "desktop",
-                        "ai",
-                        "--text",
-                        "整理して",
-                        "--allow-network-intake",
-                        "--provider",
-                        "nucleus.intake.testing:ModelAsIntentProvider",
-                        "--model",
-                        "desktop.tidy.run",
-                        "--configure-provider",
-                        "nucleus.intake.testing:ModelAsJsonProvider",
-                        "--configure-model",
-                        model_json,
-                        "--source-root",
-                        str(desktop_b),
-                        "--dest-root",
-                        str(docs),
-                        "--dest-root",
-                        str(pics),
-                        "--trace",
-                        str(trace_path),
-                        "--run-id",
-                        "run_test_ai_prefer_1",
-                    ]
-                )
-            self.assertEqual(rc, 0)
-            self.assertTrue(cfg_path.exists())
-            gen = xdg / "nucleus" / "desktop_rules.generated.yml"
-            self.assertTrue(gen.exists())
-            self.assertTrue((pics / "pic.jpg").exists())
-            self.assertFalse((desktop_b / "pic.jpg").exists())
-
-    def test_desktop_ai_overwrites_existing_generated_config_when_source_root_changes(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            td_path = Path(td)
-            xdg = td_path / "xdg"
-            cfg_path = xdg / "nucleus" / "desktop_rules.yml"
-            gen_path = xdg / "nucleus" / "desktop_rules.generated.yml"
-            cfg_path.parent.mkdir(parents=True, exist_ok=True)
-
-            desktop_old = td_path / "Desktop_Old"
-            desktop_new = td_path / "Desktop_New"
-            docs = td_path / "Documents"
-            pics = td_path / "Pictures"
-            for p in (desktop_old, desktop_new, docs, pics):
-                p.mkdir(parents=True, exist_ok=True)
-            (desktop_new / "pic.jpg").write_text("x", encoding="utf-8")
-
-            # Old incompatible config (forces generated mode).
-            cfg_path.write_text(
-                "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{desktop_old}"',
-                        f'  staging_dir: "{desktop_old}_Aux"',
-                        "",
-                        "folders:",
-                        '  screenshots: "Screenshots"',
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "screenshots"',
-                        "",
-                    ]
-                )
-                + "\n",
-                encoding="utf-8",
-            )
-
-            # Pre-existing generated config pointing to desktop_old (this must be overwritten).
-            gen_path.write_text(
-                "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{desktop_old}"',
-                        f'  staging_dir: "{desktop_old}_Aux"',
-                        "",
-                        "folders:",
-                        f'  images: "{pics}"',
-                        f'  downloads: "{docs}"',
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                    ]
-                )
-                + "\n",
-                encoding="utf-8",
-            )
-
-            # Bootstrap config proposal for desktop_new.
-            draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{desktop_new}"',
-                        f'  staging_dir: "{desktop_new}_Aux"',
-                        "",
-                        "folders:",
-                        f'  images: "{pics}"',
-                        f'  downloads: "{docs}"',
-                        "",
-                        "rules:",
-                        '  - id: "r_images"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["jpg"]',
-                        "    action:",
-                        '      move_to: "images"',
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
-                "rationale": "stub",
-                "clarify": [],
-            }
-            model_json = json.dumps(draft, ensure_ascii=False)
+    def test_desktop_ai_bootstraps_config_then_runs(self) -> None:
+        # (name, source root, existing desktop_rules.yml, existing desktop_rules.generated.yml, pass --config-path, expect generated)
+        # Existing configs are (root dir name, folders, unmatched move_to); "{pics}"/"{docs}" become the dest roots.
+        incompatible = (("screenshots", "Screenshots"), ("misc", "Misc"))
+        valid = (("images", "{pics}"), ("downloads", "{docs}"))
+        cases = [
+            ("first_run_creates_config", "Desktop", None, None, True, False),
+            ("migrates_incompatible_existing_config", "Desktop", ("Desktop", incompatible, "misc"), None, False, True),
+            ("prefers_source_root_over_existing_valid_config", "Desktop_B", ("Desktop_A", valid, "downloads"), None, False, True),
+            (
+                "overwrites_existing_generated_config_when_source_root_changes",
+                "Desktop_New",
+                ("Desktop_Old", incompatible[:1], "screenshots"),
+                ("Desktop_Old", valid, "downloads"),
+                False,
+                True,
+            ),
+        ]
+        # Trace events stay in-process instead of going to stderr.
+        set_trace_sink([].append)
+        self.addCleanup(set_trace_sink, None)
+        for name, source_name, existing_cfg, existing_gen, pass_config_path, expect_gen in cases:
+            with self.subTest(case=name), tempfile.TemporaryDirectory() as td:
+                td_path = Path(td)
+                root = td_path / source_name
+                docs = td_path / "Documents"
+                pics = td_path / "Pictures"
+                xdg = td_path / "xdg"
+                cfg_path = xdg / "nucleus" / "desktop_rules.yml"
+                gen_path = xdg / "nucleus" / "desktop_rules.generated.yml"
+                _mk_tree(td_path, (source_name, "Documents", "Pictures", "xdg/nucleus"), ((f"{source_name}/pic.jpg", b"x"),))
+
+                for path, existing in ((cfg_path, existing_cfg), (gen_path, existing_gen)):
+                    if existing is None:
+                        continue
+                    cfg_root_name, folders, move_to = existing
+                    cfg_root = td_path / cfg_root_name
+                    cfg_root.mkdir(exist_ok=True)
+                    resolved = tuple((k, v.format(pics=pics, docs=docs)) for k, v in folders)
+                    path.write_bytes(_desktop_rules_yaml(root=cfg_root, folders=resolved, move_to=move_to).encode("utf-8"))
+
+                argv = [
+                    "desktop",
+                    "ai",
+                    "--text",
+                    "デスクトップを実行で整理して",
+                    "--allow-network-intake",
+                    "--provider",
+                    "stub.intent",
+                    "--model",
+                    "desktop.tidy.run",
+                    "--configure-provider",
+                    "stub.json",
+                    "--configure-model",
+                    _stub_config_draft_json(root=root, pics=pics, docs=docs),
+                    "--source-root",
+                    str(root),
+                    "--dest-root",
+                    str(docs),
+                    "--dest-root",
+                    str(pics),
+                    "--trace",
+                    "-",
+                    "--run-id",
+                    f"run_test_ai_{name}",
+                ]
+                if pass_config_path:
+                    argv += ["--config-path", str(cfg_path)]
 
-            trace_path = td_path / "trace.jsonl"
-            buf = io.StringIO()
-            with (
-                patch.dict("os.environ", {"XDG_CONFIG_HOME": str(xdg)}, clear=False),
-                redirect_stdout(buf),
-            ):
-                rc = nuc_main(
-                    [
-                        "desktop",
-                        "ai",
-                        "--text",
-                        "整理して",
-                        "--allow-network-intake",
-                        "--provider",
-                        "nucleus.intake.testing:ModelAsIntentProvider",
-                        "--model",
-                        "desktop.tidy.run",
-                        "--configure-provider",
-                        "nucleus.intake.testing:ModelAsJsonProvider",
-                        "--configure-model",
-                        model_json,
-                        "--source-root",
-                        str(desktop_new),
-                        "--dest-root",
-                        str(docs),
-                        "--dest-root",
-                        str(pics),
-                        "--trace",
-                        str(trace_path),
-                        "--run-id",
-                        "run_test_ai_overwrite_gen_1",
-                    ]
-                )
-            self.assertEqual(rc, 0)
-            self.assertTrue(gen_path.exists())
-            self.assertTrue((pics / "pic.jpg").exists())
-            self.assertFalse((desktop_new / "pic.jpg").exists())
+                buf = io.StringIO()
+                with (
+                    patch.dict("os.environ", {"XDG_CONFIG_HOME": str(xdg)}, clear=False),
+                    redirect_stdout(buf),
+                ):
+                    rc = nuc_main(argv)
+                self.assertEqual(rc, 0)
+                # desktop ai bootstrap prints YAML + status text before the final pretty-printed JSON.
+                # Extract the JSON object containing "plan_id" from the full output.
+                out_obj = None
+                for obj in _iter_top_level_json(buf.getvalue()):
+                    if isinstance(obj, dict) and "plan_id" in obj:
+                        out_obj = obj
+                self.assertIsNotNone(out_obj)
+                self.assertEqual(out_obj["plan_id"], "plan_desktop_tidy_run_001")
+                # An existing config is kept; the generated config is written next to it.
+                self.assertTrue(cfg_path.exists())
+                self.assertEqual(gen_path.exists(), expect_gen)
+                self.assertTrue((pics / "pic.jpg").exists())
+                self.assertFalse((root / "pic.jpg").exists())
 
     def test_desktop_configure_ai_writes_config(self) -> None:
         with tempfile.TemporaryDirectory() as td:
@@ -752,57 +501,43 @@ class TestNucCli(unittest.TestCase):
             source.mkdir(parents=True)
             dest_docs.mkdir(parents=True)
             dest_pics.mkdir(parents=True)
-            (source / "pic.jpg").write_text("x", encoding="utf-8")
-            (source / "a.tmp").write_text("x", encoding="utf-8")
+            (source / "pic.jpg").write_bytes(b"x")
+            (source / "a.tmp").write_bytes(b"x")
 
             out_cfg = td_path / "desktop_rules.yml"
+            draft_body = f"""\
+folders:
+  documents: "{dest_docs}"
+  images: "{dest_pics}"
+  downloads: "{dest_docs}"
+
+rules:
+  - id: "r_tmp"
+    match:
+      any:
+        - ext_in: ["tmp"]
+    action:
+      delete: true
+  - id: "r_images"
+    match:
+      any:
+        - ext_in: ["jpg"]
+    action:
+      move_to: "images"
+
+defaults:
+  unmatched_action:
+    move_to: "downloads"
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        f'  documents: "{dest_docs}"',
-                        f'  images: "{dest_pics}"',
-                        f'  downloads: "{dest_docs}"',
-                        "",
-                        "rules:",
-                        '  - id: "r_tmp"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["tmp"]',
-                        "    action:",
-                        "      delete: true",
-                        '  - id: "r_images"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["jpg"]',
-                        "    action:",
-                        '      move_to: "images"',
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "desktop",
@@ -834,50 +569,36 @@ class TestNucCli(unittest.TestCase):
             dest_docs = td_path / "Documents"
             source.mkdir(parents=True)
             dest_docs.mkdir(parents=True)
-            (source / "a.tmp").write_text("x", encoding="utf-8")
+            (source / "a.tmp").write_bytes(b"x")
 
             out_cfg = td_path / "desktop_rules.yml"
             # Simulate an LLM mistake: folders value as YAML list
+            draft_body = f"""\
+folders:
+  downloads:
+    - "{dest_docs}"
+
+rules:
+  - id: "r_tmp"
+    match:
+      any:
+        - ext_in: ["tmp"]
+    action:
+      delete: true
+
+defaults:
+  unmatched_action:
+    move_to: "downloads"
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        "  downloads:",
-                        f"    - \"{dest_docs}\"",
-                        "",
-                        "rules:",
-                        '  - id: "r_tmp"',
-                        "    match:",
-                        "      any:",
-                        '        - ext_in: ["tmp"]',
-                        "    action:",
-                        "      delete: true",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "desktop",
@@ -910,37 +631,23 @@ class TestNucCli(unittest.TestCase):
 
             out_cfg = td_path / "desktop_rules.yml"
             # Simulate an LLM mistake: rules is an object (should be array), containing unmatched_action.
+            draft_body = f"""\
+folders:
+  documents: "{dest_docs}"
+
+rules:
+  unmatched_action:
+    move_to: Documents
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        f'  documents: "{dest_docs}"',
-                        "",
-                        "rules:",
-                        "  unmatched_action:",
-                        "    move_to: Documents",
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "desktop",
@@ -973,36 +680,25 @@ class TestNucCli(unittest.TestCase):
 
             out_cfg = td_path / "desktop_rules.yml"
             # Simulate an LLM proposal missing version/plugin and using path-like move_to.
+            draft_body = f"""\
+folders:
+  Documents: "{dest_docs}"
+
+rules: []
+
+defaults:
+  unmatched_action:
+    move_to: Documents/Unmatched
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        f'  Documents: "{dest_docs}"',
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        "    move_to: Documents/Unmatched",
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body, header=False),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "desktop",
@@ -1025,9 +721,7 @@ class TestNucCli(unittest.TestCase):
             self.assertEqual(rc, 0)
             self.assertTrue(out_cfg.exists())
             # Ensure config validates basic shape after normalization.
-            import yaml as _yaml
-
-            obj = _yaml.safe_load(out_cfg.read_text(encoding="utf-8"))
+            obj = _load_yaml(out_cfg.read_bytes())
             self.assertEqual(obj["version"], "0.1")
             self.assertEqual(obj["plugin"], "builtin.desktop")
             self.assertIsInstance(obj.get("rules"), list)
@@ -1045,43 +739,29 @@ class TestNucCli(unittest.TestCase):
 
             out_cfg = td_path / "desktop_rules.yml"
             # Simulate an LLM mistake: folders value is an object with a 'path' field.
+            draft_body = f"""\
+folders:
+  Downloads:
+    path: "{dest_dl}"
+    rules:
+      action:
+        - move_to: Downloads
+
+rules: []
+
+defaults:
+  unmatched_action:
+    move_to: Downloads
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        "  Downloads:",
-                        f'    path: "{dest_dl}"',
-                        "    rules:",
-                        "      action:",
-                        "        - move_to: Downloads",
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        "    move_to: Downloads",
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "desktop",
@@ -1114,41 +794,27 @@ class TestNucCli(unittest.TestCase):
             downloads.mkdir(parents=True)
 
             out_cfg = td_path / "desktop_rules.yml"
+            draft_body = """\
+folders:
+  Downloads: "~Downloads"
+
+rules: []
+
+defaults:
+  unmatched_action:
+    move_to: Downloads
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        "  Downloads: \"~Downloads\"",
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        "    move_to: Downloads",
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
             with (
                 patch.dict("os.environ", {"HOME": str(td_path)}, clear=False),
-                redirect_stdout(buf),
+                redirect_stdout(_SINK),
             ):
                 rc = nuc_main(
                     [
@@ -1181,40 +847,26 @@ class TestNucCli(unittest.TestCase):
             dest_docs.mkdir(parents=True)
 
             out_cfg = td_path / "desktop_rules.yml"
+            draft_body = f"""\
+folders:
+  documents: "{dest_docs}"
+
+rules: []
+
+defaults:
+  unmatched_action:
+    move_to: documents
+    delete: false
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        f'  documents: "{dest_docs}"',
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        "    move_to: documents",
-                        "    delete: false",
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "desktop",
@@ -1247,41 +899,27 @@ class TestNucCli(unittest.TestCase):
 
             out_cfg = td_path / "desktop_rules.yml"
             # Simulate an LLM mistake: rule has only action (no id/match)
+            draft_body = f"""\
+folders:
+  downloads: "{dest_dl}"
+
+rules:
+  - action:
+      move_to: Downloads
+
+defaults:
+  unmatched_action:
+    move_to: downloads
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        f'  downloads: "{dest_dl}"',
-                        "",
-                        "rules:",
-                        "  - action:",
-                        "      move_to: Downloads",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        "    move_to: downloads",
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "desktop",
@@ -1302,9 +940,7 @@ class TestNucCli(unittest.TestCase):
                     ]
                 )
             self.assertEqual(rc, 0)
-            import yaml as _yaml
-
-            obj = _yaml.safe_load(out_cfg.read_text(encoding="utf-8"))
+            obj = _load_yaml(out_cfg.read_bytes())
             self.assertIsInstance(obj.get("rules"), list)
             # malformed rule should be dropped
             self.assertEqual(obj["rules"], [])
@@ -1323,40 +959,26 @@ class TestNucCli(unittest.TestCase):
 
             out_cfg = td_path / "desktop_rules.yml"
             # LLM mistake: folders destination incorrectly placed under source_root.
+            draft_body = f"""\
+folders:
+  Archives: "{source}/Archives"
+  Downloads: "{dest_dl}"
+
+rules: []
+
+defaults:
+  unmatched_action:
+    move_to: Archives
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        f'  Archives: "{source}/Archives"',
-                        f'  Downloads: "{dest_dl}"',
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        "    move_to: Archives",
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "desktop",
@@ -1381,10 +1003,9 @@ class TestNucCli(unittest.TestCase):
                     ]
                 )
             self.assertEqual(rc, 0)
-            import yaml as _yaml
             import os as _os
 
-            obj = _yaml.safe_load(out_cfg.read_text(encoding="utf-8"))
+            obj = _load_yaml(out_cfg.read_bytes())
             folders = obj.get("folders", {})
             self.assertIsInstance(folders, dict)
             self.assertIn("Archives", folders)
@@ -1402,41 +1023,27 @@ class TestNucCli(unittest.TestCase):
             dest_dl.mkdir(parents=True)
 
             out_cfg = td_path / "desktop_rules.yml"
+            draft_body = f"""\
+folders:
+  Downloads:
+    - "{dest_dl}/archive.zip"
+    - "{dest_dl}/doc.pdf"
+
+rules: []
+
+defaults:
+  unmatched_action:
+    move_to: Downloads
+
+"""
             draft = {
-                "config_yaml": "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{source}"',
-                        f'  staging_dir: "{source}_Aux"',
-                        "",
-                        "folders:",
-                        "  Downloads:",
-                        f'    - "{dest_dl}/archive.zip"',
-                        f'    - "{dest_dl}/doc.pdf"',
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        "    move_to: Downloads",
-                        "",
-                        "safety:",
-                        '  collision_strategy: "suffix_increment"',
-                        "  ignore_patterns: []",
-                        "",
-                    ]
-                )
-                + "\n",
+                "config_yaml": _configure_draft_yaml(source, draft_body),
                 "rationale": "stub",
                 "clarify": [],
             }
-            model_json = json.dumps(draft, ensure_ascii=False)
+            model_json = _model_json(draft)
 
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "desktop",
@@ -1457,10 +1064,9 @@ class TestNucCli(unittest.TestCase):
                     ]
                 )
             self.assertEqual(rc, 0)
-            import yaml as _yaml
             import os as _os
 
-            obj = _yaml.safe_load(out_cfg.read_text(encoding="utf-8"))
+            obj = _load_yaml(out_cfg.read_bytes())
             folders = obj.get("folders", {})
             self.assertIsInstance(folders, dict)
             self.assertEqual(_os.path.expanduser(folders.get("Downloads")), str(dest_dl))
@@ -1477,37 +1083,33 @@ class TestNucCli(unittest.TestCase):
             downloads.mkdir(parents=True)
 
             cfg_path = td_path / "desktop_rules.yml"
-            cfg_path.write_text(
-                "\n".join(
-                    [
-                        'version: "0.1"',
-                        'plugin: "builtin.desktop"',
-                        "",
-                        "root:",
-                        f'  path: "{root}"',
-                        f'  staging_dir: "{staging}"',
-                        "",
-                        "folders:",
-                        f'  documents: "{docs}"',
-                        f'  downloads: "{downloads}"',
-                        "",
-                        "rules: []",
-                        "",
-                        "defaults:",
-                        "  unmatched_action:",
-                        '    move_to: "downloads"',
-                        "",
-                    ]
-                )
-                + "\n",
-                encoding="utf-8",
+            cfg_path.write_bytes(
+                f"""\
+version: "0.1"
+plugin: "builtin.desktop"
+
+root:
+  path: "{root}"
+  staging_dir: "{staging}"
+
+folders:
+  documents: "{docs}"
+  downloads: "{downloads}"
+
+rules: []
+
+defaults:
+  unmatched_action:
+    move_to: "downloads"
+
+""".encode("utf-8")
             )
 
             buf = io.StringIO()
             with redirect_stdout(buf):
                 rc = nuc_main(["alfred", "--query", f"tidy preview {cfg_path}"])
             self.assertEqual(rc, 0)
-            obj = json.loads(buf.getvalue())
+            obj = _parse_stdout_json(buf)
             self.assertEqual(obj["intent_id"], "desktop.tidy.preview")
             self.assertEqual(obj["params"]["config_path"], str(cfg_path))
             self.assertEqual(obj["context"]["source"], "alfred")
@@ -1516,8 +1118,7 @@ class TestNucCli(unittest.TestCase):
     def test_init_scaffolds_app_dir_non_interactive(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
-            buf = io.StringIO()
-            with redirect_stdout(buf):
+            with redirect_stdout(_SINK):
                 rc = nuc_main(
                     [
                         "init",
@@ -1541,7 +1142,7 @@ class TestNucCli(unittest.TestCase):
         with tempfile.TemporaryDirectory() as td:
             td_path = Path(td)
             tr = td_path / "t.txt"
-            tr.write_text("see /workspaces/nucleus/README.md\n$ python -m unittest -q\n", encoding="utf-8")
+            tr.write_bytes(b"see /workspaces/nucleus/README.md\n$ python -m unittest -q\n")
 
             buf = io.StringIO()
             with redirect_stdout(buf):
@@ -1590,7 +1191,7 @@ class TestNucCli(unittest.TestCase):
                 ]
             )
         self.assertEqual(rc, 0)
-        obj = json.loads(buf.getvalue())
+        obj = _parse_stdout_json(buf)
         self.assertIn("intent_id", obj)
 
     def test_intake_prints_error_data_payload_when_present(self) -> None:
@@ -0,0 +1,29 @@
+import json
+import unittest
+
+from nucleus import _json
+
+
+class TestJsonHelpers(unittest.TestCase):
+    def test_dumps_is_compact_utf8_and_round_trips(self) -> None:
+        obj = {"event_type": "step_finished", "message": "café → デスク", "data": {"n": [1, 2.5, None, True]}}
+        out = _json.dumps(obj)
+        self.assertIsInstance(out, bytes)
+        self.assertNotIn(b"\\u", out)
+        self.assertNotIn(b", ", out)
+        self.assertEqual(json.loads(out.decode("utf-8")), obj)
+        self.assertEqual(_json.loads(out), obj)
+        self.assertEqual(_json.loads(out.decode("utf-8")), obj)
+
+    def test_dumps_accepts_values_outside_the_fast_path(self) -> None:
+        # Non-str keys and big ints are rejected by orjson; both backends must still serialize them like stdlib json.
+        obj = {1: "a", "big": 2**70}
+        self.assertEqual(json.loads(_json.dumps(obj)), {"1": "a", "big": 2**70})
+
+    def test_loads_raises_value_error_on_invalid_input(self) -> None:
+        with self.assertRaises(ValueError):
+            _json.loads(b"{not json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from nucleus.core.errors import ValidationError
+from nucleus.registry.plugin_registry import PluginManifest, PluginRegistry, _compiled_plugin_manifest_validator, _schemas_fingerprint
+from nucleus.resources import core_contracts_schemas_dir, plugins_dir
+
+
+class TestPluginRegistryDiscoveryCache(unittest.TestCase):
+    def test_cache_is_written_reused_and_invalidated(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            pdir = Path(td) / "plugins"
+            shutil.copytree(plugins_dir(), pdir)
+            cache_path = Path(td) / "cache" / "plugin_index.json"
+
+            r1 = PluginRegistry()
+            r1.load_from_dir(pdir, cache_path=cache_path)
+            self.assertTrue(cache_path.exists())
+            doc = json.loads(cache_path.read_text(encoding="utf-8"))
+            self.assertIn(str(pdir.resolve()), doc["entries"])
+
+            # A cache hit must not read manifests: make one unreadable as JSON while keeping its stat() identical.
+            manifest_path = next(iter(sorted(pdir.glob("*/manifest.json"))))
+            original = manifest_path.read_bytes()
+            st = manifest_path.stat()
+            manifest_path.write_bytes(b"{" + b" " * (len(original) - 1))
+            os.utime(manifest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+            r2 = PluginRegistry()
+            r2.load_from_dir(pdir, cache_path=cache_path)
+            self.assertEqual(r2.list_intents(), r1.list_intents())
+            self.assertEqual(r2.list_manifests(), r1.list_manifests())
+
+            # force=True bypasses the cache and re-reads manifests from disk.
+            with self.assertRaises(ValueError):
+                PluginRegistry().load_from_dir(pdir, cache_path=cache_path, force=True)
+
+            # Any mtime/size change invalidates the cached entry.
+            manifest_path.write_bytes(original + b"\n")
+            r3 = PluginRegistry()
+            r3.load_from_dir(pdir, cache_path=cache_path)
+            self.assertEqual(r3.list_intents(), r1.list_intents())
+
+    def test_cache_drops_missing_dirs_and_keeps_most_recent_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache_path = Path(td) / "plugin_index.json"
+            dirs = []
+            for name in ("a", "b", "c", "d"):
+                pdir = Path(td) / name
+                shutil.copytree(plugins_dir(), pdir)
+                dirs.append(str(pdir.resolve()))
+
+            def cached_dirs() -> list:
+                return list(json.loads(cache_path.read_text(encoding="utf-8"))["entries"])
+
+            with patch("nucleus.registry.plugin_registry._DISCOVERY_CACHE_MAX_ENTRIES", 3):
+                for d in dirs[:3]:
+                    PluginRegistry().load_from_dir(Path(d), cache_path=cache_path)
+                self.assertEqual(cached_dirs(), dirs[:3])
+
+                # Over the cap: the least recently written entry is evicted.
+                PluginRegistry().load_from_dir(Path(dirs[3]), cache_path=cache_path)
+                self.assertEqual(cached_dirs(), dirs[1:])
+
+                # Rewriting an entry makes it the most recent; entries for removed dirs are dropped.
+                shutil.rmtree(dirs[2])
+                PluginRegistry().load_from_dir(Path(dirs[1]), cache_path=cache_path, force=True)
+                self.assertEqual(cached_dirs(), [dirs[3], dirs[1]])
+
+    def test_manifest_validator_recompiles_when_schema_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            schemas = Path(td) / "schemas"
+            shutil.copytree(core_contracts_schemas_dir(), schemas)
+            schema_path = schemas / "plugin_manifest.schema.json"
+            schema = json.loads(schema_path.read_text(encoding="utf-8"))
+            manifest = {"plugin_id": "p", "intents": [], "version": "0.1.0"}
+
+            v1 = _compiled_plugin_manifest_validator(str(schemas), _schemas_fingerprint(schemas))
+            before = list(v1.iter_errors(manifest))
+
+            # $refs to sibling schemas resolve through the contract store's registry.
+            schema.setdefault("required", []).append("x_required_by_test")
+            schema.setdefault("properties", {})["x_required_by_test"] = {"$ref": "defs.schema.json#/$defs/Scope"}
+            schema_path.write_text(json.dumps(schema), encoding="utf-8")
+            st = schema_path.stat()
+            os.utime(schema_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+            v2 = _compiled_plugin_manifest_validator(str(schemas), _schemas_fingerprint(schemas))
+            self.assertIsNot(v2, v1)
+            after = [e.message for e in v2.iter_errors(manifest)]
+            self.assertEqual(len(after), len(before) + 1)
+            self.assertTrue(any("x_required_by_test" in m for m in after))
+            self.assertEqual(len(list(v2.iter_errors({**manifest, "x_required_by_test": {"fs_roots": ["/tmp"]}}))), len(before))
+            self.assertEqual(len(list(v2.iter_errors({**manifest, "x_required_by_test": "not a scope"}))), len(before) + 1)
+
+    def test_malformed_manifest_is_rejected(self) -> None:
+        for raw in ([], {"plugin_id": 1, "intents": []}, {"plugin_id": "p"}, {"plugin_id": "p", "intents": [], "version": "0.1.0"}):
+            with self.subTest(raw=raw), tempfile.TemporaryDirectory() as td:
+                (Path(td) / "p").mkdir()
+                (Path(td) / "p" / "manifest.json").write_text(json.dumps(raw), encoding="utf-8")
+                with self.assertRaises(ValidationError) as ctx:
+                    PluginRegistry().load_from_dir(Path(td))
+                self.assertEqual(ctx.exception.code, "plugin_manifest.invalid")
+                self.assertTrue(ctx.exception.data["errors"])
+
+    def test_corrupt_cache_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            cache_path = Path(td) / "plugin_index.json"
+            cache_path.write_text("not json", encoding="utf-8")
+
+            reg = PluginRegistry()
+            reg.load_from_dir(plugins_dir(), cache_path=cache_path)
+            self.assertTrue(reg.list_intents())
+            self.assertEqual(json.loads(cache_path.read_text(encoding="utf-8"))["version"], 1)
+
+
+class TestPluginRegistryIntentNamespaces(unittest.TestCase):
+    def test_list_intents_under_matches_whole_segments(self) -> None:
+        reg = PluginRegistry()
+        reg._register(
+            [
+                PluginManifest(raw={"plugin_id": "a", "intents": [{"intent_id": "desktop"}, {"intent_id": "desktop.tidy.run"}]}),
+                PluginManifest(raw={"plugin_id": "b", "intents": [{"intent_id": "desktop.tidy"}, {"intent_id": "desktops.x"}]}),
+            ]
+        )
+
+        self.assertEqual(
+            [it["intent_id"] for it in reg.list_intents_under("desktop")], ["desktop", "desktop.tidy", "desktop.tidy.run"]
+        )
+        self.assertEqual(
+            reg.list_intents_under("desktop."),
+            [{"intent_id": "desktop.tidy", "plugin_id": "b"}, {"intent_id": "desktop.tidy.run", "plugin_id": "a"}],
+        )
+        self.assertEqual([it["intent_id"] for it in reg.list_intents_under("desktop.tidy.")], ["desktop.tidy.run"])
+        self.assertEqual(reg.list_intents_under("desk"), [])
+        self.assertEqual(reg.list_intents_under(""), reg.list_intents())
+
+    def test_sorted_listings_refresh_after_register(self) -> None:
+        reg = PluginRegistry()
+        reg._register([PluginManifest(raw={"plugin_id": "b", "intents": [{"intent_id": "b.x"}]})])
+        self.assertEqual([m["plugin_id"] for m in reg.list_manifests()], ["b"])
+        self.assertEqual([it["intent_id"] for it in reg.list_intents()], ["b.x"])
+
+        reg._register([PluginManifest(raw={"plugin_id": "a", "intents": [{"intent_id": "a.x"}]})])
+        self.assertEqual([m["plugin_id"] for m in reg.list_manifests()], ["a", "b"])
+        self.assertEqual([it["intent_id"] for it in reg.list_intents()], ["a.x", "b.x"])
+
+
+class TestPluginManifest(unittest.TestCase):
+    def test_derived_fields_are_precomputed(self) -> None:
+        m = PluginManifest(raw={"plugin_id": "p", "intents": [{"intent_id": "a.b"}, {"intent_id": 3}, "junk"]})
+        self.assertEqual(m.plugin_id, "p")
+        self.assertEqual(len(m.intents), 3)
+        self.assertEqual(m.intent_ids, frozenset({"a.b"}))
+        self.assertTrue(m.declares_intent("a.b"))
+        self.assertFalse(m.declares_intent("a"))
+        self.assertEqual(m, PluginManifest(raw=dict(m.raw)))
+
+        bare = PluginManifest(raw={})
+        self.assertEqual(bare.intents, [])
+        self.assertFalse(bare.declares_intent("a.b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,16 @@
+import io
 import json
 import tempfile
+import threading
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime, timezone
 from pathlib import Path
 
 from nucleus.bootstrap_tools import build_tool_registry
 from nucleus.core.kernel import Kernel
 from nucleus.core.runtime_context import RuntimeContext
+from nucleus.trace import Replay, TraceEmitter, TraceStoreJSONL, set_sink
 
 
 class TestNucleusSafetyAndTrace(unittest.TestCase):
@@ -146,6 +151,88 @@ class TestNucleusSafetyAndTrace(unittest.TestCase):
             self.assertIn("intent_received", event_types)
             self.assertIn("error", event_types)
 
+    def test_trace_store_keeps_file_open_and_reopens_in_append_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            trace_path = Path(td) / "nested" / "trace.jsonl"
+            with TraceStoreJSONL(trace_path) as store:
+                store.append({"event_type": "a", "message": "h\u00e9"})
+                store.append({"event_type": "b"})
+                # Unbuffered: events are visible to readers as soon as append() returns.
+                self.assertEqual([e["event_type"] for e in Replay(trace_path).iter_events()], ["a", "b"])
+
+            store = TraceStoreJSONL(trace_path)
+            store.append({"event_type": "c"})
+            store.close()
+            store.close()
+            events = list(Replay(trace_path).iter_events())
+            self.assertEqual([e["event_type"] for e in events], ["a", "b", "c"])
+            self.assertEqual(events[0]["message"], "h\u00e9")
+
+    def test_trace_store_concurrent_appends_keep_lines_intact(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            trace_path = Path(td) / "trace.jsonl"
+            store = TraceStoreJSONL(trace_path)
+
+            def worker(n: int) -> None:
+                for i in range(200):
+                    # Every 50th event exceeds the single-write threshold and goes through the locked path.
+                    store.append({"event_type": "step_finished", "step_id": f"{n}-{i}", "message": "x" * (5000 if i % 50 == 0 else 10)})
+
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            store.close()
+
+            events = list(Replay(trace_path).iter_events())
+            self.assertEqual(len(events), 800)
+            self.assertEqual(len({e["step_id"] for e in events}), 800)
+
+    def test_trace_store_on_dash_uses_sink_else_stderr(self) -> None:
+        events: list = []
+        set_sink(events.append)
+        self.addCleanup(set_sink, None)
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            TraceStoreJSONL(Path("-")).append({"event_type": "a"})
+        self.assertEqual(events, [{"event_type": "a"}])
+        self.assertEqual(err.getvalue(), "")
+
+        # With no sink installed the events are written to stderr as JSONL, never dropped, and stdout stays clean.
+        set_sink(None)
+        with redirect_stdout(out), redirect_stderr(err):
+            store = TraceStoreJSONL(Path("-"))
+            store.append({"event_type": "b", "message": "h\u00e9"})
+            store.append({"event_type": "c"})
+        self.assertEqual([json.loads(line) for line in err.getvalue().splitlines()], [{"event_type": "b", "message": "h\u00e9"}, {"event_type": "c"}])
+        self.assertEqual(out.getvalue(), "")
+        self.assertEqual(events, [{"event_type": "a"}])
+        self.assertFalse(Path("-").exists())
+
+    def test_trace_emitter_omits_unset_fields_and_formats_utc_ts(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            trace_path = Path(td) / "trace.jsonl"
+            with TraceStoreJSONL(trace_path) as store:
+                TraceEmitter(store=store, run_id="r1").emit("step_started", step_id="s1", data={"k": 1})
+
+            (event,) = list(Replay(trace_path).iter_events())
+            self.assertEqual(list(event.keys()), ["ts", "run_id", "event_type", "step_id", "data"])
+            self.assertRegex(event["ts"], r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z$")
+            ts = datetime.fromisoformat(event["ts"].replace("Z", "+00:00"))
+            self.assertLess(abs((datetime.now(timezone.utc) - ts).total_seconds()), 60)
+
+
+    def test_replay_skips_blank_lines_and_tolerates_missing_file(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            trace_path = Path(td) / "trace.jsonl"
+            missing = Replay(trace_path).iter_events()
+            self.assertEqual(list(missing), [])
+            self.assertTrue(hasattr(missing, "__next__"))
+
+            trace_path.write_bytes(b'{"event_type": "a"}\n\n  \r\n{"event_type": "b"}\r\n{"event_type": "c"}')
+            self.assertEqual([e["event_type"] for e in Replay(trace_path).iter_events()], ["a", "b", "c"])
+
 
 if __name__ == "__main__":
     unittest.main()
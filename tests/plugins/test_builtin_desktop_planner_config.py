@@ -1,10 +1,11 @@
+import json
 import os
 import tempfile
 import time
 import unittest
 from pathlib import Path
 
-from plugins.builtin_desktop.planner import BuiltinDesktopPlanner
+from plugins.builtin_desktop.planner import BuiltinDesktopPlanner, _expand, _ext_fastpath, _rules_validator, get_planner
 from nucleus.core.errors import ValidationError
 
 
@@ -99,6 +100,362 @@ class TestBuiltinDesktopPlannerConfig(unittest.TestCase):
             self.assertIn(f"{downloads}/misc.bin", tos)
             self.assertIn(f"{staging}/ToDelete/a.tmp", tos)
 
+            # Trusted fast path (already contract-validated intent) yields the same plan.
+            self.assertEqual(planner.plan_validated(intent), plan)
+            with self.assertRaises(ValidationError) as ctx:
+                planner.plan_validated({"params": {}, "scope": {}})
+            self.assertEqual(ctx.exception.code, "intent.invalid")
+
+    def test_tidy_preview_matches_mime_prefix_by_extension(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td) / "Desktop"
+            staging = Path(td) / "Desktop_Aux"
+            pics = Path(td) / "Pictures"
+            media = Path(td) / "Media"
+            misc = Path(td) / "Misc"
+            root.mkdir(parents=True)
+
+            cfg_path = Path(td) / "desktop_rules.yml"
+            cfg_path.write_text(
+                "\n".join(
+                    [
+                        'version: "0.1"',
+                        'plugin: "builtin.desktop"',
+                        "",
+                        "root:",
+                        f'  path: "{root}"',
+                        f'  staging_dir: "{staging}"',
+                        "",
+                        "folders:",
+                        f'  images: "{pics}"',
+                        f'  media: "{media}"',
+                        f'  misc: "{misc}"',
+                        "",
+                        "rules:",
+                        '  - id: "r_images"',
+                        "    match:",
+                        "      any:",
+                        '        - mime_prefix: "image/"',
+                        "    action:",
+                        '      move_to: "images"',
+                        '  - id: "r_media"',
+                        "    match:",
+                        "      any:",
+                        '        - mime_prefix: "video/"',
+                        '        - mime_prefix: "audio/"',
+                        "    action:",
+                        '      move_to: "media"',
+                        "",
+                        "defaults:",
+                        "  unmatched_action:",
+                        '    move_to: "misc"',
+                        "",
+                    ]
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+
+            planner = BuiltinDesktopPlanner()
+            names = ["Shot.PNG", "clip.mov", "song.flac", "notes.txt", "noext"]
+            intent = {
+                "intent_id": "desktop.tidy.preview",
+                "params": {"config_path": str(cfg_path), "entries": [{"name": n, "is_file": True, "is_dir": False, "mtime": 0} for n in names]},
+                "scope": {"fs_roots": [str(root), str(staging), str(pics), str(media), str(misc)], "allow_network": False},
+                "context": {"source": "test"},
+            }
+
+            plan = planner.plan(intent)
+            tos = {s["tool"]["args"]["to"] for s in plan["steps"] if s.get("tool", {}).get("tool_id") == "fs.move"}
+            self.assertEqual(
+                tos,
+                {f"{pics}/Shot.PNG", f"{media}/clip.mov", f"{media}/song.flac", f"{misc}/notes.txt", f"{misc}/noext"},
+            )
+
+    def test_tidy_preview_skips_exclude_and_ignore_patterns(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td) / "Desktop"
+            staging = Path(td) / "Desktop_Aux"
+            misc = Path(td) / "Misc"
+            root.mkdir(parents=True)
+
+            cfg_path = Path(td) / "desktop_rules.yml"
+            cfg_path.write_text(
+                "\n".join(
+                    [
+                        'version: "0.1"',
+                        'plugin: "builtin.desktop"',
+                        "",
+                        "root:",
+                        f'  path: "{root}"',
+                        f'  staging_dir: "{staging}"',
+                        "",
+                        "folders:",
+                        f'  misc: "{misc}"',
+                        "",
+                        "rules:",
+                        '  - id: "r_any"',
+                        "    match:",
+                        "      any:",
+                        '        - ext_in: ["txt"]',
+                        "    action:",
+                        '      move_to: "misc"',
+                        "",
+                        "safety:",
+                        '  ignore_patterns: ["*.part", "Thumbs.db"]',
+                        "",
+                    ]
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+
+            planner = BuiltinDesktopPlanner()
+            names = ["keep.txt", "a.part", "Thumbs.db", "thumbs.db", "draft[1].txt", "draft1.txt", ".hidden.txt", "x.TMP", "y.tmp"]
+            intent = {
+                "intent_id": "desktop.tidy.preview",
+                "params": {
+                    "config_path": str(cfg_path),
+                    "exclude": ["*.tmp", "draft[[]1].txt"],
+                    "entries": [{"name": n, "is_file": True, "is_dir": False, "mtime": 0} for n in names],
+                },
+                "scope": {"fs_roots": [str(root), str(staging), str(misc)], "allow_network": False},
+                "context": {"source": "test"},
+            }
+
+            plan = planner.plan(intent)
+            moved = sorted(s["tool"]["args"]["from"].rsplit("/", 1)[-1] for s in plan["steps"] if s.get("tool", {}).get("tool_id") == "fs.move")
+            # Matching is case-sensitive (fnmatchcase semantics); dotfiles are always skipped.
+            self.assertEqual(moved, ["draft1.txt", "keep.txt", "thumbs.db", "x.TMP"])
+
+    def test_tidy_restore_skips_exclude_patterns_and_dotfiles(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td) / "Desktop"
+            staging = Path(td) / "Desktop_Aux"
+            root.mkdir(parents=True)
+
+            cfg_path = Path(td) / "desktop_rules.yml"
+            cfg_path.write_text(
+                "\n".join(
+                    [
+                        'version: "0.1"',
+                        'plugin: "builtin.desktop"',
+                        "",
+                        "root:",
+                        f'  path: "{root}"',
+                        f'  staging_dir: "{staging}"',
+                        "",
+                        "folders:",
+                        f'  misc: "{staging}/Misc"',
+                        "",
+                        "rules: []",
+                        "",
+                    ]
+                )
+                + "\n",
+                encoding="utf-8",
+            )
+
+            paths = ["Misc/b.txt", "Misc/a.tmp", "Images/.DS_Store", "Images/a.png", "a.txt"]
+            intent = {
+                "intent_id": "desktop.tidy.restore",
+                "params": {
+                    "config_path": str(cfg_path),
+                    "exclude": ["*.tmp"],
+                    "sorted_entries": [{"path": p, "is_file": True} for p in paths] + [{"path": "Images", "is_file": False}],
+                },
+                "scope": {"fs_roots": [str(root), str(staging)], "allow_network": False},
+                "context": {"source": "test"},
+            }
+
+            # desktop.tidy.restore is not dispatched by plan() yet; exercise the config-driven builder directly.
+            for _ in range(2):  # The second plan reuses the compiled exclude regex.
+                plan = BuiltinDesktopPlanner()._plan_restore_from_config(intent)
+                moves = [
+                    (s["step_id"], s["tool"]["args"]["from"], s["tool"]["args"]["to"])
+                    for s in plan["steps"]
+                    if s.get("tool", {}).get("tool_id") == "fs.move"
+                ]
+                # Step ids number the path-sorted files, so skipped entries leave gaps.
+                self.assertEqual(
+                    moves,
+                    [
+                        ("commit_restore_0002", f"{staging}/Images/a.png", f"{root}/a.png"),
+                        ("commit_restore_0004", f"{staging}/Misc/b.txt", f"{root}/b.txt"),
+                        ("commit_restore_0005", f"{staging}/a.txt", f"{root}/a.txt"),
+                    ],
+                )
+
+    def test_rules_config_is_memoized_until_the_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td) / "Desktop"
+            staging = Path(td) / "Desktop_Aux"
+            docs = Path(td) / "Documents"
+            root.mkdir(parents=True)
+
+            def write_cfg(ext: str) -> None:
+                cfg_path.write_text(
+                    "\n".join(
+                        [
+                            'version: "0.1"',
+                            'plugin: "builtin.desktop"',
+                            "root:",
+                            f'  path: "{root}"',
+                            f'  staging_dir: "{staging}"',
+                            "folders:",
+                            f'  documents: "{docs}"',
+                            "rules:",
+                            '  - id: "r_docs"',
+                            "    match:",
+                            "      any:",
+                            f'        - ext_in: ["{ext}"]',
+                            "    action:",
+                            "      delete: true",
+                            "",
+                        ]
+                    ),
+                    encoding="utf-8",
+                )
+
+            cfg_path = Path(td) / "desktop_rules.yml"
+            write_cfg("txt")
+            planner = BuiltinDesktopPlanner()
+
+            cfg1 = planner._load_rules_config(str(cfg_path))
+            validator_calls = _rules_validator.cache_info()
+            # Callers get their own copy: mutating one result does not leak into later loads.
+            cfg1["rules"][0]["match"]["any"][0]["ext_in"].append("mutated")
+            again = planner._load_rules_config(str(cfg_path))
+            self.assertIsNot(again, cfg1)
+            self.assertEqual(again["rules"][0]["match"]["any"][0]["ext_in"], ["txt"])
+            self.assertEqual(BuiltinDesktopPlanner()._load_rules_config(str(cfg_path)), again)
+            # Cache hits skip YAML parsing and schema validation entirely.
+            self.assertEqual(_rules_validator.cache_info(), validator_calls)
+
+            write_cfg("markdown")
+            cfg2 = planner._load_rules_config(str(cfg_path))
+            self.assertIsNot(cfg2, cfg1)
+            self.assertEqual(cfg2["rules"][0]["match"]["any"][0]["ext_in"], ["markdown"])
+
+            cfg_path.unlink()
+            with self.assertRaises(ValidationError) as ctx:
+                planner._load_rules_config(str(cfg_path))
+            self.assertEqual(ctx.exception.code, "config.not_found")
+
+    def test_tidy_preview_rule_atoms_regex_age_and_all(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td) / "Desktop"
+            staging = Path(td) / "Desktop_Aux"
+            shots = Path(td) / "Shots"
+            recent = Path(td) / "Recent"
+            misc = Path(td) / "Misc"
+            root.mkdir(parents=True)
+
+            cfg_path = Path(td) / "desktop_rules.yml"
+            cfg_path.write_text(
+                "\n".join(
+                    [
+                        'version: "0.1"',
+                        'plugin: "builtin.desktop"',
+                        "root:",
+                        f'  path: "{root}"',
+                        f'  staging_dir: "{staging}"',
+                        "folders:",
+                        f'  shots: "{shots}"',
+                        f'  recent: "{recent}"',
+                        f'  misc: "{misc}"',
+                        "rules:",
+                        '  - id: "r_shots"',
+                        "    match:",
+                        "      all:",
+                        '        - filename_regex: "^Screen Shot "',
+                        '        - ext_in: [".PNG"]',
+                        "    action:",
+                        '      move_to: "shots"',
+                        '  - id: "r_recent"',
+                        "    match:",
+                        "      any:",
+                        "        - created_within_days: 7",
+                        "    action:",
+                        '      move_to: "recent"',
+                        "defaults:",
+                        "  unmatched_action:",
+                        '    move_to: "misc"',
+                        "",
+                    ]
+                ),
+                encoding="utf-8",
+            )
+
+            now = int(time.time())
+            old = now - 30 * 86400
+            entries = [
+                {"name": "Screen Shot 1.png", "is_file": True, "is_dir": False, "mtime": old},
+                {"name": "Screen Shot 2.jpg", "is_file": True, "is_dir": False, "mtime": old},
+                {"name": "fresh.bin", "is_file": True, "is_dir": False, "mtime": now},
+                {"name": "stale.bin", "is_file": True, "is_dir": False, "mtime": old},
+            ]
+            intent = {
+                "intent_id": "desktop.tidy.preview",
+                "params": {"config_path": str(cfg_path), "entries": entries},
+                "scope": {"fs_roots": [str(root), str(staging), str(shots), str(recent), str(misc)], "allow_network": False},
+                "context": {"source": "test"},
+            }
+
+            plan = BuiltinDesktopPlanner().plan(intent)
+            tos = sorted(s["tool"]["args"]["to"] for s in plan["steps"] if s.get("tool", {}).get("tool_id") == "fs.move")
+            self.assertEqual(
+                tos,
+                sorted([f"{shots}/Screen Shot 1.png", f"{misc}/Screen Shot 2.jpg", f"{recent}/fresh.bin", f"{misc}/stale.bin"]),
+            )
+
+            # An invalid filename_regex is reported once, at rule compile time, instead of silently never matching.
+            text = cfg_path.read_text(encoding="utf-8")
+            cfg_path.write_text(text.replace('filename_regex: "^Screen Shot "', 'filename_regex: "(Screen"'), encoding="utf-8")
+            with self.assertRaises(ValidationError) as ctx:
+                BuiltinDesktopPlanner().plan(intent)
+            self.assertEqual(ctx.exception.code, "config.invalid")
+            self.assertEqual(ctx.exception.data["rule_id"], "r_shots")
+
+            # Rules are only compiled when some entry is eligible: a directory-only snapshot plans no moves.
+            intent["params"]["entries"] = [{"name": "Projects", "is_file": False, "is_dir": True, "mtime": old}]
+            plan = BuiltinDesktopPlanner().plan(intent)
+            self.assertFalse([s for s in plan["steps"] if s.get("tool", {}).get("tool_id") == "fs.move"])
+
+    def test_ext_fastpath_indexes_only_the_leading_extension_rules(self) -> None:
+        r_img = {"id": "img", "match": {"any": [{"ext_in": ["PNG", ".jpg"]}]}}
+        r_doc = {"id": "doc", "match": {"any": [{"ext_in": ["pdf", "png"]}]}}
+        r_shot = {"id": "shot", "match": {"any": [{"filename_regex": "^Screen"}]}}
+        r_txt = {"id": "txt", "match": {"any": [{"ext_in": ["txt"]}]}}
+
+        index, n = _ext_fastpath([r_img, r_doc, r_shot, r_txt])
+        self.assertEqual(n, 2)
+        self.assertIs(index["png"], r_img)  # first rule listing an extension wins
+        self.assertIs(index["jpg"], r_img)
+        self.assertIs(index["pdf"], r_doc)
+        # Rules after a non-extension rule are not indexed (the regex rule must get the first chance).
+        self.assertNotIn("txt", index)
+
+        self.assertEqual(_ext_fastpath([{"id": "x", "match": {"any": [{"ext_in": ["a"]}], "all": [{"ext_in": ["a"]}]}}]), ({}, 0))
+
+    def test_get_planner_returns_a_shared_instance(self) -> None:
+        self.assertIsInstance(get_planner(), BuiltinDesktopPlanner)
+        self.assertIs(get_planner(), get_planner())
+
+    def test_expand_is_memoized_per_home(self) -> None:
+        self.assertEqual(_expand("/abs/path"), "/abs/path")
+        old_home = os.environ.get("HOME")
+        try:
+            os.environ["HOME"] = "/home/a"
+            self.assertEqual(_expand("~/Desktop"), "/home/a/Desktop")
+            os.environ["HOME"] = "/home/b"
+            self.assertEqual(_expand("~/Desktop"), "/home/b/Desktop")
+        finally:
+            if old_home is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = old_home
+
     def test_tidy_preview_scope_check_expands_user_paths(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             old_home = os.environ.get("HOME")
@@ -246,3 +603,19 @@ class TestBuiltinDesktopPlannerConfig(unittest.TestCase):
                 planner.plan(intent)
             self.assertIn(ctx.exception.code, ("config.schema_invalid", "config.invalid"))
 
+            # Absolute paths that climb out of the root via ".." are rejected too, not just relative ones.
+            text = cfg_path.read_text(encoding="utf-8")
+            cfg_path.write_text(text.replace('bad: "../escape"', f'bad: "{root}/../../escape"'), encoding="utf-8")
+            with self.assertRaises(ValidationError) as ctx:
+                planner.plan(intent)
+            self.assertEqual(ctx.exception.code, "config.invalid")
+            self.assertEqual(ctx.exception.data["move_to"], "bad")
+
+            # A destination outside scope reports fs_roots as a JSON-serializable list.
+            cfg_path.write_text(text.replace('bad: "../escape"', f'bad: "{Path(td) / "Elsewhere"}"'), encoding="utf-8")
+            with self.assertRaises(ValidationError) as ctx:
+                planner.plan(intent)
+            self.assertEqual(ctx.exception.code, "scope.invalid")
+            self.assertEqual(ctx.exception.data["fs_roots"], sorted([str(root), str(staging)]))
+            json.dumps(ctx.exception.data)
+
@@ -1,4 +1,8 @@
+import subprocess
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 
 class TestChangePolicy(unittest.TestCase):
@@ -76,6 +80,44 @@ class TestChangePolicy(unittest.TestCase):
         self.assertIn("reason", msg.lower())
 
 
+class TestChangedFilesCache(unittest.TestCase):
+    def test_git_diff_runs_once_per_ref_pair(self) -> None:
+        from scripts import check_change_policy as mod
+
+        done = subprocess.CompletedProcess(args=[], returncode=0, stdout="nucleus/x.py\ntests/test_x.py\n", stderr="")
+        with tempfile.TemporaryDirectory() as td:
+            (Path(td) / ".git").mkdir()
+            with patch.object(mod, "ROOT", Path(td)), patch.object(mod.subprocess, "run", return_value=done) as run:
+                mod._changed_files_cached.cache_clear()
+                self.assertEqual(mod._changed_files_cached("origin/main", "HEAD"), ("nucleus/x.py", "tests/test_x.py"))
+                self.assertEqual(mod._changed_files_cached("origin/main", "HEAD"), ("nucleus/x.py", "tests/test_x.py"))
+                self.assertEqual(run.call_count, 1)
+            # Nothing is persisted outside the process.
+            self.assertEqual(list((Path(td) / ".git").iterdir()), [])
+            mod._changed_files_cached.cache_clear()
+
+    def test_changed_work_tasks_are_read_and_deleted_ones_skipped(self) -> None:
+        from scripts import check_change_policy as mod
+
+        with tempfile.TemporaryDirectory() as td:
+            (Path(td) / "work" / "tasks").mkdir(parents=True)
+            (Path(td) / "work" / "tasks" / "T1.md").write_text("TestImpact: none\n", encoding="utf-8")
+            with patch.object(mod, "ROOT", Path(td)):
+                out = mod._read_changed_work_tasks_files(["work/tasks/T1.md", "work/tasks/gone.md", "nucleus/x.py"])
+        self.assertEqual(out, {"work/tasks/T1.md": "TestImpact: none\n"})
+
+    def test_pr_body_is_read_from_event_payload(self) -> None:
+        from scripts import check_change_policy as mod
+
+        with tempfile.TemporaryDirectory() as td:
+            event = Path(td) / "event.json"
+            event.write_bytes('{"pull_request": {"body": "Test-Impact: none \u2714"}}'.encode("utf-8"))
+            self.assertEqual(mod._read_pr_body_from_event(event), "Test-Impact: none \u2714")
+            event.write_text("{not json", encoding="utf-8")
+            self.assertIsNone(mod._read_pr_body_from_event(event))
+            self.assertIsNone(mod._read_pr_body_from_event(Path(td) / "missing.json"))
+
+
 if __name__ == "__main__":
     unittest.main()
 